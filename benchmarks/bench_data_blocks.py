@@ -0,0 +1,64 @@
+''' Created: 18/10/2026 '''
+
+# Compares list slice data blocks with PageBlocks views over synthetic Seek pages, timing
+# block extraction and validation and tracing the memory held by every page of blocks.
+# Usage: python -m benchmarks.bench_data_blocks [pages]
+
+# External Dependencies
+from typing import Callable, Iterable, List, Sequence
+import sys
+import time
+import tracemalloc
+
+# Internal Dependencies
+from benchmarks.synthetic_pages import pages_html
+from scraper_controller import extract_texts
+from utilities.data_block import DataBlock, PageBlocks
+from utilities.data_bounds import DataBounds
+from utilities.scraper_builder import ScraperBuilder, Scraper
+from utilities.settings import Settings
+
+def slice_blocks(texts: List[str], scraper: Scraper) -> List[List[str]]:
+    ''' Returns: Validated data blocks of a page as list slices of its texts. '''
+    blocks = []
+    for start_idx, end_idx in zip(*scraper.parsers.extract_data_bounds_batch(texts)):
+        block = texts[start_idx:end_idx]
+        scraper.validators.validate_data_block(block)
+        blocks.append(block)
+    return blocks
+
+def view_blocks(texts: List[str], scraper: Scraper) -> PageBlocks:
+    ''' Returns: Validated data blocks of a page as PageBlocks, as extract_data does. '''
+    data_bounds = DataBounds()
+    for start_idx, end_idx in zip(*scraper.parsers.extract_data_bounds_batch(texts)):
+        scraper.validators.validate_data_block(DataBlock(texts, start_idx, end_idx))
+        data_bounds.append(start_idx, end_idx)
+    return PageBlocks(texts, data_bounds)
+
+def extract_blocks(texts_list: Iterable[List[str]], scraper: Scraper, page_blocks: Callable) -> List[Sequence]:
+    ''' Returns: Data blocks of every page built by page_blocks. '''
+    return [page_blocks(texts, scraper) for texts in texts_list]
+
+def run(page_count: int):
+    scraper = ScraperBuilder.build('scrapers.Seek')
+    settings = Settings()
+    texts_list = [extract_texts(page_html, scraper, settings) for page_html in pages_html(page_count)]
+    methods = {'list slices': slice_blocks, 'PageBlocks views': view_blocks}
+    baseline, baseline_time = None, None
+    for name, page_blocks in methods.items():
+        start = time.perf_counter()
+        extract_blocks(texts_list, scraper, page_blocks)
+        elapsed = time.perf_counter() - start
+        # Traced over page texts copies, so views are charged for the texts they keep alive
+        tracemalloc.start()
+        pages_blocks = extract_blocks((list(texts) for texts in texts_list), scraper, page_blocks)
+        held_kb = tracemalloc.get_traced_memory()[0] / 1024
+        tracemalloc.stop()
+        blocks = [list(block) for blocks in pages_blocks for block in blocks]
+        if baseline is None:
+            baseline, baseline_time = blocks, elapsed
+        match = 'same blocks' if blocks == baseline else 'BLOCKS DIFFER'
+        print(f'{name:>16}: {len(blocks) / elapsed:10.1f} blocks/s  {baseline_time / elapsed:5.1f}x  held {held_kb:8.0f} KiB  {match}')
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,46 @@
+''' Created: 18/10/2026 '''
+
+# Measures cold import time of the launcher, controller, and scraper build in fresh
+# interpreters, and which heavy dependencies each pulls in before a browser is needed.
+# Usage: python -m benchmarks.bench_import_time [repeats]
+
+# External Dependencies
+import statistics
+import subprocess
+import sys
+
+# Statements timed in a fresh interpreter each repeat.
+TARGETS = {
+    'launcher': 'import launcher',
+    'scraper_controller': 'import scraper_controller',
+    'build Seek': "from utilities.scraper_builder import ScraperBuilder; ScraperBuilder.build('scrapers.Seek')",
+    'list scrapers': 'import scrapers; scrapers.discover_scrapers()',
+}
+# Dependencies that should only be imported once a browser, soup parse, HTTP fetch, or prompt is used.
+HEAVY_MODULES = ['selenium.webdriver', 'selenium.webdriver.remote.webdriver', 'webdriver_manager', 'bs4', 'requests', 'inquirer']
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(name for name in {heavy!r} if name in sys.modules))
+'''
+
+def time_import(statement: str) -> tuple[float, str]:
+    ''' Returns: Seconds statement took in a fresh interpreter, and heavy modules it imported. '''
+    result = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+                            capture_output=True, text=True, check=True)
+    seconds, _, heavy = result.stdout.strip().splitlines()[-1].partition(' ')
+    return float(seconds), heavy
+
+def run(repeats: int):
+    for name, statement in TARGETS.items():
+        samples, heavy = [], ''
+        for _ in range(repeats):
+            seconds, heavy = time_import(statement)
+            samples.append(seconds)
+        print(f'{name:>18}: {statistics.median(samples) * 1000:7.1f} ms median  heavy imports: {heavy or "none"}')
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,42 @@
+''' Created: 18/10/2026 '''
+
+# Compares page text extraction backends over synthetic Seek pages.
+# Usage: python -m benchmarks.bench_page_parse [pages]
+
+# External Dependencies
+from bs4 import BeautifulSoup
+import importlib.util
+import sys
+import time
+
+# Internal Dependencies
+from benchmarks.synthetic_pages import pages_html
+from scrapers.Seek import Parsers
+from utilities.text_extractors import TEXT_EXTRACTORS
+
+def soup_text(page_html: str, parsers: Parsers, features: str):
+    ''' Returns: Page texts through the BeautifulSoup path of extract_data. '''
+    return parsers.extract_page_text(BeautifulSoup(page_html, features))
+
+def run(page_count: int):
+    parsers = Parsers()
+    pages = pages_html(page_count)
+    backends = {'soup html.parser': lambda page: soup_text(page, parsers, 'html.parser')}
+    if importlib.util.find_spec('lxml') is not None:
+        backends['soup lxml'] = lambda page: soup_text(page, parsers, 'lxml')
+    for name, extractor in TEXT_EXTRACTORS.items():
+        if name == 'lxml' and 'soup lxml' not in backends:
+            continue
+        backends[name] = lambda page, extractor=extractor: extractor(page, parsers.text_tags)
+    baseline, baseline_time = None, None
+    for name, extract in backends.items():
+        start = time.perf_counter()
+        texts = [extract(page) for page in pages]
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline, baseline_time = texts, elapsed
+        match = 'same texts' if texts == baseline else 'TEXTS DIFFER'
+        print(f'{name:>18}: {page_count / elapsed:8.1f} pages/s  {baseline_time / elapsed:5.1f}x  {match}')
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
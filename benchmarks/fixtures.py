@@ -0,0 +1,34 @@
+''' Created: 18/10/2026 '''
+
+# Loads page HTML fixtures for offline benchmarks. Recorded pages are saved by
+# benchmarks/record_fixtures.py into benchmarks/fixtures/<scraper>/ as numbered
+# .html files, synthetic Seek pages are generated on demand.
+
+# External Dependencies
+from typing import List
+import os
+
+# Internal Dependencies
+from benchmarks.synthetic_pages import pages_html
+
+FIXTURE_DIRECTORY = 'benchmarks/fixtures/'
+
+def fixture_path(scraper_name: str) -> str:
+    ''' Returns: Directory recorded fixtures for scraper_name are saved in. '''
+    return f'{FIXTURE_DIRECTORY}{scraper_name}/'
+
+def load_recorded_pages(scraper_name: str) -> List[str]:
+    ''' Returns: Recorded page HTML fixtures for scraper_name in page order, if any. '''
+    directory = fixture_path(scraper_name)
+    if not os.path.isdir(directory):
+        return []
+    filenames = sorted(name for name in os.listdir(directory) if name.endswith('.html'))
+    pages = []
+    for filename in filenames:
+        with open(f'{directory}{filename}', 'r', encoding='utf-8') as file:
+            pages.append(file.read())
+    return pages
+
+def load_synthetic_pages(review_count: int, reviews_per_page: int = 10) -> List[str]:
+    ''' Returns: Synthetic Seek pages holding review_count reviews in total. '''
+    return pages_html(-(-review_count // reviews_per_page), reviews_per_page)
@@ -0,0 +1,44 @@
+''' Created: 18/10/2026 '''
+
+# Records live entry page HTML as offline benchmark fixtures using a scraper's Navigators.
+# Usage: python -m benchmarks.record_fixtures <config_file> [pages]
+
+# External Dependencies
+import os
+import sys
+
+# Internal Dependencies
+from benchmarks.fixtures import fixture_path
+from utilities.config_builder import Config
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.scraper_builder import ScraperBuilder
+from utilities.selenium_handler import BrowserManager
+from utilities.rate_limiter import RateLimiter
+from utilities.logger_formats import Log
+from utilities.settings import Settings
+
+def record(config_file: str, page_count: int):
+    ''' Purpose: Saves up to page_count pages of the first config entry as fixtures. '''
+    settings = Settings()
+    config = Config(config_file)
+    scraper = ScraperBuilder.build(f'scrapers.{config.scraper_name}')
+    entry_name, entry_url = next(iter(config.get_lines()))
+    directory = fixture_path(config.scraper_name)
+    os.makedirs(directory, exist_ok=True)
+    limiter = RateLimiter(settings)
+    with BrowserManager(language=scraper.parsers.browser_lang, settings=settings) as driver:
+        Log.status(f'Recording {entry_name} pages to {directory}')
+        driver.get(entry_url)
+        SE.handle_bad_nav(scraper.navigators.wait_for_entry, driver)
+        for page_idx in range(page_count):
+            with open(f'{directory}{page_idx:04d}.html', 'w', encoding='utf-8') as file:
+                file.write(driver.page_source)
+            if page_idx == page_count - 1 or not SE.handle_bad_nav(scraper.navigators.check_next_page, driver):
+                break
+            limiter.wait(entry_url)
+            SE.handle_bad_nav(scraper.navigators.grab_next_page, driver)
+            SE.handle_bad_nav(scraper.navigators.wait_for_page, driver)
+    Log.status(f'Recorded {page_idx + 1} pages')
+
+if __name__ == '__main__':
+    record(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,150 @@
+''' Created: 18/10/2026 '''
+
+# Replays page HTML fixtures through the scrape hot path offline, reporting throughput
+# and peak memory per stage. Recorded fixtures are used when present, otherwise
+# synthetic Seek pages. Save results and compare later runs to catch regressions.
+# Usage: python -m benchmarks.run_benchmarks [--reviews 10000] [--memory-pages 50] [--save out.json] [--baseline out.json]
+#        [--profile cprofile|sampling] [--profile-stages extract_data save_data] [--profile-output benchmarks/profile]
+
+# External Dependencies
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Internal Dependencies
+from benchmarks.fixtures import load_recorded_pages, load_synthetic_pages
+from scraper_controller import extract_texts, extract_data, save_data, get_schema
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.generic_validators import GenericValidators
+from utilities.data_bounds import DataBounds
+from utilities.output_writer import OutputWriter
+from utilities.profiler import StageProfiler
+from utilities.scraper_builder import ScraperBuilder, Scraper
+from utilities.logger_formats import Log
+from utilities.settings import Settings
+
+# Stages benchmarked by run, in order.
+BENCHMARK_STAGES = ['extract_texts', 'validators', 'extract_data', 'parse_data_block', 'save_data', 'end_to_end']
+
+def measure(func: Callable[[int], None], page_count: int, memory_pages: int) -> Dict[str, float]:
+    ''' Returns: Wall seconds of func over all pages, and its peak traced KiB over the first
+        memory_pages pages if memory_pages is set. Memory is traced in a separate smaller
+        call, as tracing slows allocation heavy stages many times over. '''
+    start = time.perf_counter()
+    func(page_count)
+    result = {'seconds': time.perf_counter() - start}
+    if memory_pages:
+        tracemalloc.start()
+        func(min(memory_pages, page_count))
+        result['peak_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return result
+
+def validate_blocks(texts_list: List[List[str]], scraper: Scraper, settings: Settings):
+    ''' Purpose: Runs the generic and scraper validators of extract_data over page texts. '''
+    for texts in texts_list:
+        data_bounds = DataBounds()
+        for start_idx, end_idx in zip(*scraper.parsers.extract_data_bounds_batch(texts)):
+            SE.handle_bad_data(GenericValidators.validate_data_bound, settings.DATA_STRICT, start_idx, end_idx, texts)
+            SE.handle_bad_data(GenericValidators.validate_for_overlap, settings.DATA_STRICT, data_bounds, start_idx, end_idx)
+            SE.handle_bad_data(scraper.validators.validate_data_block, settings.DATA_STRICT, scraper.parsers.extract_data_block(texts, start_idx, end_idx))
+            data_bounds.append(start_idx, end_idx)
+
+def save_pages(pages_blocks: List[List[List[str]]], scraper: Scraper, settings: Settings):
+    ''' Purpose: Streams every page of data_blocks through save_data to a temp output. '''
+    with tempfile.TemporaryDirectory() as directory:
+        settings.OUTPUT_DIRECTORY = f'{directory}/'
+        with OutputWriter('benchmark', settings, None, get_schema(scraper)) as writer:
+            for page_blocks in pages_blocks:
+                save_data(scraper, writer, 'Benchmark', 'https://example.com', page_blocks)
+
+def end_to_end(pages: List[str], scraper: Scraper, settings: Settings):
+    ''' Purpose: Runs extract_data then save_data over every page, as scrape_data does. '''
+    with tempfile.TemporaryDirectory() as directory:
+        settings.OUTPUT_DIRECTORY = f'{directory}/'
+        with OutputWriter('benchmark', settings, None, get_schema(scraper)) as writer:
+            for page_html in pages:
+                save_data(scraper, writer, 'Benchmark', 'https://example.com', extract_data(page_html, scraper, settings))
+
+def run(scraper_name: str, review_count: int, memory_pages: int, profiler: Optional[StageProfiler] = None) -> Dict[str, Dict[str, float]]:
+    ''' Returns: Benchmark results keyed by stage. Given a StageProfiler, the stages it selects
+        are profiled, so their throughput is not comparable to unprofiled results. '''
+    settings = Settings()
+    scraper = ScraperBuilder.build(f'scrapers.{scraper_name}')
+    pages = load_recorded_pages(scraper_name)
+    if pages:
+        Log.info(f'Using {len(pages)} recorded {scraper_name} fixture pages')
+    elif scraper_name == 'Seek':
+        pages = load_synthetic_pages(review_count)
+        Log.info(f'Using {len(pages)} synthetic pages of {review_count} reviews')
+    else:
+        raise FileNotFoundError(f'No recorded fixtures for {scraper_name}, run benchmarks.record_fixtures first.')
+    texts_list = [extract_texts(page_html, scraper, settings) for page_html in pages]
+    pages_blocks = [extract_data(page_html, scraper, settings) for page_html in pages]
+    page_count, row_count = len(pages), sum(map(len, pages_blocks))
+    # Parsers are given save_data's cleaned lists, so DataBlock views are copied before timing
+    parse_blocks = [[list(block) for block in page_blocks] for page_blocks in pages_blocks]
+    flatten = lambda n: [block for page_blocks in parse_blocks[:n] for block in page_blocks]
+    stages = {
+        'extract_texts': (lambda n: [extract_texts(page_html, scraper, settings) for page_html in pages[:n]], page_count, 'pages'),
+        'validators': (lambda n: validate_blocks(texts_list[:n], scraper, settings), row_count, 'rows'),
+        'extract_data': (lambda n: [extract_data(page_html, scraper, settings) for page_html in pages[:n]], page_count, 'pages'),
+        'parse_data_block': (lambda n: [scraper.parsers.parse_data_block(block) for block in flatten(n)], row_count, 'rows'),
+        'save_data': (lambda n: save_pages(pages_blocks[:n], scraper, settings), row_count, 'rows'),
+        'end_to_end': (lambda n: end_to_end(pages[:n], scraper, settings), row_count, 'rows'),
+    }
+    results = {}
+    for name, (func, items, unit) in stages.items():
+        if profiler is not None:
+            func = profiler.wrap(name, func)
+        result = measure(func, page_count, memory_pages)
+        result.update({'rate': items / result['seconds'], 'unit': f'{unit}/s'})
+        if name == 'end_to_end':
+            result['pages_rate'] = page_count / result['seconds']
+        results[name] = result
+        memory_text = f"  peak {result['peak_kb']:9.0f} KiB" if memory_pages else ''
+        Log.status(f"{name:>17}: {result['rate']:10.1f} {result['unit']:<7}{memory_text}")
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> bool:
+    ''' Returns: Boolean True if no stage throughput fell more than tolerance below baseline. '''
+    passed = True
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['rate'] / baseline[name]['rate'] - 1
+        if change < -tolerance:
+            Log.alert(f'{name} regressed {-change:.0%} against baseline')
+            passed = False
+        else:
+            Log.info(f'{name} {change:+.0%} against baseline')
+    return passed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the scrape hot path offline.')
+    parser.add_argument('--scraper', default='Seek', help='scraper whose fixtures and parsers to use')
+    parser.add_argument('--reviews', type=int, default=10000, help='synthetic review count without recorded fixtures')
+    parser.add_argument('--memory-pages', type=int, default=50, help='pages to trace peak memory over, 0 to skip')
+    parser.add_argument('--save', metavar='FILE', help='write results JSON to FILE')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against results JSON in FILE')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed fractional throughput drop')
+    parser.add_argument('--profile', choices=['cprofile', 'sampling'], help='profile stages, skipping memory tracing')
+    parser.add_argument('--profile-stages', nargs='+', default=BENCHMARK_STAGES, metavar='STAGE', help='stages to profile')
+    parser.add_argument('--profile-output', default='benchmarks/profile', metavar='BASE', help='profile artifact path without suffix')
+    args = parser.parse_args()
+    if args.profile:
+        with StageProfiler(args.profile, args.profile_stages, args.profile_output) as profiler:
+            results = run(args.scraper, args.reviews, 0, profiler)
+    else:
+        results = run(args.scraper, args.reviews, args.memory_pages)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            if not compare(results, json.load(file), args.tolerance):
+                sys.exit(1)
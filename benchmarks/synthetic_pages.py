@@ -0,0 +1,68 @@
+''' Created: 18/10/2026 '''
+
+# Builds synthetic Seek company review pages for offline benchmarks. Pages follow the
+# element layout scrapers/Seek.py expects, wrapped in the nested div, class, svg, and
+# script noise of a real page so parse costs are representative.
+
+# External Dependencies
+import random
+from typing import List
+
+RATING_LABELS = ['Benefits & perks', 'Career development', 'Work-life balance',
+                 'Working environment', 'Management', 'Diversity & equal opportunity']
+LOCATIONS = ['Melbourne VIC 3000', 'Sydney NSW', 'Brisbane, Queensland', 'Perth WA 6000',
+             'Adelaide SA', 'Hobart, Tasmania 7000', 'Darwin NT', 'Canberra ACT 2600']
+TENURES = ['Less than 1 year in the role, former employee', '1 to 2 years in the role, current employee',
+           '3 to 4 years in the role, former employee', 'More than 12 years in the role, current employee']
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December']
+WORDS = ('good team great pay hours flexible management poor support training career '
+         'store shift roster customers busy friendly culture staff leave benefits').split()
+
+def wrap(content: str, depth: int) -> str:
+    ''' Returns: content nested inside depth layers of classed divs. '''
+    for level in range(depth):
+        content = f'<div class="_1wkzzau0 a1msqi{level}m szurmz4">{content}</div>'
+    return content
+
+def rating(value: int) -> str:
+    ''' Returns: Star rating markup with the aria-label Seek.Parsers reads. '''
+    stars = ''.join('<svg viewBox="0 0 16 16"><path d="M8 0l2 5h6l-5 4 2 6-5-4-5 4 2-6-5-4h6z"></path></svg>' for _ in range(5))
+    return f'<div aria-label="{value} out of 5" role="img">{stars}</div>'
+
+def sentence(rng: random.Random, length: int) -> str:
+    ''' Returns: Random review prose of length words. '''
+    return ' '.join(rng.choice(WORDS) for _ in range(length)).capitalize() + '.'
+
+def review_html(idx: int) -> str:
+    ''' Returns: Markup for one review, being one Seek data block of 29 texts. '''
+    rng = random.Random(idx)
+    parts = [wrap(rating(rng.randint(1, 5)), 3)]
+    for label in RATING_LABELS:
+        parts.append(wrap(f'<span class="_1wkzzau0">{label}</span><span class="hidden">rated</span>{rating(rng.randint(1, 5))}', 2))
+    parts.append('<span class="badge">Verified review</span>')
+    parts.append(f'<span>{rng.choice(["Store Manager", "Team Member", "Analyst", "Nurse"])}</span>')
+    parts.append(f'<span>{rng.choice(MONTHS)} {rng.randint(2015, 2023)}</span>')
+    parts.append(f'<span>{rng.choice(LOCATIONS)}</span>')
+    parts.append(f'<span>{rng.choice(TENURES)}</span>')
+    parts.append(f'<h3 class="_1wkzzau0">{sentence(rng, 5)}</h3>')
+    parts.append(wrap('<span>The good things</span>', 1))
+    parts.append(wrap(f'<span>{sentence(rng, rng.randint(10, 60))}</span>', 1))
+    parts.append(wrap('<span>The challenges</span>', 1))
+    parts.append(wrap(f'<span>{sentence(rng, rng.randint(10, 60))}</span>', 1))
+    return wrap(''.join(wrap(part, 2) for part in parts), 4)
+
+def page_html(page_idx: int, reviews_per_page: int = 10) -> str:
+    ''' Returns: Full synthetic review page HTML for the given page index. '''
+    first = page_idx * reviews_per_page
+    reviews = ''.join(review_html(first + i) for i in range(reviews_per_page))
+    navigation = ''.join(f'<a href="/companies/x/reviews?page={i}"><span>{i}</span></a>' for i in range(1, 8))
+    script = '<script>window.SK_DL = ' + '{"k": "' + 'x' * 20000 + '"}' + ';</script>'
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Reviews</title>{script}</head>'
+            f'<body>{wrap("<h3>Company reviews</h3><span>Sort by</span>", 6)}{reviews}'
+            f'<nav>{navigation}<a aria-label="Next" tabindex="0">Next</a></nav>'
+            f'{wrap("<span>Footer</span><span>Privacy</span>", 6)}</body></html>')
+
+def pages_html(page_count: int, reviews_per_page: int = 10) -> List[str]:
+    ''' Returns: List of page_count synthetic review pages. '''
+    return [page_html(idx, reviews_per_page) for idx in range(page_count)]
@@ -1,15 +1,29 @@
 ''' Created: 13/09/2023 '''
 
 # External Dependencies
-import inquirer
+import argparse
 import re, os, sys
+import glob, json
+import sqlite3
+from contextlib import nullcontext
+from datetime import datetime
 
 # Internal Dependencies
-from scraper_controller import scrape_launch
+from scraper_controller import scrape_launch, enqueue_launch, work_launch, merge_launch, reparse_launch
 from utilities.logger_formats import Log
 from utilities.settings import Settings
+from utilities.checkpoint import Checkpoint
+from utilities.config_builder import Config
+from utilities.entry_sources import ENTRY_SOURCES
+from utilities.selenium_handler import BrowserPool
 from utilities.custom_exceptions import ScraperExceptions as SE
 
+# Process exit codes, so schedulers can tell a failed run from a bad invocation.
+EXIT_SUCCESS = 0
+EXIT_RUN_FAILED = 1
+EXIT_BAD_USAGE = 2
+EXIT_INTERRUPTED = 130
+
 def list_filenames(directory: str, exclude: list[str] = [], include_extensions: bool = False) -> list[str]:
     ''' Returns: A list of strings of filenames for a specified directory,
         if include_extensions is true filenames include the filetype. Pass
@@ -26,6 +40,7 @@ def prompt_filename(directory: str = None, prompt: str = None) -> str:
     ''' Returns: Filename str entered from user prompt. If user specifies
         a directory, this directory will be checked to ensure filename
         does not already exist, this check ignores filetypes. '''
+    import inquirer
     if prompt is None:
         prompt = 'Please enter a filename'
     while True:
@@ -59,6 +74,7 @@ def prompt_options(options: list[str], prompt: str = None) -> str:
         Pass in a prompt str to modify the prompt prompt user sees. '''
     if not options or not isinstance(options, list):
         raise ValueError("Options should be a non-empty list.")
+    import inquirer
     if prompt is None:
         prompt = 'Please select an option:'
     questions = [
@@ -70,24 +86,153 @@ def prompt_options(options: list[str], prompt: str = None) -> str:
     answer = inquirer.prompt(questions, raise_keyboard_interrupt=True)
     return answer['selection']
 
+def parse_arguments() -> argparse.Namespace:
+    ''' Returns: Parsed launcher command line arguments. '''
+    parser = argparse.ArgumentParser(description='Launch a PyScrapify scraper.')
+    parser.add_argument('--resume', metavar='OUTPUT_NAME', help='resume an interrupted run from its checkpoint')
+    parser.add_argument('--enqueue', metavar='CONFIG_FILE', help='add config entries to the shared job queue')
+    parser.add_argument('--job', metavar='JOB_NAME', help='job name for --enqueue, defaults to the config name')
+    parser.add_argument('--work', metavar='JOB_NAME', help='scrape queued entries of a job into per entry shards')
+    parser.add_argument('--merge', metavar='JOB_NAME', help='combine the shards of a finished job into one output')
+    parser.add_argument('--reparse', metavar='OUTPUT_NAME', help='re-parse the page archive of a run into a new output offline')
+    parser.add_argument('configs', nargs='*', metavar='CONFIG',
+                        help='config files or glob patterns in the config directory to run without prompts, in order')
+    parser.add_argument('--output', metavar='TEMPLATE',
+                        help='output name template for batch runs, fields {config}, {scraper}, {date}, {time}, {index}, '
+                             'made unique with a "_#" suffix, defaults to the generated output name base')
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE', dest='overrides',
+                        help='override a setting for this invocation, value parsed as YAML, may be repeated')
+    parser.add_argument('--profile', choices=['cprofile', 'sampling'],
+                        help='profile PROFILE_STAGES of the run, saving artifacts beside the output')
+    parser.add_argument('--summary', metavar='FILE',
+                        help='write a JSON summary of batch runs to FILE, or "-" for stdout')
+    return parser.parse_args()
+
+def resolve_configs(patterns: list[str], config_directory: str) -> list[str]:
+    ''' Returns: Config file names in config_directory matched by each pattern, in pattern
+        order then name order, without duplicates. Patterns may be names, paths inside the
+        config directory, or globs such as "*.json". Directories match their config files of
+        every entry source format. '''
+    config_files = []
+    for pattern in patterns:
+        extensions = None
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '*')
+            extensions = tuple(ENTRY_SOURCES)
+        elif os.path.dirname(pattern) == '':
+            pattern = os.path.join(config_directory, pattern)
+        matches = sorted(path for path in glob.glob(pattern)
+                         if os.path.isfile(path) and (extensions is None or path.endswith(extensions)))
+        if not matches:
+            raise FileNotFoundError(f'No config files match {pattern}')
+        for path in matches:
+            config_file = os.path.relpath(path, config_directory)
+            if config_file.startswith(os.pardir):
+                raise FileNotFoundError(f'Config {path} is not inside {config_directory}')
+            if config_file not in config_files:
+                config_files.append(config_file)
+    return config_files
+
+def format_output_name(template: str, config_file: str, index: int, settings: Settings) -> str:
+    ''' Returns: Unique output name for config_file built from template. '''
+    now = datetime.now()
+    try:
+        config = Config(config_file)
+        scraper_name = config.scraper_name
+    except (FileNotFoundError, ValueError, SE.InvalidConfigFile):
+        scraper_name = 'unknown'
+    try:
+        base_filename = template.format(config=os.path.splitext(os.path.basename(config_file))[0], scraper=scraper_name,
+                                        date=now.strftime('%Y%m%d'), time=now.strftime('%H%M%S'), index=index)
+    except (KeyError, IndexError, ValueError) as e:
+        raise SE.BadSettings(f'Bad output name template {template}: {e}')
+    if not re.match(r'^[^<>:"/\\|?*]+$', base_filename):
+        raise SE.BadSettings(f'Bad output name {base_filename}, avoid characters like <>:"/\\|?*.')
+    return uniquify(base_filename, settings.OUTPUT_DIRECTORY)
+
+def batch_launch(config_files: list[str], template: str, settings: Settings, pool: BrowserPool = None) -> list[dict]:
+    ''' Purpose: Runs each config file in turn without prompts, sharing the browser pool.
+        Returns: Run summary of each config file, in order. '''
+    summaries = []
+    for index, config_file in enumerate(config_files):
+        output_name = format_output_name(template, config_file, index, settings)
+        Log.status(f'Batch run {index + 1}/{len(config_files)}: {config_file} to {output_name}')
+        summaries.append(scrape_launch(config_file, output_name, settings, pool=pool))
+    return summaries
+
+def write_summary(path: str, summary: dict):
+    ''' Purpose: Writes summary as JSON to path, or to stdout if path is "-". '''
+    text = json.dumps(summary, indent=2)
+    if path == '-':
+        print(text)
+    else:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text + '\n')
+
+def resume_launch(output_name: str, settings: Settings, pool: BrowserPool = None):
+    ''' Purpose: Resumes the interrupted run of output_name using its checkpoint journal. '''
+    checkpoint = Checkpoint(output_name, settings)
+    checkpoint.load()
+    Log.status(f'Resuming {output_name} using {checkpoint.config_file}...')
+    return scrape_launch(checkpoint.config_file, output_name, settings, resume=True, pool=pool)
+
 if __name__ == '__main__':
+    args = parse_arguments()
+    exit_code = EXIT_SUCCESS
+    started = datetime.now().isoformat(timespec='seconds')
+    summaries = []
     try:
         Log.status('Preparing to launch scraper...')
         settings = Settings()
-        if settings.PICK_OUTPUT_NAME:
-            output_name = prompt_filename(settings.OUTPUT_DIRECTORY, 'Please specify a scraper results filename')
-        else:
-            output_name = uniquify(settings.GENERATED_OUTPUT_NAME_BASE, settings.OUTPUT_DIRECTORY)
-            Log.info(f'Generated output name: {output_name}')
-        scraper_options = list_filenames(settings.CONFIG_DIRECTORY, ['.gitignore'], True)
-        if not scraper_options:
-            Log.alert(f'No available scraper configs. Create one at {settings.CONFIG_DIRECTORY} first. ')
-            sys.exit()
-        config_file = prompt_options(scraper_options, 'Please select a scraper configuration')
-        Log.status('Calling scraper launcher...')
-        scrape_launch(config_file, output_name, settings)
+        settings.apply_overrides(args.overrides + ([f'PROFILER={args.profile}'] if args.profile else []))
+        config_files = resolve_configs(args.configs, settings.CONFIG_DIRECTORY) if args.configs else []
+        if len(config_files) > 1 and not settings.BROWSER_POOL_SIZE:
+            # Share warm browsers between the configs of a batch
+            settings.BROWSER_POOL_SIZE = settings.MAX_WORKERS
+        with BrowserPool(settings) if settings.BROWSER_POOL_SIZE else nullcontext() as pool:
+            if args.resume:
+                summaries.append(resume_launch(args.resume, settings, pool))
+            elif args.enqueue:
+                enqueue_launch(args.enqueue, args.job or os.path.splitext(args.enqueue)[0], settings)
+            elif args.work:
+                exit_code = EXIT_RUN_FAILED if work_launch(args.work, settings, pool) else EXIT_SUCCESS
+            elif args.merge:
+                exit_code = EXIT_SUCCESS if merge_launch(args.merge, settings) else EXIT_RUN_FAILED
+            elif args.reparse:
+                summaries.append(reparse_launch(args.reparse, uniquify(f'{args.reparse}_reparse', settings.OUTPUT_DIRECTORY), settings))
+            elif config_files:
+                summaries = batch_launch(config_files, args.output or settings.GENERATED_OUTPUT_NAME_BASE, settings, pool)
+            else:
+                if settings.PICK_OUTPUT_NAME:
+                    output_name = prompt_filename(settings.OUTPUT_DIRECTORY, 'Please specify a scraper results filename')
+                else:
+                    output_name = uniquify(settings.GENERATED_OUTPUT_NAME_BASE, settings.OUTPUT_DIRECTORY)
+                    Log.info(f'Generated output name: {output_name}')
+                scraper_options = list_filenames(settings.CONFIG_DIRECTORY, ['.gitignore'], True)
+                if not scraper_options:
+                    Log.alert(f'No available scraper configs. Create one at {settings.CONFIG_DIRECTORY} first. ')
+                    sys.exit(EXIT_BAD_USAGE)
+                config_file = prompt_options(scraper_options, 'Please select a scraper configuration')
+                Log.status('Calling scraper launcher...')
+                summaries.append(scrape_launch(config_file, output_name, settings, pool=pool))
+        if any(summary['status'] != 'success' for summary in summaries):
+            exit_code = EXIT_RUN_FAILED
     except KeyboardInterrupt:
         Log.alert('Keyboard interrupt, aborting...')
-        sys.exit()
+        exit_code = EXIT_INTERRUPTED
     except SE.BadSettings as e:
         Log.alert(f'{e.args[0]}')
+        exit_code = EXIT_BAD_USAGE
+    except FileNotFoundError as e:
+        Log.alert(f'Missing file: {e.args[0]}')
+        exit_code = EXIT_BAD_USAGE
+    except (SE.InvalidConfigFile, SE.BadScraper) as e:
+        Log.error(f'{type(e).__name__}: {e.args[0] if e.args else e}')
+        exit_code = EXIT_BAD_USAGE
+    except sqlite3.Error as e:
+        Log.error(f'Job queue database error, check JOB_QUEUE_PATH: {type(e).__name__}: {e}')
+        exit_code = EXIT_RUN_FAILED
+    if args.summary:
+        write_summary(args.summary, {'started': started, 'finished': datetime.now().isoformat(timespec='seconds'),
+                                     'exit_code': exit_code, 'runs': summaries})
+    sys.exit(exit_code)
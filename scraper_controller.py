@@ -1,116 +1,851 @@
 ''' Created: 09/09/2023 '''
 
 # External Dependencies
-from selenium.webdriver.remote.webdriver import WebDriver
-from bs4 import BeautifulSoup
-from pprint import pformat
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import partial
+from threading import Event, Lock, Thread
 from tqdm import tqdm
-from typing import List
-from time import sleep
-import csv
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import hashlib
+import os
+import shutil
+import socket
+import time
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from utilities.http_handler import HttpFetcher
 
 # Internal Dependencies
 from utilities.generic_validators import GenericValidators
 from utilities.scraper_builder import ScraperBuilder, Scraper
 from utilities.custom_exceptions import ScraperExceptions as SE
-from utilities.selenium_handler import BrowserManager
+from utilities.selenium_handler import BrowserPool, BrowserTab, LazyBrowser, SkippedBytesEstimator, TabbedBrowser, read_page_bytes
 from utilities.config_builder import Config
+from utilities.rate_limiter import RateLimiter
+from utilities.parse_pipeline import ParsePipeline, create_parse_executor
+from utilities.output_writer import OutputWriter
+from utilities.checkpoint import Checkpoint, fingerprint_block
+from utilities.dedup_index import DedupIndex
+from utilities.job_queue import JOB_QUEUES, BaseJobQueue, Job
+from utilities.output_formats import OUTPUT_FORMATS
+from utilities.metrics import Metrics
+from utilities.profiler import StageProfiler
+from utilities.page_archive import ArchivedPage, PageArchive, PageArchiveReader, get_reader
+from utilities.text_extractors import TEXT_EXTRACTORS
+from utilities.data_block import PageBlocks
+from utilities.data_bounds import DataBounds
 from utilities.logger_formats import Log
 from utilities.settings import Settings
 
 # NOTE: All scraper methods originate from the scraper specified via scraper_name in
 #       the configuration JSON provided to scrape_launch or inherited from BaseScraper. 
 
-def save_data(scraper: Scraper, output_name: str, entry_name: str, entry_url: str, data_blocks: List[List[str]], settings: Settings):
-    ''' Purpose: Saves parsed data to a csv file output. Optionally will also dump raw
-        data_blocks list of list of strings to a dump.txt file as well. '''
-    if settings.DUMP_RAW_DATA:
-        with open(f'{settings.OUTPUT_DIRECTORY}{output_name}.dump.txt', 'a+', encoding='utf-8', newline='') as file:
-            file.write(pformat(data_blocks))
-    with open(f'{settings.OUTPUT_DIRECTORY}{output_name}.csv', 'a+', encoding='utf-8',newline='') as file:
-        fieldnames = list(scraper.parsers.parse_data_block(data_blocks[0]).keys()) + ['entry_name'] + ['entry_url'] + ['raw_data']
-        writer = csv.DictWriter(file, quoting=csv.QUOTE_ALL, fieldnames=fieldnames)
-        if file.tell() == 0:
-            Log.info(f'Constructed CSV fieldnames:\n{fieldnames}')
-            writer.writeheader()
-        for block in data_blocks:
-            for i, item in enumerate(block):
-                item = ' '.join(item.split())
-                item = item.replace('"', "'")
-                item = item.replace(';', ',')
-                block[i] = item
-            parsed_data = scraper.parsers.parse_data_block(block)
-            parsed_data['entry_name'] = entry_name
-            parsed_data['entry_url'] = entry_url
-            parsed_data['raw_data'] = ';'.join(block)
-            if set(fieldnames) != set(parsed_data.keys()):
-                raise SE.UnexpectedData('Fieldnames and parsed_data keys do not match!')
-            writer.writerow(parsed_data)
-
-def extract_data(page_html: str, scraper: Scraper, settings: Settings) -> List[List[str]]:
-    ''' Purpose: Controls selenium to scrape data from given page, returns page data_blocks. '''
-    soup = BeautifulSoup(page_html, 'html.parser')
-    texts = scraper.parsers.extract_page_text(soup)
-    indices = scraper.parsers.extract_data_indices(texts)
-    data_bounds, data_blocks = [], []
-    for idx in indices:
-        data_bound = scraper.parsers.extract_data_bounds(idx)
-        SE.handle_bad_data(GenericValidators.validate_data_bound, settings.DATA_STRICT, data_bound, texts)
-        SE.handle_bad_data(GenericValidators.validate_for_overlap, settings.DATA_STRICT, data_bounds, data_bound)
-        data_block = scraper.parsers.extract_data_block(texts, data_bound)
+# Columns the controller adds to every parsed data block row, with their types.
+ENTRY_FIELDS = {'entry_name': str, 'entry_url': str, 'raw_data': list}
+
+class ScrapeRun:
+    ''' Purpose: Bundles the scraper, settings, and services shared by all entries of a run. '''
+    def __init__(self, scraper: Scraper, settings: Settings, output_name: str, limiter: RateLimiter, writer: OutputWriter, checkpoint: Checkpoint, executor: Optional[Executor] = None, http: Optional['HttpFetcher'] = None, pool: Optional[BrowserPool] = None, index: Optional[DedupIndex] = None, metrics: Optional[Metrics] = None, archive: Optional[PageArchive] = None, browser_extraction: str = 'off', lease_lost: Optional[Event] = None, skipped_bytes: Optional[SkippedBytesEstimator] = None):
+        self.scraper = scraper
+        self.settings = settings
+        self.output_name = output_name
+        self.limiter = limiter
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.executor = executor
+        self.http = http
+        self.pool = pool
+        self.index = index
+        self.metrics = metrics or Metrics(settings)
+        self.archive = archive
+        self.browser_extraction = browser_extraction
+        self.lease_lost = lease_lost
+        self.skipped_bytes = skipped_bytes
+
+class EntrySaver:
+    ''' Purpose: Saves pages of data_blocks for one entry URL in order, recording checkpoint
+        progress. Given resumed progress, drops blocks up to the last saved fingerprint. With
+        a run DedupIndex, drops blocks from the first one a previous run saved onwards and
+        sets reached_known so the caller stops paging. '''
+    def __init__(self, run: ScrapeRun, entry_name: str, entry_url: str, progress: Optional[Dict] = None):
+        self.run = run
+        self.entry_name = entry_name
+        self.entry_url = entry_url
+        self.block_count, self.page_idx, self.skip_fingerprint = 0, 0, None
+        self.reached_known = False
+        if progress is not None:
+            Log.info(f'Resuming from page {progress["page"]} with {progress["rows"]} saved reviews')
+            self.block_count, self.page_idx, self.skip_fingerprint = progress['rows'], progress['page'], progress['fingerprint']
+    def save_page(self, page_blocks: Sequence[Sequence[str]]):
+        ''' Purpose: Saves the next page of data_blocks and queues its checkpoint progress.
+            Raises LeaseLost instead once the job queue lease of the run has been lost. '''
+        if self.run.lease_lost is not None and self.run.lease_lost.is_set():
+            raise SE.LeaseLost(f'Lost lease of {self.entry_name}, stopping before saving page {self.page_idx}...')
+        if self.reached_known:
+            return
+        if self.skip_fingerprint is not None:
+            page_blocks = skip_saved_blocks(page_blocks, self.skip_fingerprint)
+            self.skip_fingerprint = None
+        index = self.run.index
+        fingerprints = [fingerprint_block(block) for block in page_blocks] if index is not None else None
+        if index is not None:
+            known_idx = index.find_known(self.entry_url, fingerprints)
+            if known_idx is not None:
+                Log.info(f'Reached reviews saved by a previous run, stopping {self.entry_name}...')
+                page_blocks, fingerprints = page_blocks[:known_idx], fingerprints[:known_idx]
+                self.reached_known = True
+        if page_blocks:
+            fingerprint = fingerprints[-1] if fingerprints else fingerprint_block(page_blocks[-1])
+            self.block_count += len(page_blocks)
+            with self.run.metrics.timed('write', self.entry_name):
+                save_data(self.run.scraper, self.run.writer, self.entry_name, self.entry_url, page_blocks,
+                          partial(self.record_page, fingerprints, fingerprint))
+            self.run.metrics.count('blocks', self.entry_name, len(page_blocks))
+        self.page_idx += 1
+    def record_page(self, fingerprints: Optional[List[str]], fingerprint: str):
+        ''' Purpose: Queues the progress and fingerprints of the page being saved, called once
+            its rows are written so the next flush commits them together. '''
+        if fingerprints is not None:
+            self.run.index.add(self.entry_url, fingerprints)
+        self.run.checkpoint.record_page(self.entry_url, self.page_idx, self.block_count, fingerprint)
+
+def get_schema(scraper: Scraper) -> Optional[Dict[str, type]]:
+    ''' Returns: Output column types from the scraper data_fields schema, or None if undeclared. '''
+    if not scraper.parsers.data_fields:
+        return None
+    return {**scraper.parsers.data_fields, **ENTRY_FIELDS}
+
+def save_data(scraper: Scraper, writer: OutputWriter, entry_name: str, entry_url: str, data_blocks: Sequence[Sequence[str]], on_written: Optional[Callable[[], None]] = None):
+    ''' Purpose: Streams parsed data for one page of data_blocks to the run output, calling
+        on_written once the rows are written. Optionally will also dump raw data_blocks
+        list of list of strings to a dump.txt file as well.
+        Items are cleaned for parsing as the OUTPUT_FORMAT requires, data_blocks are unchanged
+        and DataBlock views are only copied to lists here, for the cleaned items and raw_data. '''
+    writer.write_dump(data_blocks)
+    output_format = writer.format
+    rows = []
+    for block in data_blocks:
+        cleaned = [output_format.clean_item(item) for item in block]
+        parsed_data = scraper.parsers.parse_data_block(cleaned)
+        parsed_data['entry_name'] = entry_name
+        parsed_data['entry_url'] = entry_url
+        parsed_data['raw_data'] = output_format.format_raw(block, cleaned)
+        rows.append(parsed_data)
+    writer.write_rows(rows, on_written)
+
+def extract_texts(page_html: str, scraper: Scraper, settings: Settings) -> List[str]:
+    ''' Returns: Page texts list. Scrapers declaring text_tags skip the soup parse and use the
+        PAGE_PARSER text extractor, others parse soup with the PAGE_PARSER tree builder. '''
+    if scraper.parsers.text_tags and settings.PAGE_PARSER in TEXT_EXTRACTORS:
+        return TEXT_EXTRACTORS[settings.PAGE_PARSER](page_html, scraper.parsers.text_tags)
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(page_html, 'lxml' if settings.PAGE_PARSER == 'lxml' else 'html.parser')
+    return scraper.parsers.extract_page_text(soup)
+
+def compare_browser_texts(texts: List[str], browser_texts: List[str]) -> None:
+    ''' Purpose: Warns if page texts extracted in the browser differ from those parsed from
+        page source, showing the first differing text. '''
+    if browser_texts == texts:
+        return
+    idx = next((idx for idx, (text, browser_text) in enumerate(zip(texts, browser_texts)) if text != browser_text), min(len(texts), len(browser_texts)))
+    Log.warn(f'Browser extracted {len(browser_texts)} texts, page source parsed {len(texts)}, first differing at index {idx}:\n'
+             f'{browser_texts[idx:idx + 1]} != {texts[idx:idx + 1]}')
+
+def extract_data(page_html: Optional[str], scraper: Scraper, settings: Settings, timings: Optional[Dict[str, float]] = None, browser_texts: Optional[List[str]] = None) -> PageBlocks:
+    ''' Purpose: Controls selenium to scrape data from given page, returns page data_blocks
+        as PageBlocks views of the page texts. Given a timings dict, adds the seconds spent
+        in each parse stage to it. Given browser_texts, blocks are taken from them without
+        page_html, or if page_html is also given, blocks are taken from page_html with
+        browser_texts compared to it. '''
+    start = time.perf_counter()
+    if page_html is None:
+        texts = browser_texts
+    else:
+        texts = extract_texts(page_html, scraper, settings)
+        if browser_texts is not None:
+            compare_browser_texts(texts, browser_texts)
+    parsed = time.perf_counter()
+    validation = 0.0
+    start_indices, end_indices = scraper.parsers.extract_data_bounds_batch(texts)
+    data_bounds = DataBounds()
+    for start_idx, end_idx in zip(start_indices, end_indices):
+        check = time.perf_counter()
+        SE.handle_bad_data(GenericValidators.validate_data_bound, settings.DATA_STRICT, start_idx, end_idx, texts)
+        SE.handle_bad_data(GenericValidators.validate_for_overlap, settings.DATA_STRICT, data_bounds, start_idx, end_idx)
+        validation += time.perf_counter() - check
+        data_block = scraper.parsers.extract_data_block(texts, start_idx, end_idx)
+        check = time.perf_counter()
         SE.handle_bad_data(scraper.validators.validate_data_block, settings.DATA_STRICT, data_block)
-        data_blocks.append(data_block)
-        data_bounds.append(data_bound)
-    return data_blocks
+        validation += time.perf_counter() - check
+        data_bounds.append(start_idx, end_idx)
+    if timings is not None:
+        timings['soup_parse'] = parsed - start
+        timings['block_extraction'] = time.perf_counter() - parsed - validation
+        timings['validation'] = validation
+    return PageBlocks(texts, data_bounds)
+
+def extract_data_timed(page_html: Optional[str], scraper: Scraper, settings: Settings, browser_texts: Optional[List[str]] = None) -> Tuple[PageBlocks, Dict[str, float]]:
+    ''' Returns: Page data_blocks with the seconds spent in each parse stage, so timings of
+        pages parsed in worker processes reach the run Metrics. '''
+    timings = {}
+    return extract_data(page_html, scraper, settings, timings, browser_texts), timings
 
-def scrape_data(driver: WebDriver, scraper: Scraper, settings: Settings) -> List[List[str]]:
-    ''' Purpose: Controls selenium to scrape all pages for entry URL, returns URL data_blocks. '''
+def get_parse_job(run: ScrapeRun) -> Callable:
+    ''' Returns: Page parse job for the run ParsePipeline, profiled as the parse stage if the
+        run profiler selects it. Pages parsed in worker processes are not profiled. '''
+    profiler = run.metrics.profiler
+    if profiler is not None and profiler.selects('parse') and not isinstance(run.executor, ProcessPoolExecutor):
+        return profiler.wrap('parse', extract_data_timed)
+    return extract_data_timed
+
+def navigate(run: ScrapeRun, stage: str, entry_name: str, navigator: Callable, driver: 'WebDriver'):
+    ''' Returns: Result of navigator through SE.handle_bad_nav, timed as stage with any
+        retries counted in the run Metrics. '''
+    attempts = 0
+    def attempt(*args):
+        nonlocal attempts
+        attempts += 1
+        return navigator(*args)
+    try:
+        with run.metrics.timed(stage, entry_name):
+            return SE.handle_bad_nav(attempt, driver)
+    finally:
+        if attempts > 1:
+            run.metrics.count('nav_retries', entry_name, attempts - 1)
+
+def skip_to_page(driver: 'WebDriver', run: ScrapeRun, saver: EntrySaver, page: int) -> int:
+    ''' Purpose: Clicks through entry URL subpages without parsing to reach a resumed page.
+        Returns: Index of the subpage reached, lower than page if the entry has shrunk. '''
+    navigators = run.scraper.navigators
+    for page_idx in range(page):
+        if not navigate(run, 'navigation', saver.entry_name, navigators.check_next_page, driver):
+            Log.warn(f'Expected to resume at page {page}, only reached page {page_idx}...')
+            return page_idx
+        run.limiter.wait(saver.entry_url)
+        with run.limiter.track(saver.entry_url):
+            navigate(run, 'navigation', saver.entry_name, navigators.grab_next_page, driver)
+            navigate(run, 'wait_for_page', saver.entry_name, navigators.wait_for_page, driver)
+    return page
+
+def read_page(driver: 'WebDriver', run: ScrapeRun, entry_name: str) -> Tuple[Optional[str], Optional[List[str]]]:
+    ''' Returns: Page source unless the run extracts texts in the browser only, and page texts
+        extracted in the browser if it does. If the browser script fails, the page source
+        is read instead and the fallback counted in the run Metrics. '''
+    browser_texts = None
+    if run.browser_extraction != 'off':
+        from selenium.common.exceptions import WebDriverException
+        try:
+            browser_texts = run.scraper.parsers.extract_browser_text(driver)
+        except (WebDriverException, ValueError, SE.UnexpectedData) as e:
+            Log.warn(f'Browser text extraction failed, reading page source instead...\n{e}')
+            run.metrics.count('browser_extraction_fallbacks', entry_name)
+    page_html = driver.page_source if browser_texts is None or run.browser_extraction == 'verify' else None
+    return page_html, browser_texts
+
+def skip_saved_blocks(data_blocks: Sequence[Sequence[str]], fingerprint: str) -> Sequence[Sequence[str]]:
+    ''' Returns: data_blocks after the block matching fingerprint, being those not yet saved. '''
+    fingerprints = [fingerprint_block(block) for block in data_blocks]
+    if fingerprint not in fingerprints:
+        Log.warn('Resumed page no longer contains the last saved block, saving whole page...')
+        return data_blocks
+    return data_blocks[fingerprints.index(fingerprint) + 1:]
+
+def scrape_data(driver: 'WebDriver', run: ScrapeRun, saver: EntrySaver) -> Tuple[int, int]:
+    ''' Purpose: Controls selenium to scrape all pages for entry URL, saving each page of
+        data_blocks as it is parsed. Returns: Number of data_blocks saved for entry URL, and
+        number of pages read by this session, excluding pages restored from a checkpoint.
+        The browser only captures page HTML, parsing runs through the run ParsePipeline.
+        Given resumed progress, skips to the last saved page and continues after it. '''
     pbar = tqdm(total=0)
-    data_blocks = []
+    pipeline = ParsePipeline(run.executor, run.settings.PARSE_WORKERS * 2)
+    page_bytes, measured_pages, loaded_pages = 0, 0, 0
+    if saver.page_idx:
+        saver.page_idx = skip_to_page(driver, run, saver, saver.page_idx)
+    navigators, metrics, entry_name = run.scraper.navigators, run.metrics, saver.entry_name
+    parse_job = get_parse_job(run)
+    page_idx = saver.page_idx
     try:
         while True:
-            page_html = driver.page_source
-            data_blocks.extend(extract_data(page_html, scraper, settings))
-            if SE.handle_bad_nav(scraper.navigators.check_next_page, driver):
-                SE.handle_bad_nav(scraper.navigators.grab_next_page, driver)
+            with metrics.timed('page_source', entry_name):
+                page_html, browser_texts = read_page(driver, run, entry_name)
+            loaded_pages += 1
+            if run.archive is not None:
+                run.archive.add(entry_name, saver.entry_url, page_idx, page_html)
+            metrics.count('pages', entry_name)
+            if page_html is not None:
+                metrics.count('html_bytes', entry_name, len(page_html))
+            if run.settings.REPORT_PAGE_BYTES:
+                transferred, skipped = read_page_bytes(driver)
+                metrics.count('page_bytes', entry_name, transferred)
+                if run.skipped_bytes is not None:
+                    run.skipped_bytes.submit(entry_name, skipped)
+                page_bytes += transferred
+                measured_pages += 1
+            pipeline.submit(parse_job, page_html, run.scraper, run.settings, browser_texts)
+            for page_blocks, timings in pipeline.ready():
+                metrics.observe_all(entry_name, timings)
+                saver.save_page(page_blocks)
+            if not saver.reached_known and navigate(run, 'navigation', entry_name, navigators.check_next_page, driver):
+                run.limiter.wait(saver.entry_url)
+                with run.limiter.track(saver.entry_url):
+                    navigate(run, 'navigation', entry_name, navigators.grab_next_page, driver)
+                    navigate(run, 'wait_for_page', entry_name, navigators.wait_for_page, driver)
+                page_idx += 1
                 pbar.update(1)
-                SE.handle_bad_nav(scraper.navigators.wait_for_page, driver)
-                sleep(settings.RATE_LIMIT_DELAY)
             else:
                 break
+        for page_blocks, timings in pipeline.drain():
+            metrics.observe_all(entry_name, timings)
+            saver.save_page(page_blocks)
+    finally:
+        pipeline.cancel()
+        pbar.close()
+    if measured_pages:
+        Log.info(f'Browser transferred {page_bytes / 1024:.0f} KiB over {measured_pages} pages, {page_bytes / 1024 / measured_pages:.1f} KiB per page')
+    Log.status(f'Extracted {saver.block_count} reviews')
+    return saver.block_count, loaded_pages
+
+def scrape_data_http(run: ScrapeRun, saver: EntrySaver) -> Optional[Tuple[int, Optional[int]]]:
+    ''' Purpose: Fetches all pages for entry URL over HTTP, saving each page of data_blocks as
+        it is parsed. Resumed progress is reached by fetching the saved page directly.
+        Returns: Number of data_blocks saved and expected total, or None if the entry
+        page needs JavaScript and must be scraped with Selenium instead. '''
+    fetchers = run.scraper.fetchers
+    pbar = tqdm(total=0)
+    pipeline = ParsePipeline(run.executor, run.settings.PARSE_WORKERS * 2)
+    page_idx, total_blocks = saver.page_idx, None
+    metrics, entry_name = run.metrics, saver.entry_name
+    parse_job = get_parse_job(run)
+    try:
+        while True:
+            run.limiter.wait(saver.entry_url)
+            with run.limiter.track(saver.entry_url), metrics.timed('fetch', entry_name):
+                page_html = run.http.get(fetchers.build_page_url(saver.entry_url, page_idx))
+            metrics.count('pages', entry_name)
+            metrics.count('html_bytes', entry_name, len(page_html))
+            if page_idx == saver.page_idx:
+                if fetchers.needs_browser(page_html):
+                    Log.info('Entry page needs JavaScript, falling back to Selenium...')
+                    return None
+                total_blocks = SE.handle_non_critical(fetchers.extract_total_count, run.settings.DATA_STRICT, page_html)
+            if run.archive is not None:
+                run.archive.add(entry_name, saver.entry_url, page_idx, page_html)
+            pipeline.submit(parse_job, page_html, run.scraper, run.settings)
+            for page_blocks, timings in pipeline.ready():
+                metrics.observe_all(entry_name, timings)
+                saver.save_page(page_blocks)
+            if saver.reached_known or not fetchers.check_next_page(page_html):
+                break
+            page_idx += 1
+            pbar.update(1)
+        for page_blocks, timings in pipeline.drain():
+            metrics.observe_all(entry_name, timings)
+            saver.save_page(page_blocks)
     finally:
+        pipeline.cancel()
         pbar.close()
-    Log.status(f'Extracted {len(data_blocks)} reviews')
-    return data_blocks
-
-def scrape_website(driver: WebDriver, scraper: Scraper, config: Config, settings: Settings, output_name: str):
-    ''' Purpose: Control Selenium to extract data for each entry URL. '''
-    for entry_name, entry_url in config.get_lines():
-        Log.status(f'Scraping {entry_name}')
-        scraper.validators.validate_url(entry_url)
-        driver.get(entry_url)
-        SE.handle_bad_nav(scraper.navigators.wait_for_entry, driver)
-        data_blocks = scrape_data(driver, scraper, settings)
-        total_blocks = SE.handle_non_critical(scraper.parsers.extract_total_count, settings.DATA_STRICT, driver)
-        SE.handle_bad_data(GenericValidators.validate_data_count, settings.DATA_STRICT, len(data_blocks), total_blocks)
-        save_data(scraper, output_name, entry_name, entry_url, data_blocks, settings)
-        sleep(settings.RATE_LIMIT_DELAY)
-
-def scrape_launch(config_file: str, output_name: str, settings: Settings):
-    ''' Purpose: Manages the scraping of all pages from provided config file. '''
+    Log.status(f'Extracted {saver.block_count} reviews')
+    return saver.block_count, total_blocks
+
+def start_entry(run: ScrapeRun, entry_name: str, entry_url: str) -> Optional[EntrySaver]:
+    ''' Returns: EntrySaver of entry URL holding any resumed progress, or None if the run
+        checkpoint has the entry as completed. '''
+    if run.checkpoint.is_done(entry_url):
+        Log.info(f'Skipping {entry_name}, already completed')
+        return None
+    Log.status(f'Scraping {entry_name}')
+    run.scraper.validators.validate_url(entry_url)
+    return EntrySaver(run, entry_name, entry_url, run.checkpoint.get_entry(entry_url))
+
+def finish_entry(run: ScrapeRun, saver: EntrySaver, block_count: int, total_blocks: Optional[int]):
+    ''' Purpose: Validates the saved block count of an entry against its expected total, then
+        records the entry as completed in the run checkpoint. '''
+    if saver.reached_known:
+        Log.info(f'Saved {block_count} new reviews before reaching previously saved reviews')
+    else:
+        SE.handle_bad_data(GenericValidators.validate_data_count, run.settings.DATA_STRICT, block_count, total_blocks)
+    run.checkpoint.record_done(saver.entry_url, block_count)
+
+def scrape_entry(browser: LazyBrowser, run: ScrapeRun, entry_name: str, entry_url: str):
+    ''' Purpose: Extract, save, and validate all data_blocks for one entry URL. Scrapers with
+        Fetchers are fetched over HTTP when enabled, otherwise with Selenium. Entries the
+        run checkpoint has as completed are skipped. '''
+    saver = start_entry(run, entry_name, entry_url)
+    if saver is None:
+        return
+    result = scrape_data_http(run, saver) if run.http is not None else None
+    if result is not None:
+        block_count, total_blocks = result
+    else:
+        driver = browser.get()
+        run.limiter.wait(entry_url)
+        with run.limiter.track(entry_url):
+            with run.metrics.timed('navigation', entry_name):
+                driver.get(entry_url)
+            navigate(run, 'wait_for_page', entry_name, run.scraper.navigators.wait_for_entry, driver)
+        block_count, loaded_pages = scrape_data(driver, run, saver)
+        # Read before counting pages, which may end the session and blank the page
+        total_blocks = SE.handle_non_critical(run.scraper.parsers.extract_total_count, run.settings.DATA_STRICT, driver)
+        browser.add_pages(loaded_pages)
+    finish_entry(run, saver, block_count, total_blocks)
+
+def scrape_website(run: ScrapeRun, config: Config):
+    ''' Purpose: Extract data for each entry URL with a single browser session. '''
+    with LazyBrowser(language=run.scraper.parsers.browser_lang, settings=run.settings, pool=run.pool) as browser:
+        for entry_name, entry_url in config.get_lines(run.scraper.validators.validate_url):
+            scrape_entry(browser, run, entry_name, entry_url)
+
+def scrape_worker(run: ScrapeRun, entries: Iterator[Tuple[str, str]], entries_lock: Lock, stop: Event):
+    ''' Purpose: Runs one browser session that scrapes entries from the shared config stream
+        until it is exhausted or another worker has failed. Saving is serialised by run.writer. '''
+    with LazyBrowser(language=run.scraper.parsers.browser_lang, settings=run.settings, pool=run.pool) as browser:
+        while not stop.is_set():
+            with entries_lock:
+                entry = next(entries, None)
+            if entry is None:
+                return
+            scrape_entry(browser, run, *entry)
+
+def scrape_website_parallel(run: ScrapeRun, config: Config):
+    ''' Purpose: Control a pool of workers, each with its own browser session, to extract data
+        for each entry URL. Workers take entries from the config as it is streamed, and
+        workers left without an entry never open a browser. The first worker failure
+        stops the rest and is raised to caller. '''
+    entries = config.get_lines(run.scraper.validators.validate_url)
+    entries_lock = Lock()
+    workers = run.settings.MAX_WORKERS
+    Log.info(f'Running {workers} parallel scraper workers...')
+    stop = Event()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(scrape_worker, run, entries, entries_lock, stop) for _ in range(workers)]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            stop.set()
+            raise
+
+def get_browser_extraction(scraper: Scraper, settings: Settings) -> str:
+    ''' Returns: BROWSER_EXTRACTION mode the run can use, "off" if the scraper has no browser
+        script or text_tags, or if pages are archived and so page source is needed. '''
+    if settings.BROWSER_EXTRACTION == 'off':
+        return 'off'
+    if not scraper.parsers.has_browser_text():
+        Log.warn('Scraper has no browser_script or text_tags, reading page source...')
+        return 'off'
+    if settings.BROWSER_EXTRACTION == 'on' and settings.ARCHIVE_PAGES:
+        Log.warn('ARCHIVE_PAGES needs page source, so texts are not extracted in the browser...')
+        return 'off'
+    return settings.BROWSER_EXTRACTION
+
+async def navigate_async(run: ScrapeRun, stage: str, entry_name: str, navigator: Callable, tab: BrowserTab):
+    ''' Returns: Result of an async navigator through SE.handle_bad_nav_async, timed as stage
+        with any retries counted in the run Metrics. '''
+    attempts = 0
+    async def attempt(*args):
+        nonlocal attempts
+        attempts += 1
+        return await navigator(*args)
+    try:
+        with run.metrics.timed_async(stage, entry_name):
+            return await SE.handle_bad_nav_async(attempt, tab)
+    finally:
+        if attempts > 1:
+            run.metrics.count('nav_retries', entry_name, attempts - 1)
+
+async def skip_to_page_async(tab: BrowserTab, run: ScrapeRun, saver: EntrySaver, page: int) -> int:
+    ''' Purpose: Async counterpart of skip_to_page driving one tab.
+        Returns: Index of the subpage reached, lower than page if the entry has shrunk. '''
+    navigators = run.scraper.navigators
+    for page_idx in range(page):
+        if not await navigate_async(run, 'navigation', saver.entry_name, navigators.check_next_page_async, tab):
+            Log.warn(f'Expected to resume at page {page}, only reached page {page_idx}...')
+            return page_idx
+        await asyncio.to_thread(run.limiter.wait, saver.entry_url)
+        with run.limiter.track(saver.entry_url):
+            await navigate_async(run, 'navigation', saver.entry_name, navigators.grab_next_page_async, tab)
+            await navigate_async(run, 'wait_for_page', saver.entry_name, navigators.wait_for_page_async, tab)
+    return page
+
+async def save_parsed_async(pending: Deque[asyncio.Future], saver: EntrySaver, max_pending: int):
+    ''' Purpose: Saves parsed pages from the front of pending in order, awaiting the oldest
+        until no more than max_pending remain. '''
+    while pending and (pending[0].done() or len(pending) > max_pending):
+        page_blocks, timings = await pending.popleft()
+        saver.run.metrics.observe_all(saver.entry_name, timings)
+        saver.save_page(page_blocks)
+
+async def scrape_data_async(tab: BrowserTab, run: ScrapeRun, saver: EntrySaver) -> Tuple[int, int]:
+    ''' Purpose: Async counterpart of scrape_data driving one browser tab, so other tabs run
+        whilst this one waits on page loads, page changes, and the rate limiter. Pages parse
+        on the run executor, or inline without one. Returns: Number of data_blocks saved, and
+        number of pages read by this tab, excluding pages restored from a checkpoint. '''
+    if saver.page_idx:
+        saver.page_idx = await skip_to_page_async(tab, run, saver, saver.page_idx)
+    navigators, metrics, entry_name = run.scraper.navigators, run.metrics, saver.entry_name
+    parse_job = get_parse_job(run)
+    loop = asyncio.get_running_loop()
+    pending: Deque[asyncio.Future] = deque()
+    page_idx, loaded_pages = saver.page_idx, 0
+    try:
+        while True:
+            with metrics.timed_async('page_source', entry_name):
+                page_html, browser_texts = await tab.run(read_page, run, entry_name)
+            loaded_pages += 1
+            if run.archive is not None:
+                run.archive.add(entry_name, saver.entry_url, page_idx, page_html)
+            metrics.count('pages', entry_name)
+            if page_html is not None:
+                metrics.count('html_bytes', entry_name, len(page_html))
+            if run.settings.REPORT_PAGE_BYTES:
+                transferred, skipped = await tab.run(read_page_bytes)
+                metrics.count('page_bytes', entry_name, transferred)
+                if run.skipped_bytes is not None:
+                    run.skipped_bytes.submit(entry_name, skipped)
+            if run.executor is None:
+                future = loop.create_future()
+                future.set_result(parse_job(page_html, run.scraper, run.settings, browser_texts))
+            else:
+                future = loop.run_in_executor(run.executor, parse_job, page_html, run.scraper, run.settings, browser_texts)
+            pending.append(future)
+            await save_parsed_async(pending, saver, run.settings.PARSE_WORKERS * 2)
+            if not saver.reached_known and await navigate_async(run, 'navigation', entry_name, navigators.check_next_page_async, tab):
+                await asyncio.to_thread(run.limiter.wait, saver.entry_url)
+                with run.limiter.track(saver.entry_url):
+                    await navigate_async(run, 'navigation', entry_name, navigators.grab_next_page_async, tab)
+                    await navigate_async(run, 'wait_for_page', entry_name, navigators.wait_for_page_async, tab)
+                page_idx += 1
+            else:
+                break
+        await save_parsed_async(pending, saver, 0)
+    finally:
+        for future in pending:
+            future.cancel()
+    Log.status(f'Extracted {saver.block_count} reviews from {entry_name}')
+    return saver.block_count, loaded_pages
+
+async def scrape_entry_async(browser: TabbedBrowser, tab: Optional[BrowserTab], run: ScrapeRun, entry_name: str, entry_url: str) -> Optional[BrowserTab]:
+    ''' Purpose: Async counterpart of scrape_entry, opening the tab on first use. Entries
+        fetched over HTTP run in a worker thread. Returns: Tab of the worker, if opened. '''
+    saver = start_entry(run, entry_name, entry_url)
+    if saver is None:
+        return tab
+    result = await asyncio.to_thread(scrape_data_http, run, saver) if run.http is not None else None
+    if result is not None:
+        block_count, total_blocks = result
+    else:
+        tab = tab or await browser.open_tab()
+        await asyncio.to_thread(run.limiter.wait, entry_url)
+        with run.limiter.track(entry_url):
+            with run.metrics.timed_async('navigation', entry_name):
+                await tab.get(entry_url)
+            await navigate_async(run, 'wait_for_page', entry_name, run.scraper.navigators.wait_for_entry_async, tab)
+        block_count, loaded_pages = await scrape_data_async(tab, run, saver)
+        total_blocks = await tab.run(partial(SE.handle_non_critical, run.scraper.parsers.extract_total_count, run.settings.DATA_STRICT))
+        browser.add_pages(loaded_pages)
+    finish_entry(run, saver, block_count, total_blocks)
+    return tab
+
+async def scrape_tab_worker(run: ScrapeRun, browser: TabbedBrowser, entries: Iterator[Tuple[str, str]]):
+    ''' Purpose: Drives one tab of browser, scraping entries from the shared config stream
+        until it is exhausted. The tab only opens once the worker takes an entry. '''
+    tab = None
+    for entry_name, entry_url in entries:
+        tab = await scrape_entry_async(browser, tab, run, entry_name, entry_url)
+
+async def scrape_website_async(run: ScrapeRun, config: Config):
+    ''' Purpose: Runs TABS_PER_BROWSER tab workers on each of MAX_WORKERS browser sessions in
+        one event loop. The first worker failure cancels the rest and is raised to caller. '''
+    entries = config.get_lines(run.scraper.validators.validate_url)
+    with ExitStack() as stack:
+        browsers = [stack.enter_context(TabbedBrowser(stack.enter_context(LazyBrowser(language=run.scraper.parsers.browser_lang, settings=run.settings, pool=run.pool))))
+                    for _ in range(run.settings.MAX_WORKERS)]
+        workers = [asyncio.create_task(scrape_tab_worker(run, browser, entries)) for browser in browsers for _ in range(run.settings.TABS_PER_BROWSER)]
+        done, running = await asyncio.wait(workers, return_when=asyncio.FIRST_EXCEPTION)
+        for worker in running:
+            worker.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        for worker in done:
+            if worker.exception() is not None:
+                raise worker.exception()
+
+def scrape_website_tabs(run: ScrapeRun, config: Config):
+    ''' Purpose: Extract data for each entry URL with several tabs per browser session. '''
+    Log.info(f'Running {run.settings.TABS_PER_BROWSER} tabs in each of {run.settings.MAX_WORKERS} browser sessions...')
+    asyncio.run(scrape_website_async(run, config))
+
+@contextmanager
+def open_scrape_run(scraper: Scraper, output_name: str, settings: Settings, checkpoint: Checkpoint, resume: bool = False, pool: Optional[BrowserPool] = None, limiter: Optional[RateLimiter] = None, lease_lost: Optional[Event] = None):
+    ''' Purpose: Opens the profiler, parse executor, output, and fetchers of a run of output_name,
+        yielding the ScrapeRun and closing them all after. If resume is True, output is
+        first cut back to the checkpoint offsets. Given lease_lost, pages stop being saved
+        once it is set. '''
+    use_http = settings.FETCH_MODE == 'http' and scraper.fetchers is not None
+    if settings.FETCH_MODE == 'http' and not use_http:
+        Log.warn('Scraper has no Fetchers, using Selenium...')
+    if pool is not None and not use_http:
+        pool.prewarm(scraper.parsers.browser_lang)
+    if use_http:
+        from utilities.http_handler import HttpFetcher
+    profiling = settings.PROFILER != 'off'
+    if profiling and 'parse' in settings.PROFILE_STAGES and settings.PARSE_PROCESSES and settings.PARSE_WORKERS:
+        Log.warn('Pages parsed in PARSE_PROCESSES workers are not profiled, set PARSE_PROCESSES False to profile parsing...')
+    with (StageProfiler(settings.PROFILER, settings.PROFILE_STAGES, f'{settings.OUTPUT_DIRECTORY}{output_name}') if profiling else nullcontext() as profiler,
+          create_parse_executor(settings) as executor,
+          DedupIndex(settings) if settings.INCREMENTAL_SCRAPE else nullcontext() as index,
+          OutputWriter(output_name, settings, checkpoint, get_schema(scraper), index) as writer,
+          HttpFetcher(scraper.parsers.browser_lang, settings) if use_http else nullcontext() as http,
+          PageArchive(f'{settings.OUTPUT_DIRECTORY}{output_name}', scraper.name, settings.ARCHIVE_COMPRESSION, resume) if settings.ARCHIVE_PAGES else nullcontext() as archive):
+        if resume:
+            writer.truncate(checkpoint.offsets)
+        metrics = Metrics(settings, profiler)
+        limiter = limiter or RateLimiter(settings)
+        # Resources are only skipped, so bytes only saved, by lean browsing sessions
+        estimating = settings.REPORT_PAGE_BYTES and settings.LEAN_BROWSING
+        try:
+            with SkippedBytesEstimator(limiter, metrics, settings) if estimating else nullcontext() as skipped_bytes:
+                yield ScrapeRun(scraper, settings, output_name, limiter, writer, checkpoint, executor, http, pool, index, metrics, archive,
+                                get_browser_extraction(scraper, settings), lease_lost, skipped_bytes)
+        finally:
+            metrics.report(f'{settings.OUTPUT_DIRECTORY}{output_name}')
+
+def scrape_launch(config_file: str, output_name: str, settings: Settings, resume: bool = False, pool: Optional[BrowserPool] = None) -> Dict:
+    ''' Purpose: Manages the scraping of all pages from provided config file. If resume is
+        True, continues the interrupted run of output_name from its checkpoint journal. Given
+        a BrowserPool, browser sessions are checked out from and returned to it.
+        Returns: Summary of the run with its status, committed entry and row counts, and error. '''
+    summary = {'config': config_file, 'output': output_name, 'scraper': None, 'status': 'failed',
+               'error': None, 'entries_done': 0, 'rows': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+    checkpoint = None
     try:
         config = Config(config_file)
+        summary['scraper'] = config.scraper_name
         scraper = ScraperBuilder.build(f'scrapers.{config.scraper_name}')
-        with BrowserManager(language=scraper.parsers.browser_lang, settings=settings) as driver:
-            Log.info(f'Loaded {config_file} contents:\n{config.string()}')
-            scrape_website(driver, scraper, config, settings, output_name)
+        Log.info(f'Loaded {config_file} contents:\n{config.string()}')
+        checkpoint = Checkpoint(output_name, settings)
+        if resume:
+            checkpoint.load()
+        else:
+            checkpoint.start(config_file)
+        with open_scrape_run(scraper, output_name, settings, checkpoint, resume, pool) as run:
+            if settings.TABS_PER_BROWSER > 1:
+                scrape_website_tabs(run, config)
+            elif settings.MAX_WORKERS > 1:
+                scrape_website_parallel(run, config)
+            else:
+                scrape_website(run, config)
+        summary['status'] = 'success'
         Log.status('Scraping executed successfully')
     except KeyboardInterrupt:
         raise KeyboardInterrupt
     except (FileNotFoundError, NotImplementedError, TimeoutError, ConnectionError, SE.InvalidConfigFile, SE.UnexpectedData, SE.BadScraper, SE.NavigationFail) as e:
-        Log.alert(f'{e.args[0]}\nScraper:{config.scraper_name} {type(e).__name__}')
+        summary['error'] = f'{type(e).__name__}: {e.args[0] if e.args else e}'
+        Log.alert(f'{e.args[0]}\nScraper:{summary["scraper"]} {type(e).__name__}')
         if isinstance(e, (NotImplementedError, SE.UnexpectedData, SE.BadScraper, SE.NavigationFail)):
             Log.trace(e.__traceback__)
     except Exception as e:
-        Log.error(f'Unexpected error, could be internet...\nscraper:{config.scraper_name} {type(e).__name__}\n{e}')
+        summary['error'] = f'{type(e).__name__}: {e}'
+        Log.error(f'Unexpected error, could be internet...\nscraper:{summary["scraper"]} {type(e).__name__}\n{e}')
         Log.trace(e.__traceback__)
+    if checkpoint is not None:
+        summary['entries_done'] = sum(state['done'] for state in checkpoint.entries.values())
+        summary['rows'] = sum(state['rows'] for state in checkpoint.entries.values())
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    return summary
+
+def get_shard_name(job_name: str, entry_url: str, attempt: int) -> str:
+    ''' Returns: Output name of the shard the lease of given attempt writes for entry_url. Each
+        lease writes its own shard, so a worker that lost its lease cannot write to the shard
+        of the worker that retook the entry. '''
+    return f'{job_name}_shards/{hashlib.sha1(entry_url.encode("utf-8")).hexdigest()[:16]}/attempt-{attempt}'
+
+def seed_shard(job: Job, settings: Settings) -> bool:
+    ''' Purpose: Copies the shard of the latest earlier attempt of job that left a checkpoint
+        journal to the shard of this attempt, for it to be resumed. The journal is copied
+        first, so the offsets it commits never exceed the copied outputs even if a worker
+        is still writing the earlier shard. Returns: Boolean True if a shard was copied. '''
+    shard_base = f'{settings.OUTPUT_DIRECTORY}{get_shard_name(job.job_name, job.entry_url, job.attempts)}'
+    for attempt in range(job.attempts - 1, 0, -1):
+        earlier_base = f'{settings.OUTPUT_DIRECTORY}{get_shard_name(job.job_name, job.entry_url, attempt)}'
+        if not os.path.exists(f'{earlier_base}.checkpoint'):
+            continue
+        shard_dir, earlier_name = os.path.split(earlier_base)
+        shutil.copyfile(f'{earlier_base}.checkpoint', f'{shard_base}.checkpoint')
+        for name in os.listdir(shard_dir):
+            if name.startswith(f'{earlier_name}.') and name != f'{earlier_name}.checkpoint':
+                copy = shutil.copytree if os.path.isdir(f'{shard_dir}/{name}') else shutil.copyfile
+                copy(f'{shard_dir}/{name}', f'{shard_base}{name[len(earlier_name):]}')
+        return True
+    return False
+
+def enqueue_launch(config_file: str, job_name: str, settings: Settings):
+    ''' Purpose: Adds every entry of config file to the shared job queue under job_name. '''
+    config = Config(config_file)
+    scraper = ScraperBuilder.build(f'scrapers.{config.scraper_name}')
+    with JOB_QUEUES[settings.JOB_QUEUE_BACKEND](settings) as queue:
+        queue.enqueue(job_name, config.scraper_name, config.get_lines(scraper.validators.validate_url))
+        Log.status(f'Queued {config_file} as {job_name}: {queue.status(job_name)}')
+
+@contextmanager
+def keep_lease(queue: BaseJobQueue, job: Job, worker_id: str):
+    ''' Purpose: Renews the lease of job from a background thread whilst the wrapped scrape runs,
+        yielding an Event set if a renewal fails and the lease is lost. '''
+    stop, lost = Event(), Event()
+    def heartbeat():
+        while not stop.wait(queue.lease_seconds / 3):
+            if not queue.heartbeat(job, worker_id):
+                Log.warn(f'Lost lease of {job.entry_name}, another worker may retake it...')
+                lost.set()
+                return
+    thread = Thread(target=heartbeat, daemon=True)
+    thread.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        thread.join()
+
+def scrape_shard(browser: LazyBrowser, job: Job, settings: Settings, limiter: RateLimiter, pool: Optional[BrowserPool], lease_lost: Event):
+    ''' Purpose: Scrapes one leased entry into the shard output of its lease, stopping before
+        the next page is saved once lease_lost is set. A shard left by an earlier failed
+        attempt is copied and resumed from its checkpoint journal. '''
+    scraper = ScraperBuilder.build(f'scrapers.{job.scraper_name}')
+    shard_name = get_shard_name(job.job_name, job.entry_url, job.attempts)
+    os.makedirs(os.path.dirname(f'{settings.OUTPUT_DIRECTORY}{shard_name}'), exist_ok=True)
+    checkpoint = Checkpoint(shard_name, settings)
+    resume = seed_shard(job, settings)
+    if resume:
+        checkpoint.load()
+    else:
+        checkpoint.start(job.job_name)
+    with open_scrape_run(scraper, shard_name, settings, checkpoint, resume, pool, limiter, lease_lost) as run:
+        scrape_entry(browser, run, job.entry_name, job.entry_url)
+
+def queue_worker(queue: BaseJobQueue, job_name: str, settings: Settings, worker_id: str, limiter: RateLimiter, pool: Optional[BrowserPool], stop: Event) -> int:
+    ''' Purpose: Leases and scrapes entries of job_name until none are pending or leased. A
+        failed entry is released back to the queue for retry. Browser sessions are kept per
+        language across entries. Returns: Number of leases lost and entries failed on their
+        last attempt by this worker. '''
+    failures = 0
+    with ExitStack() as stack:
+        browsers: Dict[str, LazyBrowser] = {}
+        while not stop.is_set():
+            job = queue.lease(job_name, worker_id)
+            if job is None:
+                counts = queue.status(job_name)
+                if not counts['pending'] and not counts['leased']:
+                    return failures
+                stop.wait(settings.JOB_POLL_SECONDS)
+                continue
+            Log.status(f'Leased {job.entry_name}, attempt {job.attempts}')
+            try:
+                language = ScraperBuilder.build(f'scrapers.{job.scraper_name}').parsers.browser_lang
+                if language not in browsers:
+                    browsers[language] = stack.enter_context(LazyBrowser(language=language, settings=settings, pool=pool))
+                with keep_lease(queue, job, worker_id) as lease_lost:
+                    scrape_shard(browsers[language], job, settings, limiter, pool, lease_lost)
+                if lease_lost.is_set():
+                    raise SE.LeaseLost(f'Lost lease of {job.entry_name} before it was marked done...')
+                queue.complete(job, worker_id)
+            except KeyboardInterrupt:
+                queue.fail(job, worker_id, 'KeyboardInterrupt')
+                raise
+            except Exception as e:
+                Log.alert(f'Failed {job.entry_name} on attempt {job.attempts}: {type(e).__name__}\n{e}')
+                queue.fail(job, worker_id, f'{type(e).__name__}: {e}')
+                if isinstance(e, SE.LeaseLost) or job.attempts >= queue.max_attempts:
+                    failures += 1
+    return failures
+
+def work_launch(job_name: str, settings: Settings, pool: Optional[BrowserPool] = None) -> int:
+    ''' Purpose: Runs MAX_WORKERS queue workers in this process on the entries of job_name.
+        Returns: Number of leases lost and entries failed on their last attempt by the workers. '''
+    worker_id = f'{socket.gethostname()}-{os.getpid()}'
+    limiter = RateLimiter(settings)
+    stop = Event()
+    with (JOB_QUEUES[settings.JOB_QUEUE_BACKEND](settings) as queue,
+          ThreadPoolExecutor(max_workers=settings.MAX_WORKERS) as executor):
+        Log.info(f'Running {settings.MAX_WORKERS} queue workers as {worker_id}...')
+        futures = [executor.submit(queue_worker, queue, job_name, settings, f'{worker_id}-{idx}', limiter, pool, stop)
+                   for idx in range(settings.MAX_WORKERS)]
+        failures = 0
+        try:
+            for future in as_completed(futures):
+                failures += future.result()
+        except BaseException:
+            stop.set()
+            raise
+        Log.status(f'Queue {job_name} finished: {queue.status(job_name)}')
+    if failures:
+        Log.alert(f'{failures} entries of {job_name} failed or lost their lease in this process')
+    return failures
+
+def merge_launch(job_name: str, settings: Settings) -> bool:
+    ''' Purpose: Combines the shard outputs of every entry of job_name, in config order, into
+        a single job_name output. Returns: Boolean True if merged, False if entries remain. '''
+    with JOB_QUEUES[settings.JOB_QUEUE_BACKEND](settings) as queue:
+        entries = queue.get_entries(job_name)
+    unfinished = [f'{entry_name} ({state})' for entry_name, _, state, _ in entries if state != 'done']
+    if not entries or unfinished:
+        Log.alert(f'Cannot merge {job_name}, entries not done: {", ".join(unfinished) or "none queued"}')
+        return False
+    output_format = OUTPUT_FORMATS[settings.OUTPUT_FORMAT]
+    # Only the shard of the lease that completed an entry holds its rows
+    shard_bases = [f'{settings.OUTPUT_DIRECTORY}{get_shard_name(job_name, entry_url, attempts)}' for _, entry_url, _, attempts in entries]
+    output_format(f'{settings.OUTPUT_DIRECTORY}{job_name}').merge([output_format(base) for base in shard_bases])
+    shard_dumps = [f'{base}.dump.txt' for base in shard_bases if os.path.exists(f'{base}.dump.txt')]
+    # Like a single run, only leave a dump file when raw data was dumped
+    if settings.DUMP_RAW_DATA or shard_dumps:
+        with open(f'{settings.OUTPUT_DIRECTORY}{job_name}.dump.txt', 'wb') as dump:
+            for shard_dump in shard_dumps:
+                with open(shard_dump, 'rb') as file:
+                    shutil.copyfileobj(file, dump)
+    Log.status(f'Merged {len(entries)} shards into {job_name}')
+    return True
+
+def reparse_page(archive_base: str, page: ArchivedPage, scraper: Scraper, settings: Settings) -> Sequence[Sequence[str]]:
+    ''' Returns: data_blocks of an archived page, read through the process mapped archive. '''
+    return extract_data(get_reader(archive_base).read(page), scraper, settings)
+
+def reparse_launch(archive_name: str, output_name: str, settings: Settings) -> Dict:
+    ''' Purpose: Re-parses every page archived by the ARCHIVE_PAGES run archive_name into a
+        new output_name without a browser or network. Pages are parsed across PARSE_WORKERS
+        processes, or every core if PARSE_WORKERS is 0, and saved in entry and page order.
+        Returns: Summary of the re-parse, as scrape_launch returns for a run. '''
+    archive_base = f'{settings.OUTPUT_DIRECTORY}{archive_name}'
+    summary = {'config': None, 'output': output_name, 'scraper': None, 'status': 'failed',
+               'error': None, 'entries_done': 0, 'rows': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+    try:
+        with PageArchiveReader(archive_base) as reader:
+            summary['scraper'] = reader.scraper_name
+            pages = reader.get_pages()
+        scraper = ScraperBuilder.build(f'scrapers.{summary["scraper"]}')
+        workers = settings.PARSE_WORKERS or os.cpu_count() or 1
+        Log.status(f'Re-parsing {len(pages)} archived pages of {archive_name} with {workers} processes...')
+        parse_page = partial(reparse_page, archive_base, scraper=scraper, settings=settings)
+        with (ProcessPoolExecutor(max_workers=workers) as executor,
+              OutputWriter(output_name, settings, None, get_schema(scraper)) as writer,
+              tqdm(total=len(pages)) as pbar):
+            for page, page_blocks in zip(pages, executor.map(parse_page, pages, chunksize=8)):
+                save_data(scraper, writer, page.entry_name, page.entry_url, page_blocks)
+                summary['rows'] += len(page_blocks)
+                pbar.update(1)
+        summary['entries_done'] = len({page.entry_url for page in pages})
+        summary['status'] = 'success'
+        Log.status(f'Re-parsed {summary["rows"]} reviews into {output_name}')
+    except KeyboardInterrupt:
+        raise KeyboardInterrupt
+    except (FileNotFoundError, SE.InvalidConfigFile, SE.UnexpectedData, SE.BadScraper) as e:
+        summary['error'] = f'{type(e).__name__}: {e.args[0] if e.args else e}'
+        Log.alert(f'{e.args[0]}\nScraper:{summary["scraper"]} {type(e).__name__}')
+    except (OSError, ValueError) as e:
+        # Unreadable archive files, such as a data file that cannot be memory mapped
+        summary['error'] = f'{type(e).__name__}: {e}'
+        Log.alert(f'Could not read page archive {archive_name}: {e}\nScraper:{summary["scraper"]} {type(e).__name__}')
+    summary['seconds'] = round(time.perf_counter() - start, 3)
+    return summary
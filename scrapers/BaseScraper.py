@@ -1,14 +1,37 @@
 ''' Created: 10/09/2023 '''
 
 # External Dependencies
-from selenium.webdriver.remote.webdriver import WebDriver, WebElement
-from bs4 import BeautifulSoup
-import re
+from selenium.common.exceptions import TimeoutException
+import json, re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Union
+from typing import TYPE_CHECKING, Callable, List, Dict, NamedTuple, Optional, Pattern, Tuple, Union
+from itertools import compress, count
+if TYPE_CHECKING:
+    # Selenium and BeautifulSoup are only imported once a browser or soup parse is used
+    from selenium.webdriver.remote.webdriver import WebDriver, WebElement
+    from bs4 import BeautifulSoup
+    from utilities.selenium_handler import BrowserTab
 
 # Internal Dependencies
 from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.data_block import DataBlock
+
+class TextTag(NamedTuple):
+    ''' Declares a page element of interest for BaseParsers.text_tags. '''
+    name: str
+    ''' name: Tag name of the element, e.g. span. '''
+    attr: Optional[str] = None
+    ''' attr: If given, the element attribute to extract instead of element text. '''
+    contains: Optional[str] = None
+    ''' contains: If given, only elements whose attr value contains this string match. '''
+    def matches(self, name: str, attrs: Dict[str, str]) -> bool:
+        ''' Returns: Boolean True if an element of given name and attrs is of interest. '''
+        if self.name != name:
+            return False
+        if self.attr is None:
+            return True
+        value = attrs.get(self.attr)
+        return value is not None and (self.contains is None or self.contains in value)
 
 class BaseValidators(ABC):
     ''' Base class for scraper-specific validators. '''
@@ -16,6 +39,8 @@ class BaseValidators(ABC):
     # Expected sibling Validators class values:
     url_pattern: str
     ''' url_pattern: Regex used to verify url for particular scraper. '''
+    url_regex: Pattern
+    ''' url_regex: Compiled url_pattern, set when the sibling class is defined. '''
 
     # Expected sibling Validators class functions:
     @abstractmethod
@@ -24,14 +49,32 @@ class BaseValidators(ABC):
 
     # Sibling instance inherited BaseParsers class methods:
     def validate_url(self, url: str) -> None:
-        if not re.compile(self.url_pattern).match(url):
+        if not self.url_regex.match(url):
             raise SE.InvalidConfigFile(f'JSON contains invalid URL format: {url}\n Given: {self.url_pattern}')
 
     # Enforce BaseValidators class attributes and abstract methods in sibling class:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        check_required_class_attributes(BaseValidators, cls)
+        check_required_class_attributes(BaseValidators, cls, ['url_regex'])
         check_required_abstract_methods(BaseValidators, cls)
+        cls.url_regex = re.compile(cls.url_pattern)
+
+# Browser script returning, as a JSON string, the texts of elements matching the TextTag
+# fields given in arguments[0], in document order, as BaseParsers.extract_tagged_text does.
+EXTRACT_TAGGED_TEXT_SCRIPT = '''
+const textTags = arguments[0];
+const selector = Array.from(new Set(textTags.map(textTag => textTag[0]))).join(',');
+const texts = [];
+for (const element of document.querySelectorAll(selector)) {
+    for (const [name, attr, contains] of textTags) {
+        if (element.localName !== name) continue;
+        if (attr === null) { texts.push(element.textContent); break; }
+        const value = element.getAttribute(attr);
+        if (value !== null && (contains === null || value.includes(contains))) { texts.push(value); break; }
+    }
+}
+return JSON.stringify(texts);
+'''
 
 class BaseParsers(ABC):
     ''' Base class for scraper-specific Parsers. '''
@@ -41,17 +84,33 @@ class BaseParsers(ABC):
     ''' browser_lang: Language code for Chrome browser session. https://cloud.google.com/speech-to-text/docs/languages '''
     text_pattern: str
     ''' text_pattern: Regex used to spot data blocks inside texts list. '''
+    text_regex: Pattern
+    ''' text_regex: Compiled text_pattern, set when the sibling class is defined. '''
+    joined_text_regex: Optional[Pattern]
+    ''' joined_text_regex: text_pattern compiled for newline joined texts, None if the pattern
+        could see past a text boundary with lookarounds or string anchors, set with text_regex. '''
+    joined_text_lead: int
+    ''' joined_text_lead: Number of newlines joined_text_regex matches ahead of a text, set with text_regex. '''
     text_idx: int
     ''' text_idx: Integer for expected_text index in data block. '''
     data_length: int
     ''' data_length: Integer for how many indexs long a data block is. '''
 
+    # Optional sibling Parsers class values:
+    data_fields: Dict[str, type] = {}
+    ''' data_fields: Ordered column names and types parse_data_block returns, a static output schema. '''
+    text_tags: Tuple[TextTag, ...] = ()
+    ''' text_tags: Elements extract_page_text reads, lets the controller skip the soup parse. '''
+    browser_script: str = ''
+    ''' browser_script: Browser script returning the page texts list as a JSON string, used by
+        extract_browser_text in place of the script generated from text_tags. '''
+
     # Expected sibling Parsers class functions:
     @abstractmethod
-    def extract_total_count(self, driver: WebDriver) -> int:
+    def extract_total_count(self, driver: 'WebDriver') -> int:
         ''' Returns: Total number of data blocks to be extracted for current entry URL. '''
     @abstractmethod
-    def extract_page_text(self, soup: BeautifulSoup) -> List[str]:
+    def extract_page_text(self, soup: 'BeautifulSoup') -> List[str]:
         ''' Returns: List of HTML element texts strings extracted from page soup. '''
     @abstractmethod
     def parse_data_block(self, block: List[str]) -> Dict[str, Union[int, str]]:
@@ -59,39 +118,199 @@ class BaseParsers(ABC):
 
     # Sibling instance inherited BaseParsers class methods:
     def extract_data_indices(self, texts: List[str]) -> List[int]:
-        ''' Returns: List of indices of relevant data blocks in text list. '''
-        return [i for i, x in enumerate(texts) if re.search(self.text_pattern, x)]
-    def extract_data_bounds(self, idx: int) -> Dict[str, int]:
-        ''' Returns: Dict of start and end indices for relevant data block in list. '''
-        start_idx = idx - self.text_idx
-        end_idx = idx + self.data_length - self.text_idx
-        return {"start_idx": start_idx, "end_idx": end_idx}
-    def extract_data_block(self, texts: List[str], data_bounds: Dict[str, int]) -> List[str]:
-        ''' Returns: List of data blocks from full list of text. '''
-        return texts[data_bounds['start_idx']:data_bounds['end_idx']]
+        ''' Returns: List of indices of relevant data blocks in text list, located with one
+            finditer over the newline joined texts. Searches text by text instead when a text
+            holds a newline or a match runs across texts, as joined results could then differ. '''
+        joined = '\n' + '\n'.join(texts)
+        if self.joined_text_regex is None or joined.count('\n') != len(texts):
+            return list(compress(count(), map(self.text_regex.search, texts)))
+        lead = self.joined_text_lead
+        indices = []
+        text_idx, position = -1, 0
+        for match in self.joined_text_regex.finditer(joined, 1 - lead):
+            start, end = match.start() + lead, match.end()
+            if joined.find('\n', start, end) != -1:
+                return list(compress(count(), map(self.text_regex.search, texts)))
+            text_idx += joined.count('\n', position, start)
+            position = start
+            if not indices or indices[-1] != text_idx:
+                indices.append(text_idx)
+        return indices
+    def extract_data_bounds_batch(self, texts: List[str]) -> Tuple[List[int], List[int]]:
+        ''' Returns: Parallel lists of start and end indices of every data block in text list,
+            located in a single pass over texts. '''
+        indices = self.extract_data_indices(texts)
+        start_offset, end_offset = self.text_idx, self.data_length - self.text_idx
+        return [idx - start_offset for idx in indices], [idx + end_offset for idx in indices]
+    def extract_data_block(self, texts: List[str], start_idx: int, end_idx: int) -> DataBlock:
+        ''' Returns: DataBlock view of one data block in the full list of text. '''
+        return DataBlock(texts, start_idx, end_idx)
+    def extract_tagged_text(self, soup: 'BeautifulSoup') -> List[str]:
+        ''' Returns: Texts of declared text_tags elements in page soup, in document order. '''
+        names = list(dict.fromkeys(text_tag.name for text_tag in self.text_tags))
+        result = []
+        for element in soup.find_all(names):
+            text_tag = next((text_tag for text_tag in self.text_tags if text_tag.matches(element.name, element.attrs)), None)
+            if text_tag is not None:
+                result.append(element[text_tag.attr] if text_tag.attr else element.get_text())
+        return result
+    def has_browser_text(self) -> bool:
+        ''' Returns: Boolean True if page texts can be extracted in the browser. '''
+        return bool(self.browser_script or self.text_tags)
+    def extract_browser_text(self, driver: 'WebDriver') -> List[str]:
+        ''' Returns: Page texts list extracted inside the browser, by browser_script if declared
+            else by a script generated from text_tags, so page source is never transferred. '''
+        if self.browser_script:
+            result = driver.execute_script(self.browser_script)
+        else:
+            result = driver.execute_script(EXTRACT_TAGGED_TEXT_SCRIPT, [list(text_tag) for text_tag in self.text_tags])
+        texts = json.loads(result) if isinstance(result, str) else result
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise SE.UnexpectedData(f'Browser text extraction returned {type(texts).__name__}, expected a list of strings.')
+        return texts
     
     # Enforce BaseParsers class attributes and abstract methods in sibling class:
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        check_required_class_attributes(BaseParsers, cls)
+        check_required_class_attributes(BaseParsers, cls, ['text_regex', 'joined_text_regex', 'joined_text_lead'])
         check_required_abstract_methods(BaseParsers, cls)
+        cls.text_regex = re.compile(cls.text_pattern)
+        # MULTILINE ^ and $ anchor at each text of the joined texts, \A, \Z and lookarounds do not
+        crosses_texts = re.search(r'\\[AZ]|\(\?<?[=!]', cls.text_pattern)
+        # Leading a text start anchored pattern with its newline gives finditer a literal prefix to seek
+        cls.joined_text_lead = int(cls.text_pattern.startswith('^') and '|' not in cls.text_pattern)
+        joined_pattern = '\n(?:' + cls.text_pattern + ')' if cls.joined_text_lead else cls.text_pattern
+        cls.joined_text_regex = None if crosses_texts else re.compile(joined_pattern, re.MULTILINE)
+
+# Browser script watching the texts of elements matching arguments[0] for a change.
+ARM_PAGE_CHANGE_SCRIPT = '''
+const selector = arguments[0];
+const signature = () => Array.from(document.querySelectorAll(selector), e => e.textContent).join('\\u001f');
+if (window.__pageChange) window.__pageChange.observer.disconnect();
+const state = window.__pageChange = {old: signature(), changed: false, done: null};
+state.observer = new MutationObserver(() => {
+    if (signature() === state.old) return;
+    state.changed = true;
+    state.observer.disconnect();
+    if (state.done) { delete window.__pageChange; state.done(true); }
+});
+state.observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+'''
+
+# Async browser script resolving true once the armed watch sees a change, or once elements
+# matching arguments[0] exist if a full navigation replaced the window, else false on timeout.
+WAIT_PAGE_CHANGE_SCRIPT = '''
+const [selector, timeout, done] = arguments;
+const state = window.__pageChange;
+if (state === undefined) {
+    const ready = () => document.querySelector(selector) !== null;
+    if (ready()) return done(true);
+    const observer = new MutationObserver(() => { if (ready()) { observer.disconnect(); done(true); } });
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    setTimeout(() => { observer.disconnect(); done(false); }, timeout);
+    return;
+}
+if (state.changed) { delete window.__pageChange; return done(true); }
+state.done = done;
+setTimeout(() => { state.done = null; done(false); }, timeout);
+'''
+
+# Browser script returning true once the watch armed by arm_page_change has seen a change, or
+# once elements matching arguments[0] exist if a full navigation replaced the window.
+POLL_PAGE_CHANGE_SCRIPT = '''
+const state = window.__pageChange;
+if (state === undefined) return document.querySelector(arguments[0]) !== null;
+if (!state.changed) return false;
+delete window.__pageChange;
+return true;
+'''
+
+# Browser script returning true once the document has loaded and its elements have not
+# changed for arguments[0] milliseconds, watching mutations from its first call.
+POLL_PAGE_SETTLED_SCRIPT = '''
+const state = window.__pageSettle;
+if (state === undefined) {
+    const watch = window.__pageSettle = {last: Date.now()};
+    watch.observer = new MutationObserver(() => { watch.last = Date.now(); });
+    watch.observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    return false;
+}
+if (document.readyState !== 'complete' || Date.now() - state.last < arguments[0]) return false;
+state.observer.disconnect();
+delete window.__pageSettle;
+return true;
+'''
 
 class BaseNavigators(ABC):
     ''' Base class for scraper-specific Navigators. '''
 
     # Expected sibling Navigators class functions:
     @abstractmethod
-    def check_next_page(self, driver: WebDriver) -> bool:
+    def check_next_page(self, driver: 'WebDriver') -> bool:
         ''' Returns: Boolean True or False if there is a next subpage. '''
     @abstractmethod
-    def grab_next_page(self, driver: WebDriver) -> None:
+    def grab_next_page(self, driver: 'WebDriver') -> None:
         ''' Purpose: Navigates driver to the next subpage for scraping. '''
     @abstractmethod
-    def wait_for_entry(self, driver: WebDriver) -> None:
+    def wait_for_entry(self, driver: 'WebDriver') -> None:
         ''' Purpose: Waits for the entry URL webpage contents to load. '''
     @abstractmethod
-    def wait_for_page(self, driver: WebDriver) -> None:
+    def wait_for_page(self, driver: 'WebDriver') -> None:
+        ''' Purpose: Waits for the contents of the next subpage to update. '''
+
+    # Sibling instance inherited BaseNavigators class methods:
+    def arm_page_change(self, driver: 'WebDriver', selector: str) -> None:
+        ''' Purpose: Starts an in-browser watch on the texts of CSS selector elements. Call
+            before navigating so wait_for_page_change cannot miss a fast update. '''
+        driver.execute_script(ARM_PAGE_CHANGE_SCRIPT, selector)
+    def wait_for_page_change(self, driver: 'WebDriver', selector: str, timeout: int = 40) -> None:
+        ''' Purpose: Waits in a single browser call for the watch started by arm_page_change
+            to see the CSS selector element texts change, rather than polling them. '''
+        driver.set_script_timeout(timeout + 5)
+        if not driver.execute_async_script(WAIT_PAGE_CHANGE_SCRIPT, selector, timeout * 1000):
+            raise TimeoutException(f'Texts of {selector} elements did not change within {timeout} seconds.')
+
+    # Optional sibling Navigators class coroutines, used when scraping with TABS_PER_BROWSER
+    # tabs. The waits default to polling the tab until its page settles, then running the
+    # sync wait as one tab command, which holds the browser only briefly once the page is
+    # ready. Override waits with the async helpers below to wait on the exact condition.
+    async def check_next_page_async(self, tab: 'BrowserTab') -> bool:
+        ''' Returns: Boolean True or False if there is a next subpage. '''
+        return await tab.run(self.check_next_page)
+    async def grab_next_page_async(self, tab: 'BrowserTab') -> None:
+        ''' Purpose: Navigates tab to the next subpage for scraping. '''
+        await tab.run(self.grab_next_page)
+    async def wait_for_entry_async(self, tab: 'BrowserTab') -> None:
+        ''' Purpose: Waits for the entry URL webpage contents to load. '''
+        await self.wait_settled_then_run(tab, self.wait_for_entry)
+    async def wait_for_page_async(self, tab: 'BrowserTab') -> None:
         ''' Purpose: Waits for the contents of the next subpage to update. '''
+        await self.wait_settled_then_run(tab, self.wait_for_page)
+
+    # Sibling instance inherited BaseNavigators class coroutines:
+    async def wait_for_element_async(self, tab: 'BrowserTab', selector: str, timeout: int = 40) -> None:
+        ''' Purpose: Waits for an element matching CSS selector to exist, polling the tab. '''
+        await tab.poll('return document.querySelector(arguments[0]) !== null;', timeout,
+                       f'No {selector} element appeared within {timeout} seconds.', selector)
+    async def wait_for_settled_async(self, tab: 'BrowserTab', quiet: float = 0.5, timeout: int = 40) -> None:
+        ''' Purpose: Waits for the tab document to load and its elements to stop changing for
+            quiet seconds, polling the tab. '''
+        await tab.poll(POLL_PAGE_SETTLED_SCRIPT, timeout,
+                       f'Page did not settle within {timeout} seconds.', int(quiet * 1000))
+    async def wait_settled_then_run(self, tab: 'BrowserTab', wait: Callable[['WebDriver'], None]) -> None:
+        ''' Purpose: Runs the sync wait as one tab command once the page has settled, so it
+            rarely holds the browser from the other tabs. A page that never settles is
+            left to the sync wait alone. '''
+        try:
+            await self.wait_for_settled_async(tab)
+        except TimeoutException:
+            pass
+        await tab.run(wait)
+    async def wait_for_page_change_async(self, tab: 'BrowserTab', selector: str, timeout: int = 40) -> None:
+        ''' Purpose: Async counterpart of wait_for_page_change, polling the watch started by
+            arm_page_change rather than holding the browser until it fires. '''
+        await tab.poll(POLL_PAGE_CHANGE_SCRIPT, timeout,
+                       f'Texts of {selector} elements did not change within {timeout} seconds.', selector)
     
     # Enforce BaseNavigators class attributes and abstract methods in sibling class:
     def __init_subclass__(cls, **kwargs):
@@ -99,9 +318,37 @@ class BaseNavigators(ABC):
         check_required_class_attributes(BaseNavigators, cls)
         check_required_abstract_methods(BaseNavigators, cls)
 
-def check_required_class_attributes(base_class, sub_class):
-    ''' Purpose: Validates that sibling of given class contains all class level attributes. '''
-    base_attrs = {k: v for k, v in base_class.__annotations__.items() if not callable(v) and not k.startswith('_')}
+class BaseFetchers(ABC):
+    ''' Base class for optional scraper-specific Fetchers, used to scrape server rendered
+        entry pages over plain HTTP without a browser. '''
+
+    # Expected sibling Fetchers class functions:
+    @abstractmethod
+    def build_page_url(self, entry_url: str, page_idx: int) -> str:
+        ''' Returns: URL of the given zero based subpage of entry URL. '''
+    @abstractmethod
+    def check_next_page(self, page_html: str) -> bool:
+        ''' Returns: Boolean True or False if the fetched subpage has a next subpage. '''
+    @abstractmethod
+    def extract_total_count(self, page_html: str) -> int:
+        ''' Returns: Total number of data blocks to be extracted for entry URL. '''
+
+    # Sibling instance inherited BaseFetchers class methods:
+    def needs_browser(self, page_html: str) -> bool:
+        ''' Returns: Boolean True if the fetched entry page lacks data only rendered by
+            JavaScript, so the entry must fall back to Selenium. Override as needed. '''
+        return False
+
+    # Enforce BaseFetchers class attributes and abstract methods in sibling class:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        check_required_class_attributes(BaseFetchers, cls)
+        check_required_abstract_methods(BaseFetchers, cls)
+
+def check_required_class_attributes(base_class, sub_class, derived: List[str] = []):
+    ''' Purpose: Validates that sibling of given class contains all class level attributes.
+        Pass in derived list of attributes the base class sets itself to skip them. '''
+    base_attrs = {k: v for k, v in base_class.__annotations__.items() if not callable(v) and not k.startswith('_') and k not in derived}
     for attr, _ in base_attrs.items():
         if getattr(sub_class, attr, None) is None:
             raise NotImplementedError(f'Class {sub_class.__name__} must define the {attr} class variable.')
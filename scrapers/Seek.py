@@ -1,29 +1,73 @@
 ''' Created: 10/09/2023 '''
 
 # External Dependencies
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import StaleElementReferenceException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver, WebElement
-from bs4 import BeautifulSoup
 import re
-from typing import List, Dict, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Tuple, Union
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver, WebElement
+    from bs4 import BeautifulSoup
+    from utilities.selenium_handler import BrowserTab
 
 # Internal Dependencies
 from utilities.custom_exceptions import ScraperExceptions as SE
-from scrapers.BaseScraper import BaseValidators, BaseParsers, BaseNavigators
+from scrapers.BaseScraper import BaseValidators, BaseParsers, BaseNavigators, BaseFetchers, TextTag
+
+# Rating column names paired with the block index or the label text two indexes before it.
+RATINGS = (
+    ('overall_rating', 0),
+    ('benefits_perks_rating', 'Benefits & perks'),
+    ('career_development_rating', 'Career development'),
+    ('work_life_balance_rating', 'Work-life balance'),
+    ('working_environment_rating', 'Working environment'),
+    ('management_rating', 'Management'),
+    ('diversity_equal_opportunity_rating', 'Diversity & equal opportunity')
+)
+
+STATE_MAPPINGS = {
+    'VIC': ['VIC', 'Victoria'],
+    'NSW': ['NSW', 'New South Wales'],
+    'QLD': ['QLD', 'Queensland'],
+    'SA': ['SA', 'South Australia'],
+    'WA': ['WA', 'Western Australia'],
+    'TAS': ['TAS', 'Tasmania'],
+    'NT': ['NT', 'Northern Territory'],
+    'ACT': ['ACT', 'Australian Capital Territory']
+}
+STATE_KEYS = {name: key for key, names in STATE_MAPPINGS.items() for name in names + [name.lower() for name in names]}
+# Zero width lookahead so every bounded state name is found, even where names overlap.
+STATE_PATTERN = re.compile(r'(?=\b(' + '|'.join(re.escape(name) for name in STATE_KEYS) + r')\b)')
+POSTCODE_PATTERN = re.compile(r'(\s|^)(\d{4})$')
+
+@lru_cache(maxsize=4096)
+def parse_location(location: str) -> Tuple[str, str, str]:
+    ''' Returns: Location, comma separated states mentioned in location, and postcode. '''
+    postcode_match = POSTCODE_PATTERN.search(location)
+    postcode = postcode_match.group(2) if postcode_match else ''
+    keys_found = {STATE_KEYS[match.group(1)] for match in STATE_PATTERN.finditer(location)}
+    states_found = [key for key in STATE_MAPPINGS if key in keys_found]
+    return location, ', '.join(states_found), postcode
+
+def parse_years_in_role(role_str: str) -> str:
+    ''' Returns: Years in role range string, such as <1, 1-2, or >12. '''
+    if 'Less than 1' in role_str:
+        return '<1'
+    elif 'More than 12' in role_str: 
+        return '>12'
+    elif 'to' in role_str:
+        return role_str.split(' ')[0] + '-' + role_str.split(' ')[2]
+    else:
+        return ''
 
 class Validators(BaseValidators):
 
     url_pattern = r'https?://www\.seek\.com\.au/companies/.+/reviews'
+    year_pattern = re.compile(r'\d{4}')
 
     def validate_data_block(self, block: List) -> None:
         try:
-            year_pattern = re.compile(r"\d{4}")
             data_year_idx = 21
-            if not year_pattern.match((block[data_year_idx].split()[1])):
+            if not self.year_pattern.match((block[data_year_idx].split()[1])):
                 raise SE.UnexpectedData(f'Expected year at second block index:\n{block}')
             challenge_text = 'The challenges'
             data_challenge_idx = 27
@@ -38,77 +82,51 @@ class Parsers(BaseParsers):
     text_pattern = r'^The good things$'
     text_idx = 25
     data_length = 29
+    data_fields = {
+        'overall_rating': int,
+        'benefits_perks_rating': int,
+        'career_development_rating': int,
+        'work_life_balance_rating': int,
+        'working_environment_rating': int,
+        'management_rating': int,
+        'diversity_equal_opportunity_rating': int,
+        'job_role': str,
+        'review_month': str,
+        'review_year': int,
+        'review_location': str,
+        'review_states': str,
+        'review_postcode': str,
+        'years_in_role': str,
+        'employment_status': str,
+        'review_title': str,
+        'review_pros': str,
+        'review_cons': str
+    }
+    text_tags = (
+        TextTag('span'),
+        TextTag('h3'),
+        TextTag('div', attr='aria-label', contains='out of 5')
+    )
 
-    def extract_total_count(self, driver: WebDriver) -> int:
+    def extract_total_count(self, driver: 'WebDriver') -> int:
+        from selenium.webdriver.common.by import By
         total_element = driver.find_element(By.XPATH, '//strong[following-sibling::text()[contains(., "reviews sorted by")]]')
         total_str = total_element.text
         return int(total_str.strip())
     
-    def extract_page_text(self, soup: BeautifulSoup) -> List[str]:
-        elements = soup.find_all(
-        lambda tag: (tag.name in ['span', 'h3']) or 
-                    (tag.name == 'div' and 'out of 5' in tag.get('aria-label', ''))
-        )
-        result = []
-        for element in elements:
-            if element.name in ['span', 'h3']:
-                result.append(element.get_text())
-            else:
-                result.append(element['aria-label'])
-        return result
+    def extract_page_text(self, soup: 'BeautifulSoup') -> List[str]:
+        return self.extract_tagged_text(soup)
     
     def parse_data_block(self, block: List[str]) -> Dict[str, Union[int, str]]:
-        def parse_location(location: str):
-            state_mappings = {
-                'VIC': ['VIC', 'Victoria'],
-                'NSW': ['NSW', 'New South Wales'],
-                'QLD': ['QLD', 'Queensland'],
-                'SA': ['SA', 'South Australia'],
-                'WA': ['WA', 'Western Australia'],
-                'TAS': ['TAS', 'Tasmania'],
-                'NT': ['NT', 'Northern Territory'],
-                'ACT': ['ACT', 'Australian Capital Territory']
-            }
-            for key in state_mappings:
-                state_mappings[key].extend([name.lower() for name in state_mappings[key]])
-            postcode_match = re.search(r'(\s|^)(\d{4})$', location)
-            postcode = postcode_match.group(2) if postcode_match else ''
-            states_found = []
-            for key, names in state_mappings.items():
-                for name in names:
-                    if name in location:
-                        # Check for the exact word or the abbreviation bounded by non-word characters or start/end of string
-                        if re.search(r'\b' + re.escape(name) + r'\b', location):
-                            states_found.append(key)
-                            break
-            return location, ', '.join(states_found), postcode
-        def parse_years_in_role(role_str: str) -> str:
-            if 'Less than 1' in role_str:
-                return '<1'
-            elif 'More than 12' in role_str: 
-                return '>12'
-            elif 'to' in role_str:
-                return role_str.split(' ')[0] + '-' + role_str.split(' ')[2]
-            else:
-                return ''
-        ratings = [
-            ('overall_rating', 0),
-            ('benefits_perks_rating', 'Benefits & perks'),
-            ('career_development_rating', 'Career development'),
-            ('work_life_balance_rating', 'Work-life balance'),
-            ('working_environment_rating', 'Working environment'),
-            ('management_rating', 'Management'),
-            ('diversity_equal_opportunity_rating', 'Diversity & equal opportunity')
-        ]
-        location_data = parse_location(block[-7])
-        parsed_data = {key: int(block[block.index(val)+2][0] if isinstance(val, str) else block[val][0]) for key, val in ratings}
+        location, states, postcode = parse_location(block[-7])
+        parsed_data = {key: int(block[block.index(val)+2][0] if isinstance(val, str) else block[val][0]) for key, val in RATINGS}
         parsed_data.update({
             'job_role': block[-9],
             'review_month': block[-8].split()[0],
             'review_year': int(block[-8].split()[1]),
-            'review_location': location_data[0],
-            'review_states': location_data[1],
-            'review_postcode': location_data[2],
+            'review_location': location,
+            'review_states': states,
+            'review_postcode': postcode,
             'years_in_role': parse_years_in_role(block[-6]),
             'employment_status': 'Former' if 'former' in block[-6].lower() else 'Current' if 'current' in block[-6].lower() else '',
             'review_title': block[-5],
@@ -120,28 +138,50 @@ class Parsers(BaseParsers):
 class Navigators(BaseNavigators):
 
     @classmethod
-    def grab_next_button(self, driver: WebDriver) -> WebElement:
+    def grab_next_button(self, driver: 'WebDriver') -> 'WebElement':
+        from selenium.webdriver.common.by import By
         return driver.find_element(By.XPATH, '//a[@aria-label="Next"]')
     
-    def check_next_page(self, driver: WebDriver) -> bool:
+    def check_next_page(self, driver: 'WebDriver') -> bool:
         next_button = self.grab_next_button(driver)
         return next_button.get_attribute('tabindex') != '-1'
     
-    def grab_next_page(self, driver: WebDriver) -> None:
+    def grab_next_page(self, driver: 'WebDriver') -> None:
         next_button = self.grab_next_button(driver)
+        self.arm_page_change(driver, 'h3')
         next_button.click()
         
-    def wait_for_entry(self, driver: WebDriver) -> None:
+    def wait_for_entry(self, driver: 'WebDriver') -> None:
+        # Heavy Selenium support modules, imported once a browser is running
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
         wait = WebDriverWait(driver, 40)
         wait.until(EC.presence_of_element_located((By.XPATH, "//a[@aria-label='Next']")))
 
-    def wait_for_page(self, driver: WebDriver) -> None:
-        old_texts = [elem.text for elem in driver.find_elements(By.TAG_NAME, 'h3')]
-        def page_has_changed(driver: webdriver.Chrome) -> bool:
-            try:
-                current_texts = [elem.text for elem in driver.find_elements(By.TAG_NAME, 'h3')]
-                return current_texts != old_texts
-            except StaleElementReferenceException:
-                return False
-        wait = WebDriverWait(driver, 40)
-        wait.until(page_has_changed)
+    def wait_for_page(self, driver: 'WebDriver') -> None:
+        self.wait_for_page_change(driver, 'h3', 40)
+
+    async def wait_for_entry_async(self, tab: 'BrowserTab') -> None:
+        await self.wait_for_element_async(tab, "a[aria-label='Next']", 40)
+
+    async def wait_for_page_async(self, tab: 'BrowserTab') -> None:
+        await self.wait_for_page_change_async(tab, 'h3', 40)
+
+class Fetchers(BaseFetchers):
+
+    next_pattern = re.compile(r'<a[^>]*aria-label="Next"[^>]*>')
+    total_pattern = re.compile(r'<strong[^>]*>\s*([\d,]+)\s*</strong>[^<]*reviews sorted by')
+
+    def build_page_url(self, entry_url: str, page_idx: int) -> str:
+        return entry_url if page_idx == 0 else f'{entry_url}?page={page_idx + 1}'
+
+    def check_next_page(self, page_html: str) -> bool:
+        next_button = self.next_pattern.search(page_html)
+        return next_button is not None and 'tabindex="-1"' not in next_button.group(0)
+
+    def extract_total_count(self, page_html: str) -> int:
+        return int(self.total_pattern.search(page_html).group(1).replace(',', ''))
+
+    def needs_browser(self, page_html: str) -> bool:
+        return 'The good things' not in page_html
@@ -1,9 +1,47 @@
-import os
+''' Created: 18/10/2026 '''
+
+# Lazy registry of the scraper modules in this package. Scrapers are discovered from their
+# source files without importing them, and each is only imported once it is selected.
+
+# External Dependencies
+from functools import lru_cache
+from typing import Dict, List, NamedTuple
+import ast
 import importlib
+import os
+
+class ScraperInfo(NamedTuple):
+    ''' Metadata of one scraper module, read from its source without importing it. '''
+    name: str
+    path: str
+    classes: List[str]
+    ''' classes: Names of the scraper classes the module defines, such as Fetchers. '''
+
+# Modules in this package that are not scrapers.
+NON_SCRAPER_MODULES = {'__init__', 'BaseScraper'}
+SCRAPER_CLASSES = ('Validators', 'Parsers', 'Navigators', 'Fetchers')
+
+def read_scraper_info(name: str, path: str) -> ScraperInfo:
+    ''' Returns: ScraperInfo of the scraper module source at path. '''
+    with open(path, 'r', encoding='utf-8') as file:
+        source = file.read()
+    tree = ast.parse(source, filename=path)
+    classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef) and node.name in SCRAPER_CLASSES]
+    return ScraperInfo(name, path, classes)
+
+@lru_cache(maxsize=1)
+def discover_scrapers() -> Dict[str, ScraperInfo]:
+    ''' Returns: ScraperInfo of every scraper module in this package, keyed by name. '''
+    directory = os.path.dirname(__file__)
+    scrapers = {}
+    for file_name in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(file_name)
+        if extension == '.py' and name not in NON_SCRAPER_MODULES:
+            scrapers[name] = read_scraper_info(name, os.path.join(directory, file_name))
+    return scrapers
 
-# Loop over all the files in the directory that contain this __init__.py
-for file_name in os.listdir(os.path.dirname(__file__)):
-    # Exclude __init__.py and other non-python files
-    if file_name.endswith('.py') and file_name != '__init__.py':
-        module_name = file_name[:-3]  # remove the .py
-        importlib.import_module(f".{module_name}", package=__name__)
+def __getattr__(name: str):
+    ''' Purpose: Imports a scraper module on first access as an attribute of this package. '''
+    if name in discover_scrapers():
+        return importlib.import_module(f'.{name}', package=__name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,52 @@
+''' Created: 18/10/2026 '''
+
+# Pins the joined texts finditer of BaseParsers.extract_data_indices to a text by text
+# regex search, over Seek pages and patterns whose matches could cross text boundaries.
+
+# External Dependencies
+from itertools import compress, count, product
+import pytest
+
+# Internal Dependencies
+from benchmarks.synthetic_pages import pages_html
+from scrapers.BaseScraper import BaseParsers
+from scrapers.Seek import Parsers
+from utilities.text_extractors import extract_text_stream
+
+# Anchored, unanchored, empty matching, cross boundary and per text only patterns.
+PATTERNS = [
+    r'^The good things$', r'good', r'^a', r'b$', r'^a|b', r'^(?:a|b)$', r'^$', r'^', r'$', r'x*',
+    r'a\s*b', r'[^c]b', r'a\W?b', r'(?s)a.b', r'\bab\b', r'^\W', r'a(?!b)', r'(?<=a)b', r'\Aa', r'b\Z',
+]
+# Texts mixing pattern characters with spaces, empty texts and separator characters.
+TEXTS = ['', 'a', 'b', 'ab', 'a b', 'ba', 'c', ' ', 'a\nb', 'b\n', '\x1f']
+
+def make_parsers(pattern: str) -> BaseParsers:
+    ''' Returns: Parsers instance spotting data blocks with given text_pattern. '''
+    class PatternParsers(BaseParsers):
+        browser_lang = 'en'
+        text_pattern = pattern
+        text_idx = 0
+        data_length = 1
+        def extract_total_count(self, driver): return 0
+        def extract_page_text(self, soup): return []
+        def parse_data_block(self, block): return {}
+    return PatternParsers()
+
+def search_indices(parsers: BaseParsers, texts: list) -> list:
+    ''' Returns: Indices of texts matching text_regex, searched text by text. '''
+    return list(compress(count(), map(parsers.text_regex.search, texts)))
+
+@pytest.mark.parametrize('pattern', PATTERNS)
+def test_pattern_indices(pattern: str):
+    parsers = make_parsers(pattern)
+    for length in range(4):
+        for texts in product(TEXTS, repeat=length):
+            assert parsers.extract_data_indices(list(texts)) == search_indices(parsers, list(texts)), texts
+
+def test_seek_page_indices():
+    parsers = Parsers()
+    for page_html in pages_html(5):
+        texts = extract_text_stream(page_html, parsers.text_tags)
+        indices = parsers.extract_data_indices(texts)
+        assert indices and indices == search_indices(parsers, texts)
@@ -0,0 +1,72 @@
+''' Created: 18/10/2026 '''
+
+# Pins the PAGE_PARSER text extractors to the BeautifulSoup extract_tagged_text path, on
+# synthetic Seek pages, recorded fixtures when present, and markup edge cases.
+
+# External Dependencies
+from bs4 import BeautifulSoup
+import importlib.util
+import pytest
+
+# Internal Dependencies
+from benchmarks.fixtures import load_recorded_pages
+from benchmarks.synthetic_pages import pages_html
+from scrapers.BaseScraper import TextTag
+from scrapers.Seek import Parsers
+from utilities.text_extractors import TEXT_EXTRACTORS
+
+EXTRACTORS = [name for name in TEXT_EXTRACTORS if name != 'lxml' or importlib.util.find_spec('lxml') is not None]
+
+# Markup edge cases, each wrapped in a page body, read with the Seek text_tags.
+EDGE_CASES = {
+    'entities': '<span>Pay &amp; conditions &lt;ok&gt; &nbsp;&#8217;&#x2014;&copy</span>',
+    'nested': '<span>outer <span>inner</span> tail</span><h3>title <b>bold</b></h3>',
+    'unclosed': '<div><span>open span<h3>heading</div><span>next</span>',
+    'misnested': '<b><span>bold span</b> after</span><span>last</span>',
+    'void': '<span>line<br>break<img src="a.png">image<input value="x"></span>',
+    'self_closing': '<span/>after<h3/>heading<span>text</span>',
+    'comment': '<span>before<!-- <span>hidden</span> -->after</span>',
+    'script_style': '<script>var s = "<span>not text</span>";</script><style>span::after{content:"<h3>"}</style><span>shown</span>',
+    'attributes': '<div aria-label="Rated 4 out of 5"></div><div aria-label="Menu"></div><div aria-label=\'3 out of 5\' class="x"></div>',
+    'empty_attribute': '<div aria-label>no value</div><div aria-label="">empty</div><span hidden>hidden attr</span>',
+    'uppercase': '<SPAN>upper</SPAN><H3 Class="t">Upper heading</H3><DIV ARIA-LABEL="5 out of 5"></DIV>',
+    'whitespace': '<span>\n  spaced\t text \n</span><span>   </span><span>\n\t</span><span></span><span><b> </b>\n</span>',
+    'preformatted': '<span><pre>   </pre><textarea>\n  </textarea></span>',
+    'unicode': '<span>café ★★★★☆ 職場 🙂</span>',
+    'svg_cdata': '<svg><title>star</title><![CDATA[<span>cdata</span>]]></svg><span>after svg</span>',
+    'unclosed_at_end': '<span>never closed <h3>also open',
+}
+
+def soup_texts(page_html: str, parsers: Parsers) -> list:
+    ''' Returns: Page texts through the BeautifulSoup html.parser path of extract_data. '''
+    return parsers.extract_page_text(BeautifulSoup(page_html, 'html.parser'))
+
+@pytest.fixture(scope='module')
+def parsers() -> Parsers:
+    return Parsers()
+
+@pytest.mark.parametrize('extractor', EXTRACTORS)
+def test_synthetic_pages_match_soup(extractor, parsers):
+    for page_html in pages_html(20):
+        assert TEXT_EXTRACTORS[extractor](page_html, parsers.text_tags) == soup_texts(page_html, parsers)
+
+@pytest.mark.parametrize('extractor', EXTRACTORS)
+def test_recorded_pages_match_soup(extractor, parsers):
+    pages = load_recorded_pages('Seek')
+    if not pages:
+        pytest.skip('No recorded Seek fixtures, run benchmarks.record_fixtures first.')
+    for page_html in pages:
+        assert TEXT_EXTRACTORS[extractor](page_html, parsers.text_tags) == soup_texts(page_html, parsers)
+
+@pytest.mark.parametrize('extractor', EXTRACTORS)
+@pytest.mark.parametrize('case', EDGE_CASES)
+def test_edge_cases_match_soup(extractor, case, parsers):
+    page_html = f'<!DOCTYPE html><html><head><title>t</title></head><body>{EDGE_CASES[case]}</body></html>'
+    assert TEXT_EXTRACTORS[extractor](page_html, parsers.text_tags) == soup_texts(page_html, parsers)
+
+def test_stream_reads_declared_attribute(parsers):
+    text_tags = (TextTag('a', attr='href'), TextTag('span'))
+    page_html = '<a href="/next">Next</a><a>no href</a><span>text</span><a href="">empty</a>'
+    soup = BeautifulSoup(page_html, 'html.parser')
+    expected = [element['href'] if element.name == 'a' else element.get_text() for element in soup.find_all(['a', 'span']) if element.name != 'a' or element.has_attr('href')]
+    assert TEXT_EXTRACTORS['stream'](page_html, text_tags) == expected
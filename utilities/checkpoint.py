@@ -0,0 +1,80 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from threading import Lock
+from typing import Dict, List, Optional, Sequence
+import hashlib
+import json
+
+# Internal Dependencies
+from utilities.generic_validators import GenericValidators
+from utilities.settings import Settings
+
+def fingerprint_block(block: Sequence[str]) -> str:
+    ''' Returns: Stable hash string identifying a raw extracted data block. '''
+    return hashlib.sha1('\x1f'.join(block).encode('utf-8')).hexdigest()
+
+class Checkpoint:
+    ''' Purpose: Append-only JSON lines journal recording scrape progress for one output.
+        Progress records are held until the OutputWriter flushes, then committed with the
+        flushed output file offsets, so the journal never claims rows not yet on disk. '''
+    def __init__(self, output_name: str, settings: Settings):
+        self.path = f'{settings.OUTPUT_DIRECTORY}{output_name}.checkpoint'
+        self.lock = Lock()
+        self.config_file = None
+        self.entries: Dict[str, Dict] = {}
+        self.offsets: Dict[str, int] = {}
+        self.pending: List[Dict] = []
+    def start(self, config_file: str) -> None:
+        ''' Purpose: Creates a new journal for a fresh scrape of config_file. '''
+        self.config_file = config_file
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({'config': config_file}) + '\n')
+    def load(self) -> None:
+        ''' Purpose: Replays an existing journal up to its last committed flush. '''
+        GenericValidators.validate_file_exists(self.path)
+        uncommitted = []
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                if 'config' in record:
+                    self.config_file = record['config']
+                elif 'flush' in record:
+                    for progress in uncommitted:
+                        self.apply(progress)
+                    uncommitted = []
+                    self.offsets = record['flush']
+                else:
+                    uncommitted.append(record)
+    def apply(self, record: Dict) -> None:
+        ''' Purpose: Merges a progress record into the per entry URL state. '''
+        state = self.entries.setdefault(record['entry'], {'page': 0, 'rows': 0, 'fingerprint': None, 'done': False})
+        state.update({k: v for k, v in record.items() if k != 'entry'})
+    def get_entry(self, entry_url: str) -> Optional[Dict]:
+        ''' Returns: Committed progress for entry_url, or None if it was never started. '''
+        return self.entries.get(entry_url)
+    def is_done(self, entry_url: str) -> bool:
+        ''' Returns: Boolean True if entry_url was fully scraped and committed. '''
+        state = self.entries.get(entry_url)
+        return state is not None and state['done']
+    def record_page(self, entry_url: str, page: int, rows: int, fingerprint: str) -> None:
+        ''' Purpose: Queues progress for a saved page, committed on next output flush. '''
+        with self.lock:
+            self.pending.append({'entry': entry_url, 'page': page, 'rows': rows, 'fingerprint': fingerprint})
+    def record_done(self, entry_url: str, rows: int) -> None:
+        ''' Purpose: Queues completion of entry_url, committed on next output flush. '''
+        with self.lock:
+            self.pending.append({'entry': entry_url, 'rows': rows, 'done': True})
+    def commit(self, offsets: Dict[str, int]) -> None:
+        ''' Purpose: Writes queued progress followed by a flush marker of output offsets. '''
+        with self.lock:
+            records = self.pending + [{'flush': offsets}]
+            self.pending = []
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(''.join(json.dumps(record) + '\n' for record in records))
+            for record in records[:-1]:
+                self.apply(record)
+            self.offsets = offsets
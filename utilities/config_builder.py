@@ -3,31 +3,52 @@
 # Stores ScrapeConfig, class that builds all custom configuration for scraping.
 
 # External Dependencies
-import json
-from typing import List
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple
+import os
 
 # Internal Dependencies
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.entry_sources import ENTRY_SOURCES, CompactHashSet
 from utilities.generic_validators import GenericValidators
 
 class Config:
-    ''' Purpose: Load specified scrape_config contents. '''
+    ''' Purpose: Load specified scrape_config contents. Only the scraper name is read up front,
+        entries are streamed from the file each time get_lines() is iterated. '''
+    BATCH_SIZE = 1000
+    PREVIEW_LINES = 20
     def __init__(self, config_file: str):
-        self.orgs = []
         config_path = f'scrape_configs/{config_file}'
         GenericValidators.validate_file_exists(config_path)
-        with open(config_path, 'r') as file:
-            data = json.load(file)
-            GenericValidators.validate_json_structure(data)
-            self.scraper_name = data.get('scraper')
-            seen_urls = set()
-            for name, url in data['entries'].items():
-                GenericValidators.validate_name(name)
-                if url not in seen_urls:
-                    self.orgs.append({'name': name, 'url': url})
-                    seen_urls.add(url)
-    def get_lines(self) -> List:
-        ''' Returns: List of organisation names and URLs. '''
-        return [(org['name'], org['url']) for org in self.orgs]
+        extension = os.path.splitext(config_file)[1].lower()
+        if extension not in ENTRY_SOURCES:
+            raise SE.InvalidConfigFile(f'Config {config_file} must be one of {", ".join(ENTRY_SOURCES)}...')
+        self.source = ENTRY_SOURCES[extension](config_path)
+        self.scraper_name = self.source.read_scraper()
+        GenericValidators.validate_scraper_name(self.scraper_name)
+    @staticmethod
+    def validate_batch(batch: List[Tuple[str, str]], url_validator: Optional[Callable[[str], None]]):
+        ''' Purpose: Validates the names, and URLs if url_validator is given, of a batch of entries. '''
+        for name, url in batch:
+            GenericValidators.validate_name(name)
+            if not isinstance(url, str):
+                raise SE.InvalidConfigFile(f'JSON contains invalid URL format: {url}')
+            if url_validator is not None:
+                url_validator(url)
+    def get_lines(self, url_validator: Optional[Callable[[str], None]] = None) -> Iterator[Tuple[str, str]]:
+        ''' Returns: Iterator of organisation names and URLs, skipping repeated URLs. Entries
+            are read and validated BATCH_SIZE at a time, so an invalid entry stops the
+            iteration before any entry of its batch is returned. '''
+        seen_urls = CompactHashSet()
+        entries = self.source.read_entries()
+        while batch := list(islice(entries, self.BATCH_SIZE)):
+            self.validate_batch(batch, url_validator)
+            for name, url in batch:
+                if seen_urls.add(url):
+                    yield name, url
     def string(self) -> str:
-        ''' Returns: String of organisation names and URLs. '''
-        return '\n'.join([f'{org["name"]}: {org["url"]}' for org in self.orgs])
+        ''' Returns: String of the first PREVIEW_LINES organisation names and URLs. '''
+        lines = [f'{name}: {url}' for name, url in islice(self.get_lines(), self.PREVIEW_LINES + 1)]
+        if len(lines) > self.PREVIEW_LINES:
+            lines[-1] = '...'
+        return '\n'.join(lines)
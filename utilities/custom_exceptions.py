@@ -23,6 +23,9 @@ class ScraperExceptions:
     class BadScraper(Exception):
         ''' Exception: Dynamic scraper function returned invalid type. '''
         pass
+    class LeaseLost(Exception):
+        ''' Exception: Job queue lease of the entry being scraped was not renewed. '''
+        pass
     def handle_non_critical(func, data_strict: bool, *args, **kwargs):
         ''' Purpose: Handles non-critical functions given config.data_strict setting. 
             Will allow a wrapped function to fail and return none if not strict. '''
@@ -60,3 +63,17 @@ class ScraperExceptions:
                     raise ScraperExceptions.NavigationFail(e)
             except Exception as e:
                 raise ScraperExceptions.NavigationFail(e)
+    async def handle_bad_nav_async(func, *args, **kwargs):
+        ''' Purpose: Async counterpart of handle_bad_nav for navigator coroutines, retrying a
+            raced navigator up to 5 times. '''
+        fails = 0
+        while fails < 5:
+            try:
+                return await func(*args, **kwargs)
+            except (StaleElementReferenceException, TimeoutException, NoSuchElementException) as e:
+                Log.warn(f'Navigation failed, retrying: {fails}')
+                fails += 1
+                if fails >= 5:
+                    raise ScraperExceptions.NavigationFail(e)
+            except Exception as e:
+                raise ScraperExceptions.NavigationFail(e)
@@ -0,0 +1,79 @@
+''' Created: 18/10/2026 '''
+
+# Stores DataBlock, a view of one data block inside a page texts list, and PageBlocks, the
+# sequence of DataBlock views of one page.
+
+# External Dependencies
+from array import array
+from itertools import chain
+from typing import Iterable, Iterator, List, Tuple, Union
+
+class DataBlock:
+    ''' Purpose: Read only view of the data block texts[start:end] of a page texts list,
+        indexed, iterated, and searched like that list slice without copying it. Every
+        block of a page shares the one texts list, so blocks only become lists when
+        to_list() materialises them for writing. '''
+    __slots__ = ('texts', 'start', 'end')
+    def __init__(self, texts: List[str], start: int, end: int):
+        self.texts = texts
+        self.start = start
+        self.end = end
+    def __len__(self) -> int:
+        return self.end - self.start
+    def __getitem__(self, idx: Union[int, slice]) -> Union[str, List[str]]:
+        if idx.__class__ is int and 0 <= idx < self.end - self.start:
+            return self.texts[self.start + idx]
+        if isinstance(idx, slice):
+            return self.texts[self.start:self.end][idx]
+        if idx < 0:
+            idx += self.end - self.start
+        if not 0 <= idx < self.end - self.start:
+            raise IndexError('data block index out of range')
+        return self.texts[self.start + idx]
+    def __iter__(self) -> Iterator[str]:
+        return map(self.texts.__getitem__, range(self.start, self.end))
+    def __contains__(self, value: str) -> bool:
+        try:
+            self.index(value)
+            return True
+        except ValueError:
+            return False
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (DataBlock, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+    __hash__ = None
+    def __repr__(self) -> str:
+        return repr(self.to_list())
+    def index(self, value: str, start: int = 0) -> int:
+        ''' Returns: Index in the block of the first text equal to value at or after start. '''
+        return self.texts.index(value, self.start + start, self.end) - self.start
+    def to_list(self) -> List[str]:
+        ''' Returns: Block texts copied to a new list. '''
+        return self.texts[self.start:self.end]
+
+class PageBlocks:
+    ''' Purpose: Read only sequence of the data blocks of one page, stored as the page texts
+        list and one array of the start and end offsets of its blocks. DataBlock views are
+        made as blocks are accessed, so a page holds 8 bytes per block rather than a list
+        or view object per block. '''
+    __slots__ = ('texts', 'bounds')
+    def __init__(self, texts: List[str], bounds: Iterable[Tuple[int, int]]):
+        self.texts = texts
+        self.bounds = array('i', chain.from_iterable(bounds))
+    def __len__(self) -> int:
+        return len(self.bounds) // 2
+    def __getitem__(self, idx: Union[int, slice]) -> Union[DataBlock, 'PageBlocks']:
+        if isinstance(idx, slice):
+            return PageBlocks(self.texts, zip(self.bounds[0::2][idx], self.bounds[1::2][idx]))
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('page blocks index out of range')
+        return DataBlock(self.texts, self.bounds[2 * idx], self.bounds[2 * idx + 1])
+    def __iter__(self) -> Iterator[DataBlock]:
+        texts, bounds = self.texts, iter(self.bounds)
+        for start in bounds:
+            yield DataBlock(texts, start, next(bounds))
+    def __repr__(self) -> str:
+        return repr([block.to_list() for block in self])
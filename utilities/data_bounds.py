@@ -0,0 +1,30 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from array import array
+
+class DataBounds:
+    ''' Purpose: Compact store of accepted data block bounds for a page as parallel int arrays.
+        Bounds are appended in increasing start order, so the furthest end seen so far is all
+        that is needed to check a new bound for overlap with every accepted bound. '''
+    __slots__ = ('starts', 'ends', 'max_end')
+    def __init__(self):
+        self.starts = array('l')
+        self.ends = array('l')
+        self.max_end = None
+    def __len__(self) -> int:
+        return len(self.starts)
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+    def append(self, start_idx: int, end_idx: int) -> None:
+        ''' Purpose: Adds an accepted bound, start_idx must not be below any earlier start. '''
+        if self.starts and start_idx < self.starts[-1]:
+            raise ValueError('DataBounds must be appended in increasing start order.')
+        self.starts.append(start_idx)
+        self.ends.append(end_idx)
+        if self.max_end is None or end_idx > self.max_end:
+            self.max_end = end_idx
+    def overlaps(self, start_idx: int, end_idx: int) -> bool:
+        ''' Returns: Boolean True if the bound overlaps any accepted bound. As accepted starts
+            are all at or before start_idx, any with an end past start_idx overlaps. '''
+        return self.max_end is not None and self.max_end > start_idx and self.starts[0] < end_idx
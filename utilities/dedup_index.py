@@ -0,0 +1,54 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from threading import Lock
+from typing import List, Optional, Tuple
+import sqlite3
+
+# Internal Dependencies
+from utilities.settings import Settings
+
+class DedupIndex:
+    ''' Purpose: Persistent SQLite index of saved data block fingerprints per entry URL,
+        shared across runs so incremental scrapes stop at blocks a previous run saved.
+        Added fingerprints are held until the OutputWriter flushes, like checkpoint
+        progress, so the index never claims rows not yet on disk. '''
+    def __init__(self, settings: Settings):
+        self.path = f'{settings.OUTPUT_DIRECTORY}dedup_index.sqlite'
+        self.lock = Lock()
+        self.pending: List[Tuple[str, str]] = []
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS seen (entry_url TEXT, fingerprint TEXT, '
+                                'PRIMARY KEY (entry_url, fingerprint)) WITHOUT ROWID')
+        self.connection.commit()
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def find_known(self, entry_url: str, fingerprints: List[str]) -> Optional[int]:
+        ''' Returns: Position of the first of fingerprints already indexed for entry_url, or
+            None if every fingerprint is new. '''
+        if not fingerprints:
+            return None
+        with self.lock:
+            rows = self.connection.execute(
+                f'SELECT fingerprint FROM seen WHERE entry_url = ? AND fingerprint IN ({",".join("?" * len(fingerprints))})',
+                [entry_url, *fingerprints]).fetchall()
+        known = {row[0] for row in rows}
+        return next((idx for idx, fingerprint in enumerate(fingerprints) if fingerprint in known), None)
+    def add(self, entry_url: str, fingerprints: List[str]) -> None:
+        ''' Purpose: Queues fingerprints saved for entry_url, committed on next output flush. '''
+        with self.lock:
+            self.pending.extend((entry_url, fingerprint) for fingerprint in fingerprints)
+    def commit(self) -> None:
+        ''' Purpose: Writes queued fingerprints to the index in one transaction. '''
+        with self.lock:
+            if not self.pending:
+                return
+            self.connection.executemany('INSERT OR IGNORE INTO seen VALUES (?, ?)', self.pending)
+            self.connection.commit()
+            self.pending = []
+    def close(self) -> None:
+        ''' Purpose: Closes the index, dropping fingerprints never committed by a flush. '''
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,220 @@
+''' Created: 18/10/2026 '''
+
+# Stores the scrape config entry sources, which stream (name, url) entries from JSON, JSON
+# lines, or CSV config files without loading the whole file, selected by file extension.
+
+# External Dependencies
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Iterator, Tuple
+import csv, hashlib, json
+
+# Internal Dependencies
+from utilities.custom_exceptions import ScraperExceptions as SE
+
+class CompactHashSet:
+    ''' Purpose: Set of strings stored as 64 bit blake2b digests in an open addressing
+        array, using about 16 bytes per item against over 100 for a set of the strings.
+        Digest collisions are possible but negligible, around 1 in 10^7 at a million items. '''
+    def __init__(self, capacity: int = 1024):
+        self.slots = array('Q', bytes(8 * capacity))
+        self.mask = capacity - 1
+        self.count = 0
+    def __len__(self) -> int:
+        return self.count
+    @staticmethod
+    def digest(item: str) -> int:
+        ''' Returns: Non zero 64 bit digest of item, zero marking an empty slot. '''
+        return int.from_bytes(hashlib.blake2b(item.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+    def insert(self, digest: int) -> bool:
+        ''' Returns: Boolean True if digest was inserted, False if already present. '''
+        slot = digest & self.mask
+        while self.slots[slot]:
+            if self.slots[slot] == digest:
+                return False
+            slot = (slot + 1) & self.mask
+        self.slots[slot] = digest
+        self.count += 1
+        return True
+    def grow(self) -> None:
+        ''' Purpose: Doubles the slot array, reinserting every digest. '''
+        old_slots = self.slots
+        self.slots = array('Q', bytes(16 * len(old_slots)))
+        self.mask = len(self.slots) - 1
+        self.count = 0
+        for digest in old_slots:
+            if digest:
+                self.insert(digest)
+    def add(self, item: str) -> bool:
+        ''' Returns: Boolean True if item was added, False if already present. '''
+        if 2 * (self.count + 1) > len(self.slots):
+            self.grow()
+        return self.insert(self.digest(item))
+
+class BaseEntrySource(ABC):
+    ''' Base class for config file formats. Each source reads the scraper name from the
+        start of the file and streams raw entries, opening the file again per read. '''
+    def __init__(self, config_path: str):
+        self.config_path = config_path
+    @abstractmethod
+    def read_scraper(self) -> Any:
+        ''' Returns: Scraper name given by the config file. '''
+    @abstractmethod
+    def read_entries(self) -> Iterator[Tuple[Any, Any]]:
+        ''' Returns: Iterator of raw entry names and URLs in file order. '''
+
+class JsonStream:
+    ''' Purpose: Reads the values of a JSON document in CHUNK_SIZE pieces, so members of a
+        large object can be decoded one by one without loading the document. '''
+    CHUNK_SIZE = 1 << 16
+    def __init__(self, file, config_path: str):
+        self.file = file
+        self.config_path = config_path
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    def fill(self) -> None:
+        ''' Purpose: Drops the consumed buffer and reads the next chunk onto the rest. '''
+        chunk = self.file.read(self.CHUNK_SIZE)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+    def malformed(self, expected: str) -> SE.InvalidConfigFile:
+        ''' Returns: InvalidConfigFile error for a missing expected token. '''
+        return SE.InvalidConfigFile(f'Config {self.config_path} is not valid JSON, expected {expected}...')
+    def peek(self) -> str:
+        ''' Returns: Next character after whitespace, or an empty string at end of file. '''
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.fill()
+    def consume(self, char: str) -> bool:
+        ''' Returns: Boolean True if the next character was char and has been consumed. '''
+        if self.peek() != char:
+            return False
+        self.pos += 1
+        return True
+    def expect(self, char: str) -> None:
+        ''' Purpose: Consumes char, raising InvalidConfigFile if it is not next. '''
+        if not self.consume(char):
+            raise self.malformed(f'"{char}"')
+    def value(self) -> Any:
+        ''' Returns: Next JSON value, reading more chunks until it is complete. '''
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number ending the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise self.malformed('a value')
+            self.fill()
+
+class JsonEntrySource(BaseEntrySource):
+    ''' Purpose: JSON object config with "scraper" and "entries" keys, "entries" being an
+        object of names and URLs, decoded in chunks one entry at a time. '''
+    def read(self) -> Iterator[Tuple[str, Any]]:
+        ''' Returns: Iterator of ("scraper", name) and ("entry", (name, url)) items in file order. '''
+        with open(self.config_path, 'r', encoding='utf-8') as file:
+            stream = JsonStream(file, self.config_path)
+            stream.expect('{')
+            has_entries = False
+            first_key = True
+            while not stream.consume('}'):
+                if not first_key:
+                    stream.expect(',')
+                first_key = False
+                key = stream.value()
+                stream.expect(':')
+                if key == 'entries':
+                    has_entries = True
+                    if not stream.consume('{'):
+                        raise SE.InvalidConfigFile('The JSON "entries" value must be a dictionary.')
+                    first_entry = True
+                    while not stream.consume('}'):
+                        if not first_entry:
+                            stream.expect(',')
+                        first_entry = False
+                        name = stream.value()
+                        stream.expect(':')
+                        yield 'entry', (name, stream.value())
+                elif key == 'scraper':
+                    yield 'scraper', stream.value()
+                else:
+                    stream.value()
+            if not has_entries:
+                raise SE.InvalidConfigFile('JSON is missing the "entries" key...')
+    def read_scraper(self) -> Any:
+        for kind, value in self.read():
+            if kind == 'scraper':
+                return value
+        raise SE.InvalidConfigFile('JSON is missing the "scraper" key...')
+    def read_entries(self) -> Iterator[Tuple[Any, Any]]:
+        for kind, value in self.read():
+            if kind == 'entry':
+                yield value
+
+class JsonLinesEntrySource(BaseEntrySource):
+    ''' Purpose: JSON lines config, a {"scraper": name} line then one {"name": name, "url": url}
+        line per entry. Blank lines are skipped. '''
+    def read_lines(self) -> Iterator[Tuple[int, Any]]:
+        ''' Returns: Iterator of line numbers and decoded records of non blank lines. '''
+        with open(self.config_path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError:
+                    raise SE.InvalidConfigFile(f'Config {self.config_path} line {line_number} is not valid JSON...')
+    def read_scraper(self) -> Any:
+        for _, record in self.read_lines():
+            if not isinstance(record, dict) or 'scraper' not in record:
+                break
+            return record['scraper']
+        raise SE.InvalidConfigFile('JSON lines config must start with a {"scraper": name} line...')
+    def read_entries(self) -> Iterator[Tuple[Any, Any]]:
+        records = self.read_lines()
+        next(records, None)
+        for line_number, record in records:
+            if not isinstance(record, dict) or 'name' not in record or 'url' not in record:
+                raise SE.InvalidConfigFile(f'Config {self.config_path} line {line_number} must have "name" and "url" keys...')
+            yield record['name'], record['url']
+
+class CsvEntrySource(BaseEntrySource):
+    ''' Purpose: CSV config, a "scraper,<name>" row then one "name,url" row per entry. A
+        "name,url" header row and blank rows are skipped. '''
+    def read_rows(self) -> Iterator[Tuple[int, list]]:
+        ''' Returns: Iterator of line numbers and non blank rows. '''
+        with open(self.config_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            for row in reader:
+                if any(cell.strip() for cell in row):
+                    yield reader.line_num, row
+    def read_scraper(self) -> Any:
+        for _, row in self.read_rows():
+            if len(row) != 2 or row[0].strip() != 'scraper':
+                break
+            return row[1].strip()
+        raise SE.InvalidConfigFile('CSV config must start with a "scraper,<name>" row...')
+    def read_entries(self) -> Iterator[Tuple[Any, Any]]:
+        rows = self.read_rows()
+        next(rows, None)
+        for line_number, row in rows:
+            if len(row) != 2:
+                raise SE.InvalidConfigFile(f'Config {self.config_path} line {line_number} must be a "name,url" row...')
+            name, url = row[0].strip(), row[1].strip()
+            if (name, url) != ('name', 'url'):
+                yield name, url
+
+ENTRY_SOURCES = {
+    '.json': JsonEntrySource,
+    '.jsonl': JsonLinesEntrySource,
+    '.csv': CsvEntrySource,
+}
@@ -0,0 +1,71 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+from threading import BoundedSemaphore, Lock
+from typing import Dict
+import requests
+
+# Internal Dependencies
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.rate_limiter import RateLimiter
+from utilities.logger_formats import Log
+from utilities.settings import Settings
+
+class HttpFetcher:
+    ''' Purpose: Fetches server rendered pages without a browser. Shares one pooled
+        keep-alive requests.Session across workers, caps in-flight requests per host
+        at HTTP_HOST_CONCURRENCY, and retries throttled or failed responses. '''
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0 Safari/537.36'
+    def __init__(self, language: str, settings: Settings):
+        self.host_concurrency = settings.HTTP_HOST_CONCURRENCY
+        self.timeout = settings.HTTP_TIMEOUT
+        self.lock = Lock()
+        self.host_slots: Dict[str, BoundedSemaphore] = {}
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(settings.MAX_WORKERS, self.host_concurrency), max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': self.USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Language': f'{language},{language.split("-")[0]};q=0.9'
+        })
+    def __enter__(self):
+        Log.info('Fetching pages over HTTP where scraper supports it...')
+        return self
+    def __exit__(self, *_):
+        self.session.close()
+    def get_host_slot(self, url: str) -> BoundedSemaphore:
+        ''' Returns: Semaphore limiting concurrent requests to the host of url. '''
+        host = RateLimiter.get_domain(url)
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = BoundedSemaphore(self.host_concurrency)
+            return self.host_slots[host]
+    def get(self, url: str) -> str:
+        ''' Returns: Decoded response body of url. '''
+        with self.get_host_slot(url):
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+            except RequestException as e:
+                raise SE.NavigationFail(f'HTTP fetch of {url} failed: {e}')
+        return self.decode_body(response)
+    @staticmethod
+    def decode_body(response: requests.Response) -> str:
+        ''' Returns: Body of response decoded with its declared charset. Without one, requests
+            assumes ISO-8859-1 for text types, so UTF-8 is tried before the detected encoding. '''
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            try:
+                return response.content.decode(response.encoding, errors='replace')
+            except LookupError:
+                pass
+        try:
+            return response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            return response.content.decode(response.apparent_encoding or 'utf-8', errors='replace')
@@ -0,0 +1,144 @@
+''' Created: 18/10/2026 '''
+
+# Stores the shared job queues that distribute config entries across worker nodes.
+
+# External Dependencies
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import sqlite3
+import time
+
+# Internal Dependencies
+from utilities.settings import Settings
+
+class Job(NamedTuple):
+    ''' One config entry of a queued scrape job, as leased by a worker. '''
+    job_name: str
+    entry_name: str
+    entry_url: str
+    scraper_name: str
+    attempts: int
+
+class BaseJobQueue(ABC):
+    ''' Base class for job queue backends. Entries of a job are leased to one worker at
+        a time for JOB_LEASE_SECONDS. Leases not renewed by heartbeat expire so other
+        workers retake the entry, and failed entries are retried up to JOB_MAX_ATTEMPTS. '''
+    def __init__(self, settings: Settings):
+        self.lease_seconds = settings.JOB_LEASE_SECONDS
+        self.max_attempts = settings.JOB_MAX_ATTEMPTS
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    @abstractmethod
+    def enqueue(self, job_name: str, scraper_name: str, entries: Iterable[Tuple[str, str]]) -> None:
+        ''' Purpose: Adds config entries as pending under job_name, keeping any existing. '''
+    @abstractmethod
+    def lease(self, job_name: str, worker_id: str) -> Optional[Job]:
+        ''' Returns: Next available entry of job_name leased to worker_id, else None. '''
+    @abstractmethod
+    def heartbeat(self, job: Job, worker_id: str) -> bool:
+        ''' Returns: Boolean True if the lease of job by worker_id was renewed. '''
+    @abstractmethod
+    def complete(self, job: Job, worker_id: str) -> None:
+        ''' Purpose: Marks a leased entry as done. '''
+    @abstractmethod
+    def fail(self, job: Job, worker_id: str, error: str) -> None:
+        ''' Purpose: Releases a leased entry for retry, or marks it failed on its last attempt. '''
+    @abstractmethod
+    def get_entries(self, job_name: str) -> List[Tuple[str, str, str, int]]:
+        ''' Returns: Entry names, URLs, states, and attempts made of job_name in enqueue order.
+            The attempts of a done entry number the lease that completed it. '''
+    @abstractmethod
+    def close(self) -> None:
+        ''' Purpose: Releases the queue backend. '''
+    def status(self, job_name: str) -> Dict[str, int]:
+        ''' Returns: Count of job_name entries in each state. '''
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        for _, _, state, _ in self.get_entries(job_name):
+            counts[state] += 1
+        return counts
+
+class SqliteJobQueue(BaseJobQueue):
+    ''' Purpose: Job queue in a SQLite file at JOB_QUEUE_PATH. Leases are taken in immediate
+        transactions, so workers on one machine, or on several machines sharing the file
+        over a filesystem with working locks, never lease the same entry twice. A failed
+        entry waits RETRY_BACKOFF of the lease time per attempt made before it is retried. '''
+    RETRY_BACKOFF = 0.1
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self.lock = Lock()
+        self.connection = sqlite3.connect(settings.JOB_QUEUE_PATH, timeout=60, isolation_level=None, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS jobs (job_name TEXT, position INTEGER, entry_name TEXT, '
+                                'entry_url TEXT, scraper_name TEXT, state TEXT, worker_id TEXT, lease_until REAL, '
+                                'attempts INTEGER, error TEXT, PRIMARY KEY (job_name, entry_url))')
+    def transaction(self, sql: str, *params) -> sqlite3.Cursor:
+        ''' Returns: Cursor of sql run in its own immediate transaction. '''
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                cursor = self.connection.execute(sql, params)
+                self.connection.execute('COMMIT')
+                return cursor
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+    def enqueue(self, job_name: str, scraper_name: str, entries: Iterable[Tuple[str, str]]) -> None:
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                start = self.connection.execute('SELECT COUNT(*) FROM jobs WHERE job_name = ?', (job_name,)).fetchone()[0]
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, 'pending', NULL, 0, 0, NULL)",
+                    ((job_name, start + position, name, url, scraper_name) for position, (name, url) in enumerate(entries)))
+                self.connection.execute('COMMIT')
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+    def lease(self, job_name: str, worker_id: str) -> Optional[Job]:
+        now = time.time()
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                self.connection.execute(
+                    "UPDATE jobs SET state = 'failed', error = 'Lease expired on last attempt' "
+                    "WHERE job_name = ? AND state = 'leased' AND lease_until <= ? AND attempts >= ?",
+                    (job_name, now, self.max_attempts))
+                row = self.connection.execute(
+                    "UPDATE jobs SET state = 'leased', worker_id = ?, lease_until = ?, attempts = attempts + 1 "
+                    "WHERE rowid = (SELECT rowid FROM jobs WHERE job_name = ? AND state IN ('pending', 'leased') "
+                    "AND lease_until <= ? ORDER BY position LIMIT 1) "
+                    "RETURNING job_name, entry_name, entry_url, scraper_name, attempts",
+                    (worker_id, now + self.lease_seconds, job_name, now)).fetchone()
+                self.connection.execute('COMMIT')
+            except BaseException:
+                self.connection.execute('ROLLBACK')
+                raise
+        return Job(*row) if row is not None else None
+    def heartbeat(self, job: Job, worker_id: str) -> bool:
+        cursor = self.transaction(
+            "UPDATE jobs SET lease_until = ? WHERE job_name = ? AND entry_url = ? AND worker_id = ? AND state = 'leased'",
+            time.time() + self.lease_seconds, job.job_name, job.entry_url, worker_id)
+        return cursor.rowcount == 1
+    def complete(self, job: Job, worker_id: str) -> None:
+        self.transaction(
+            "UPDATE jobs SET state = 'done', error = NULL WHERE job_name = ? AND entry_url = ? AND worker_id = ?",
+            job.job_name, job.entry_url, worker_id)
+    def fail(self, job: Job, worker_id: str, error: str) -> None:
+        state = 'failed' if job.attempts >= self.max_attempts else 'pending'
+        retry_at = time.time() + self.lease_seconds * self.RETRY_BACKOFF * job.attempts
+        self.transaction(
+            'UPDATE jobs SET state = ?, lease_until = ?, error = ? WHERE job_name = ? AND entry_url = ? AND worker_id = ?',
+            state, retry_at, error, job.job_name, job.entry_url, worker_id)
+    def get_entries(self, job_name: str) -> List[Tuple[str, str, str, int]]:
+        with self.lock:
+            return self.connection.execute(
+                'SELECT entry_name, entry_url, state, attempts FROM jobs WHERE job_name = ? ORDER BY position', (job_name,)).fetchall()
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+JOB_QUEUES = {
+    'sqlite': SqliteJobQueue,
+}
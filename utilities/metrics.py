@@ -0,0 +1,121 @@
+''' Created: 18/10/2026 '''
+
+# Stores Metrics, the per run collector of scrape stage latencies and counters.
+
+# External Dependencies
+from contextlib import contextmanager, nullcontext
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import json, math, time
+
+# Internal Dependencies
+from utilities.logger_formats import Log
+from utilities.profiler import StageProfiler
+from utilities.settings import Settings
+
+def get_percentile(ordered: List[float], fraction: float) -> float:
+    ''' Returns: Nearest rank percentile of an ascending sorted, non-empty list. '''
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))]
+
+class Metrics:
+    ''' Purpose: Collects stage latencies and counters of one scrape run, keyed by stage and
+        entry name. Stages are navigation, wait_for_page, page_source (including browser
+        text extraction), fetch, soup_parse, block_extraction, validation, and write.
+        Counters are pages, blocks, nav_retries, html_bytes, page_bytes, page_bytes_saved,
+        and browser_extraction_fallbacks. Does nothing unless COLLECT_METRICS is enabled. Given
+        a StageProfiler, timed stages it selects are also profiled. '''
+    PROMETHEUS_PREFIX = 'pyscrapify'
+    def __init__(self, settings: Settings, profiler: Optional[StageProfiler] = None):
+        self.enabled = settings.COLLECT_METRICS
+        self.profiler = profiler
+        self.format = settings.METRICS_FORMAT
+        self.lock = Lock()
+        self.samples: Dict[Tuple[str, str], List[float]] = {}
+        self.counters: Dict[Tuple[str, str], int] = {}
+    def observe(self, stage: str, entry_name: str, seconds: float) -> None:
+        ''' Purpose: Records one latency sample of stage for entry_name. '''
+        if not self.enabled:
+            return
+        with self.lock:
+            self.samples.setdefault((stage, entry_name), []).append(seconds)
+    def observe_all(self, entry_name: str, timings: Dict[str, float]) -> None:
+        ''' Purpose: Records one latency sample per stage from a stage to seconds dict. '''
+        for stage, seconds in timings.items():
+            self.observe(stage, entry_name, seconds)
+    def count(self, name: str, entry_name: str, amount: int = 1) -> None:
+        ''' Purpose: Adds amount to counter name of entry_name. '''
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[(name, entry_name)] = self.counters.get((name, entry_name), 0) + amount
+    def timed(self, stage: str, entry_name: str):
+        ''' Returns: Context manager recording the time spent inside it as a stage sample. '''
+        profiled = self.profiler is not None and self.profiler.selects(stage)
+        return self.timer(stage, entry_name, profiled) if self.enabled or profiled else nullcontext()
+    def timed_async(self, stage: str, entry_name: str):
+        ''' Returns: Context manager recording the time spent inside it as a stage sample, for
+            stages awaited by coroutines. These are not profiled, as coroutines sharing one
+            thread interleave inside the profiler scope. '''
+        return self.timer(stage, entry_name) if self.enabled else nullcontext()
+    @contextmanager
+    def timer(self, stage: str, entry_name: str, profiled: bool = False):
+        ''' Purpose: Times the wrapped block as one sample of stage, profiling it if profiled. '''
+        with self.profiler.scope(stage) if profiled else nullcontext():
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.observe(stage, entry_name, time.perf_counter() - start)
+    def get_summary(self) -> List[Dict]:
+        ''' Returns: Count, total, p50, p95, and max seconds of each stage per entry, in first
+            recorded order. '''
+        with self.lock:
+            samples = {key: sorted(values) for key, values in self.samples.items()}
+        return [{'stage': stage, 'entry': entry_name, 'count': len(ordered), 'total': sum(ordered),
+                 'p50': get_percentile(ordered, 0.5), 'p95': get_percentile(ordered, 0.95), 'max': ordered[-1]}
+                for (stage, entry_name), ordered in samples.items()]
+    def get_counters(self) -> List[Dict]:
+        ''' Returns: Value of each counter per entry, in first recorded order. '''
+        with self.lock:
+            return [{'counter': name, 'entry': entry_name, 'value': value} for (name, entry_name), value in self.counters.items()]
+    def format_prometheus(self) -> str:
+        ''' Returns: Stage summaries and counters in the Prometheus text exposition format. '''
+        def labels(**values) -> str:
+            return ','.join(f'{key}="{json.dumps(value)[1:-1]}"' for key, value in values.items())
+        name = f'{self.PROMETHEUS_PREFIX}_stage_seconds'
+        lines = [f'# TYPE {name} summary']
+        for row in self.get_summary():
+            for quantile in ('p50', 'p95'):
+                lines.append(f'{name}{{{labels(stage=row["stage"], entry=row["entry"], quantile=f"0.{quantile[1:]}")}}} {row[quantile]:.6f}')
+            lines.append(f'{name}_sum{{{labels(stage=row["stage"], entry=row["entry"])}}} {row["total"]:.6f}')
+            lines.append(f'{name}_count{{{labels(stage=row["stage"], entry=row["entry"])}}} {row["count"]}')
+        declared = set()
+        for row in self.get_counters():
+            counter = f'{self.PROMETHEUS_PREFIX}_{row["counter"]}_total'
+            if counter not in declared:
+                lines.append(f'# TYPE {counter} counter')
+                declared.add(counter)
+            lines.append(f'{counter}{{{labels(entry=row["entry"])}}} {row["value"]}')
+        return '\n'.join(lines) + '\n'
+    def export(self, output_base: str) -> str:
+        ''' Purpose: Writes collected metrics beside the output as JSON lines or Prometheus text.
+            Returns: Path of the metrics file written. '''
+        if self.format == 'prometheus':
+            path = f'{output_base}.metrics.prom'
+            content = self.format_prometheus()
+        else:
+            path = f'{output_base}.metrics.jsonl'
+            content = ''.join(json.dumps(row) + '\n' for row in self.get_summary() + self.get_counters())
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+    def report(self, output_base: str) -> None:
+        ''' Purpose: Logs p50 and p95 milliseconds of each stage per entry, then exports. '''
+        if not self.enabled:
+            return
+        lines = {}
+        for row in self.get_summary():
+            lines.setdefault(row['entry'], []).append(f'{row["stage"]} {row["p50"] * 1000:.1f}/{row["p95"] * 1000:.1f}')
+        for entry_name, stages in lines.items():
+            Log.info(f'{entry_name} stage p50/p95 ms: {", ".join(stages)}')
+        Log.info(f'Saved run metrics to {self.export(output_base)}')
@@ -0,0 +1,207 @@
+''' Created: 18/10/2026 '''
+
+# Stores the row output formats an OutputWriter can write, selected by OUTPUT_FORMAT.
+
+# External Dependencies
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Union
+import csv, json, os, shutil
+
+# Internal Dependencies
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.logger_formats import Log
+
+class BaseOutputFormat(ABC):
+    ''' Base class for output row formats. Each format appends rows to one output path,
+        reports its flushed size as an offset, and can be cut back to a committed offset. '''
+    extension: str
+    ''' extension: Suffix added to the output name to give the output path. '''
+    def __init__(self, output_base: str, schema: Optional[Dict[str, type]] = None):
+        self.path = f'{output_base}.{self.extension}'
+        self.schema = schema
+    @staticmethod
+    def clean_item(item: str) -> str:
+        ''' Returns: Data block item with whitespace runs collapsed, as given to parsers. '''
+        return ' '.join(item.split())
+    @staticmethod
+    def format_raw(block: Sequence[str], cleaned: List[str]) -> Union[str, List[str]]:
+        ''' Returns: Value of the raw_data column for a data block, lossless by default. '''
+        return list(block)
+    @abstractmethod
+    def write(self, fieldnames: List[str], rows: List[Dict]) -> None:
+        ''' Purpose: Appends rows, opening the output on first write. '''
+    @abstractmethod
+    def flush(self) -> None:
+        ''' Purpose: Pushes buffered rows to disk. '''
+    @abstractmethod
+    def close(self) -> None:
+        ''' Purpose: Flushes and closes the output. '''
+    def is_durable(self) -> bool:
+        ''' Returns: Boolean True if every flushed row can be read back from disk, so progress
+            up to the flush can be committed. '''
+        return True
+    def get_offset(self) -> int:
+        ''' Returns: Current flushed size of the output file. '''
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+    def truncate(self, offset: int) -> None:
+        ''' Purpose: Cuts the output file back to the given flushed size. '''
+        if os.path.exists(self.path) and os.path.getsize(self.path) > offset:
+            with open(self.path, 'r+b') as file:
+                file.truncate(offset)
+    def merge(self, shards: List['BaseOutputFormat']) -> None:
+        ''' Purpose: Replaces the output with the concatenated outputs of shards, in order. '''
+        with open(self.path, 'wb') as output:
+            for shard in shards:
+                if os.path.exists(shard.path):
+                    with open(shard.path, 'rb') as file:
+                        shutil.copyfileobj(file, output)
+
+class CsvFormat(BaseOutputFormat):
+    ''' Purpose: Quoted CSV rows. Items are cleaned of quotes and semicolons so raw_data can
+        be stored as one semicolon joined string column. '''
+    extension = 'csv'
+    def __init__(self, output_base: str, schema: Optional[Dict[str, type]] = None):
+        super().__init__(output_base, schema)
+        self.file = None
+        self.writer = None
+    @staticmethod
+    def clean_item(item: str) -> str:
+        return ' '.join(item.split()).replace('"', "'").replace(';', ',')
+    @staticmethod
+    def format_raw(block: Sequence[str], cleaned: List[str]) -> str:
+        return ';'.join(cleaned)
+    def write(self, fieldnames: List[str], rows: List[Dict]) -> None:
+        if self.writer is None:
+            self.file = open(self.path, 'a+', encoding='utf-8', newline='')
+            self.writer = csv.DictWriter(self.file, quoting=csv.QUOTE_ALL, fieldnames=fieldnames)
+            if self.file.tell() == 0:
+                Log.info(f'Constructed CSV fieldnames:\n{fieldnames}')
+                self.writer.writeheader()
+        self.writer.writerows(rows)
+    def flush(self) -> None:
+        if self.file is not None:
+            self.file.flush()
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+        self.file = self.writer = None
+    def merge(self, shards: List[BaseOutputFormat]) -> None:
+        with open(self.path, 'wb') as output:
+            header = False
+            for shard in shards:
+                if not os.path.exists(shard.path):
+                    continue
+                with open(shard.path, 'rb') as file:
+                    first_line = file.readline()
+                    if not header:
+                        output.write(first_line)
+                        header = True
+                    shutil.copyfileobj(file, output)
+
+class JsonlFormat(BaseOutputFormat):
+    ''' Purpose: JSON lines rows, keeping parsed value types and raw_data as a list. '''
+    extension = 'jsonl'
+    def __init__(self, output_base: str, schema: Optional[Dict[str, type]] = None):
+        super().__init__(output_base, schema)
+        self.file = None
+    def write(self, fieldnames: List[str], rows: List[Dict]) -> None:
+        if self.file is None:
+            self.file = open(self.path, 'a', encoding='utf-8', newline='')
+        self.file.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows))
+    def flush(self) -> None:
+        if self.file is not None:
+            self.file.flush()
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+
+class ParquetFormat(BaseOutputFormat):
+    ''' Purpose: Parquet dataset directory with typed columns from the parser data_fields
+        schema. Rows are buffered in memory and appended to the open part file as row groups
+        of ROW_GROUP_ROWS, and a part file is closed once it holds PART_ROWS rows or the
+        output closes. A part file is only readable once closed, so rows are only durable,
+        and progress only committed, whilst no part file is open. The offset is the count of
+        part files. Requires pyarrow. '''
+    extension = 'parquet'
+    ARROW_TYPES = {int: 'int64', float: 'float64', bool: 'bool_', str: 'string'}
+    ROW_GROUP_ROWS = 10000
+    PART_ROWS = 100000
+    def __init__(self, output_base: str, schema: Optional[Dict[str, type]] = None):
+        super().__init__(output_base, schema)
+        self.rows: List[Dict] = []
+        self.arrow_schema = None
+        self.writer = None
+        self.part_rows = 0
+    def get_arrow_schema(self, fieldnames: List[str]):
+        ''' Returns: Arrow schema of the declared field types, or None to infer it. '''
+        import pyarrow as pa
+        if not self.schema:
+            return None
+        fields = []
+        for name in fieldnames:
+            field_type = self.schema.get(name, str)
+            fields.append((name, pa.list_(pa.string()) if field_type is list else getattr(pa, self.ARROW_TYPES.get(field_type, 'string'))()))
+        return pa.schema(fields)
+    def get_parts(self) -> List[str]:
+        ''' Returns: Sorted part file names already written to the dataset directory. '''
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(name for name in os.listdir(self.path) if name.endswith('.parquet'))
+    def write(self, fieldnames: List[str], rows: List[Dict]) -> None:
+        if self.arrow_schema is None:
+            self.arrow_schema = self.get_arrow_schema(fieldnames)
+        self.rows.extend(rows)
+    def write_row_group(self) -> None:
+        ''' Purpose: Appends buffered rows to the open part file as one row group, opening a
+            new part file if none is open. '''
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        try:
+            table = pa.Table.from_pylist(self.rows, schema=self.arrow_schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise SE.UnexpectedData(f'Parsed data does not match declared data_fields types: {e}')
+        if self.arrow_schema is None:
+            self.arrow_schema = table.schema
+        if self.writer is None:
+            os.makedirs(self.path, exist_ok=True)
+            self.writer = pq.ParquetWriter(f'{self.path}/part-{len(self.get_parts()):05d}.parquet', self.arrow_schema)
+        self.writer.write_table(table, row_group_size=len(self.rows))
+        self.part_rows += len(self.rows)
+        self.rows = []
+    def close_part(self) -> None:
+        ''' Purpose: Writes the footer of the open part file, making its rows readable. '''
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = None
+        self.part_rows = 0
+    def flush(self) -> None:
+        if len(self.rows) >= self.ROW_GROUP_ROWS:
+            self.write_row_group()
+        if self.part_rows >= self.PART_ROWS:
+            self.close_part()
+    def close(self) -> None:
+        if self.rows:
+            self.write_row_group()
+        self.close_part()
+    def is_durable(self) -> bool:
+        return not self.rows and self.writer is None
+    def get_offset(self) -> int:
+        return len(self.get_parts())
+    def truncate(self, offset: int) -> None:
+        for name in self.get_parts()[offset:]:
+            os.remove(f'{self.path}/{name}')
+    def merge(self, shards: List[BaseOutputFormat]) -> None:
+        self.truncate(0)
+        os.makedirs(self.path, exist_ok=True)
+        part_idx = 0
+        for shard in shards:
+            for name in shard.get_parts():
+                shutil.copyfile(f'{shard.path}/{name}', f'{self.path}/part-{part_idx:05d}.parquet')
+                part_idx += 1
+
+OUTPUT_FORMATS = {
+    'csv': CsvFormat,
+    'jsonl': JsonlFormat,
+    'parquet': ParquetFormat,
+}
@@ -0,0 +1,95 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from pprint import pformat
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Sequence, Union
+import os
+
+# Internal Dependencies
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.checkpoint import Checkpoint
+from utilities.dedup_index import DedupIndex
+from utilities.output_formats import OUTPUT_FORMATS
+from utilities.settings import Settings
+
+class OutputWriter:
+    ''' Purpose: Streaming sink for a scrape run. Opened once per run, rows are appended
+        to the OUTPUT_FORMAT output as each page is parsed and flushed every OUTPUT_FLUSH_ROWS.
+        Each flush that leaves every row durable commits queued progress to the optional run
+        Checkpoint journal and queued fingerprints to the optional DedupIndex. Without
+        a given schema of column types, columns are taken from the first row written. '''
+    def __init__(self, output_name: str, settings: Settings, checkpoint: Optional[Checkpoint] = None, schema: Optional[Dict[str, type]] = None, index: Optional[DedupIndex] = None):
+        self.format = OUTPUT_FORMATS[settings.OUTPUT_FORMAT](f'{settings.OUTPUT_DIRECTORY}{output_name}', schema)
+        self.dump_path = f'{settings.OUTPUT_DIRECTORY}{output_name}.dump.txt'
+        self.dump_raw_data = settings.DUMP_RAW_DATA
+        self.flush_rows = settings.OUTPUT_FLUSH_ROWS
+        self.checkpoint = checkpoint
+        self.index = index
+        self.lock = Lock()
+        self.dump_file = None
+        self.fieldnames = list(schema) if schema else None
+        self.unflushed_rows = 0
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def write_dump(self, data_blocks: Sequence[Sequence[str]]) -> None:
+        ''' Purpose: Appends raw data_blocks to the dump file one block at a time. '''
+        if not self.dump_raw_data or not data_blocks:
+            return
+        with self.lock:
+            if self.dump_file is None:
+                self.dump_file = open(self.dump_path, 'a+', encoding='utf-8', newline='')
+            for block in data_blocks:
+                self.dump_file.write(pformat(list(block)))
+                self.dump_file.write('\n')
+    def write_rows(self, rows: List[Dict[str, Union[int, str]]], on_written: Optional[Callable[[], None]] = None) -> None:
+        ''' Purpose: Appends parsed rows to the output, flushing on the configured cadence.
+            Given on_written, it is called under the lock once the rows are written and
+            before any flush, so progress it queues is committed with exactly these rows. '''
+        if not rows:
+            return
+        with self.lock:
+            if self.fieldnames is None:
+                self.fieldnames = list(rows[0].keys())
+            for row in rows:
+                if set(self.fieldnames) != set(row.keys()):
+                    raise SE.UnexpectedData('Fieldnames and parsed_data keys do not match!')
+            self.format.write(self.fieldnames, rows)
+            if on_written is not None:
+                on_written()
+            self.unflushed_rows += len(rows)
+            if self.unflushed_rows >= self.flush_rows:
+                self.flush()
+    def flush(self) -> None:
+        ''' Purpose: Pushes buffered output to disk. Caller must hold the lock. '''
+        self.format.flush()
+        if self.dump_file is not None:
+            self.dump_file.flush()
+        self.unflushed_rows = 0
+        if not self.format.is_durable():
+            return
+        if self.checkpoint is not None:
+            self.checkpoint.commit(self.get_offsets())
+        if self.index is not None:
+            self.index.commit()
+    def get_offsets(self) -> Dict[str, int]:
+        ''' Returns: Current flushed offsets of the row output and dump output files. '''
+        return {self.format.extension: self.format.get_offset(),
+                'dump': os.path.getsize(self.dump_path) if os.path.exists(self.dump_path) else 0}
+    def truncate(self, offsets: Dict[str, int]) -> None:
+        ''' Purpose: Cuts outputs back to committed offsets, dropping any rows written after
+            the last checkpoint commit of an interrupted run. '''
+        self.format.truncate(offsets.get(self.format.extension, 0))
+        if os.path.exists(self.dump_path) and os.path.getsize(self.dump_path) > offsets.get('dump', 0):
+            with open(self.dump_path, 'r+b') as file:
+                file.truncate(offsets.get('dump', 0))
+    def close(self) -> None:
+        ''' Purpose: Closes any opened output files, then commits remaining progress. '''
+        with self.lock:
+            self.format.close()
+            self.flush()
+            if self.dump_file is not None:
+                self.dump_file.close()
+            self.dump_file = None
@@ -0,0 +1,145 @@
+''' Created: 18/10/2026 '''
+
+# Stores the append-only compressed page source archive and its memory mapped reader.
+
+# External Dependencies
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List, NamedTuple, Tuple
+import gzip, json, mmap, os, zlib
+
+# Internal Dependencies
+from utilities.custom_exceptions import ScraperExceptions as SE
+from utilities.generic_validators import GenericValidators
+
+class ArchivedPage(NamedTuple):
+    ''' Location of one archived page source in the archive data file. '''
+    entry_name: str
+    entry_url: str
+    page: int
+    offset: int
+    length: int
+
+def compress(data: bytes, compression: str) -> bytes:
+    ''' Returns: data compressed as one independent gzip or zstd frame. '''
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def decompress(data: bytes, compression: str) -> bytes:
+    ''' Returns: data of one gzip or zstd frame decompressed, raising UnexpectedData if the
+        frame is corrupt or truncated. '''
+    if compression == 'zstd':
+        import zstandard
+        decode, errors = zstandard.ZstdDecompressor().decompress, (zstandard.ZstdError,)
+    else:
+        decode, errors = gzip.decompress, (OSError, EOFError, zlib.error)
+    try:
+        return decode(data)
+    except errors as e:
+        raise SE.UnexpectedData(f'{compression} frame is corrupt or truncated, {type(e).__name__}: {e}')
+
+class PageArchive:
+    ''' Purpose: Append-only store of the page source of every fetched page of a run, so
+        outputs can be re-parsed offline after a parser fix. Each page is compressed on
+        its own into the .pages data file, then its entry, page index, and byte range
+        are appended to the .pages.index JSON lines file. A page only counts once its
+        index line is written, and resumed runs re-archiving a page supersede it. If resume
+        is True an existing archive is appended to, otherwise it is replaced. '''
+    def __init__(self, archive_base: str, scraper_name: str, compression: str, resume: bool = False):
+        self.data_path = f'{archive_base}.pages'
+        self.index_path = f'{archive_base}.pages.index'
+        self.lock = Lock()
+        if resume and os.path.exists(self.index_path):
+            self.compression = read_header(self.index_path)['compression']
+        else:
+            self.compression = compression
+            with open(self.index_path, 'w', encoding='utf-8') as file:
+                file.write(json.dumps({'scraper': scraper_name, 'compression': compression}) + '\n')
+            open(self.data_path, 'wb').close()
+        self.data_file = open(self.data_path, 'ab')
+        self.index_file = open(self.index_path, 'a', encoding='utf-8')
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def add(self, entry_name: str, entry_url: str, page: int, page_html: str) -> None:
+        ''' Purpose: Compresses and appends page_html as page of entry_url. '''
+        frame = compress(page_html.encode('utf-8'), self.compression)
+        with self.lock:
+            offset = self.data_file.tell()
+            self.data_file.write(frame)
+            self.data_file.flush()
+            self.index_file.write(json.dumps({'entry_name': entry_name, 'entry_url': entry_url, 'page': page,
+                                              'offset': offset, 'length': len(frame)}) + '\n')
+            self.index_file.flush()
+    def close(self) -> None:
+        ''' Purpose: Closes the archive files. '''
+        with self.lock:
+            self.data_file.close()
+            self.index_file.close()
+
+def read_header(index_path: str) -> Dict:
+    ''' Returns: Scraper name and compression header record of an archive index. '''
+    with open(index_path, 'r', encoding='utf-8') as file:
+        try:
+            header = json.loads(file.readline() or '{}')
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            header = {}
+    if not isinstance(header, dict) or 'scraper' not in header or header.get('compression') not in ('gzip', 'zstd'):
+        raise SE.UnexpectedData(f'Page archive index {index_path} has no valid header')
+    return header
+
+class PageArchiveReader:
+    ''' Purpose: Reads a PageArchive through a memory map of its data file, so pages are
+        sliced and decompressed without loading the whole archive. '''
+    def __init__(self, archive_base: str):
+        self.data_path = f'{archive_base}.pages'
+        self.index_path = f'{archive_base}.pages.index'
+        GenericValidators.validate_file_exists(self.index_path)
+        GenericValidators.validate_file_exists(self.data_path)
+        header = read_header(self.index_path)
+        self.scraper_name = header['scraper']
+        self.compression = header['compression']
+        self.file = open(self.data_path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.data_path) else b''
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def get_pages(self) -> List[ArchivedPage]:
+        ''' Returns: Latest archived copy of each page, grouped by entry in first archived
+            order and by page index within each entry. '''
+        latest: Dict[Tuple[str, int], ArchivedPage] = {}
+        entry_order: Dict[str, int] = {}
+        with open(self.index_path, 'r', encoding='utf-8') as file:
+            file.readline()
+            for line in file:
+                try:
+                    record = json.loads(line)
+                    page = ArchivedPage(record['entry_name'], record['entry_url'], record['page'], record['offset'], record['length'])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    break
+                if page.offset + page.length > len(self.data):
+                    break
+                entry_order.setdefault(page.entry_url, len(entry_order))
+                latest[(page.entry_url, page.page)] = page
+        return sorted(latest.values(), key=lambda page: (entry_order[page.entry_url], page.page))
+    def read(self, page: ArchivedPage) -> str:
+        ''' Returns: Page source of an archived page, raising UnexpectedData if it is corrupt. '''
+        try:
+            return decompress(self.data[page.offset:page.offset + page.length], self.compression).decode('utf-8')
+        except (SE.UnexpectedData, UnicodeDecodeError) as e:
+            raise SE.UnexpectedData(f'Archived page {page.page} of {page.entry_name} in {self.data_path} is unreadable: {e}')
+    def close(self) -> None:
+        ''' Purpose: Unmaps and closes the archive data file. '''
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+@lru_cache(maxsize=4)
+def get_reader(archive_base: str) -> PageArchiveReader:
+    ''' Returns: PageArchiveReader of archive_base kept open for the life of the process, so
+        re-parse workers map each archive once. '''
+    return PageArchiveReader(archive_base)
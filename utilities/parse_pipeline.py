@@ -0,0 +1,62 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import nullcontext
+from collections import deque
+from typing import Any, Callable, Deque, Iterator, Optional
+
+# Internal Dependencies
+from utilities.settings import Settings
+
+def create_parse_executor(settings: Settings):
+    ''' Returns: Context managed executor for page parsing, or a null context
+        yielding None if PARSE_WORKERS is 0 and parsing should stay inline. '''
+    if settings.PARSE_WORKERS == 0:
+        return nullcontext()
+    if settings.PARSE_PROCESSES:
+        return ProcessPoolExecutor(max_workers=settings.PARSE_WORKERS)
+    return ThreadPoolExecutor(max_workers=settings.PARSE_WORKERS)
+
+class ParsePipeline:
+    ''' Purpose: Queues page parse jobs onto an executor and hands back results in
+        submission order. Without an executor jobs run inline on submit. '''
+    def __init__(self, executor: Optional[Executor], max_pending: int):
+        self.executor = executor
+        self.max_pending = max(max_pending, 1)
+        self.pending: Deque[Future] = deque()
+    def submit(self, func: Callable, *args) -> None:
+        ''' Purpose: Queues func(*args), blocking first if max_pending jobs are in flight. '''
+        if len(self.pending) >= self.max_pending:
+            self.pending[0].exception()
+        if self.executor is None:
+            future = Future()
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            future = self.executor.submit(func, *args)
+        self.pending.append(future)
+    def check_failures(self) -> None:
+        ''' Purpose: Raises the error of any finished job, even if earlier pages are still
+            parsing, so a DATA_STRICT abort is not held up behind slower pages. '''
+        for future in self.pending:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+    def ready(self) -> Iterator[Any]:
+        ''' Returns: Results of finished jobs at the front of the queue, in order. '''
+        self.check_failures()
+        while self.pending and self.pending[0].done():
+            yield self.pending.popleft().result()
+    def drain(self) -> Iterator[Any]:
+        ''' Returns: Results of all remaining jobs in order, waiting as required. '''
+        while self.pending:
+            running = [future for future in self.pending if not future.done()]
+            if running:
+                wait(running, return_when=FIRST_COMPLETED)
+            yield from self.ready()
+    def cancel(self) -> None:
+        ''' Purpose: Drops any queued jobs that have not yet started. '''
+        while self.pending:
+            self.pending.popleft().cancel()
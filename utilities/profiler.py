@@ -0,0 +1,138 @@
+''' Created: 18/10/2026 '''
+
+# Stores StageProfiler, which profiles selected scrape stages for hot path analysis.
+
+# External Dependencies
+from collections import Counter
+from contextlib import contextmanager
+from threading import Event, Lock, Thread, get_ident, local
+from typing import Callable, List, Optional, Set
+import cProfile, io, os, pstats, sys
+
+# Internal Dependencies
+from utilities.logger_formats import Log
+
+# Stages a run can be profiled in, as named by the run Metrics. The parse stage covers
+# extract_data, being the soup_parse, block_extraction, and validation stages together.
+PROFILE_STAGES = ['navigation', 'wait_for_page', 'page_source', 'fetch', 'parse', 'write']
+
+class StageProfiler:
+    ''' Purpose: Profiles code run inside scope() blocks of the selected stages, on every
+        thread. The cprofile mode traces each call and saves a .profile.pstats file. Only one
+        cProfile may be active per process from Python 3.12, so cprofile mode profiles one
+        thread at a time, and scopes entered whilst another thread is profiled run unprofiled.
+        The sampling mode snapshots stacks every SAMPLE_INTERVAL seconds with far lower
+        overhead, saving .profile.collapsed stack counts for flamegraph tools. Both
+        modes save beside output_base when the profiler is closed. '''
+    SAMPLE_INTERVAL = 0.005
+    TOP_FUNCTIONS = 15
+    def __init__(self, mode: str, stages: List[str], output_base: str):
+        self.mode = mode
+        self.stages = set(stages)
+        self.output_base = output_base
+        self.lock = Lock()
+        self.depth = local()
+        self.profile = cProfile.Profile() if mode == 'cprofile' else None
+        self.owner: Optional[int] = None
+        self.profiled = 0
+        self.skipped = 0
+        self.active: Set[int] = set()
+        self.stacks = Counter()
+        self.stop = Event()
+        self.sampler = None
+        if mode == 'sampling':
+            self.sampler = Thread(target=self.sample, daemon=True)
+            self.sampler.start()
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def selects(self, stage: str) -> bool:
+        ''' Returns: Boolean True if stage is profiled. '''
+        return stage in self.stages
+    @contextmanager
+    def scope(self, stage: str):
+        ''' Purpose: Profiles the current thread inside the block if stage is selected. Nested
+            scopes on one thread are profiled once, by the outermost scope. '''
+        if stage not in self.stages:
+            yield
+            return
+        depth = getattr(self.depth, 'value', 0)
+        self.depth.value = depth + 1
+        profiling = depth == 0 and self.begin()
+        try:
+            yield
+        finally:
+            self.depth.value = depth
+            if profiling:
+                self.end()
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        ''' Returns: func profiled as stage on whichever thread calls it. '''
+        def profiled(*args, **kwargs):
+            with self.scope(stage):
+                return func(*args, **kwargs)
+        return profiled
+    def begin(self) -> bool:
+        ''' Returns: Boolean True if profiling of the current thread started, False if another
+            thread holds the cProfile. '''
+        thread_id = get_ident()
+        with self.lock:
+            if self.mode != 'cprofile':
+                self.active.add(thread_id)
+                return True
+            if self.owner is not None:
+                self.skipped += 1
+                return False
+            self.owner = thread_id
+            self.profiled += 1
+        self.profile.enable()
+        return True
+    def end(self) -> None:
+        ''' Purpose: Stops profiling the current thread. '''
+        thread_id = get_ident()
+        if self.mode == 'cprofile':
+            self.profile.disable()
+            with self.lock:
+                self.owner = None
+        else:
+            with self.lock:
+                self.active.discard(thread_id)
+    @staticmethod
+    def format_stack(frame) -> str:
+        ''' Returns: Collapsed stack of frame from outermost call, joined by semicolons. '''
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'.replace(';', ','))
+            frame = frame.f_back
+        return ';'.join(reversed(names))
+    def sample(self) -> None:
+        ''' Purpose: Counts the stacks of threads inside selected stages until closed. '''
+        while not self.stop.wait(self.SAMPLE_INTERVAL):
+            with self.lock:
+                thread_ids = list(self.active)
+            frames = sys._current_frames()
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.stacks[self.format_stack(frame)] += 1
+    def close(self) -> None:
+        ''' Purpose: Stops profiling and saves profile artifacts beside the output. '''
+        if self.sampler is not None:
+            self.stop.set()
+            self.sampler.join()
+            self.sampler = None
+            path = f'{self.output_base}.profile.collapsed'
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common()))
+            Log.info(f'Saved {sum(self.stacks.values())} profile samples to {path}')
+        elif self.mode == 'cprofile' and self.profiled:
+            stats = pstats.Stats(self.profile)
+            self.profiled = 0
+            if self.skipped:
+                Log.warn(f'{self.skipped} stage scopes ran whilst another thread was profiled and are not in the profile...')
+            path = f'{self.output_base}.profile.pstats'
+            stats.dump_stats(path)
+            stream = io.StringIO()
+            pstats.Stats(path, stream=stream).sort_stats('cumulative').print_stats(self.TOP_FUNCTIONS)
+            Log.info(f'Saved profile to {path}, top functions by cumulative time:\n{stream.getvalue().strip()}')
@@ -0,0 +1,88 @@
+''' Created: 18/10/2026 '''
+
+# External Dependencies
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from threading import Lock
+from typing import Dict, Optional
+import time
+
+# Internal Dependencies
+from utilities.settings import Settings
+
+class HostBucket:
+    ''' Purpose: Token bucket for one host. Tokens refill one per interval seconds up to
+        burst, and may go negative so that callers reserve future slots in order. '''
+    __slots__ = ('interval', 'tokens', 'updated', 'latency')
+    def __init__(self, interval: float, burst: int, now: float):
+        self.interval = interval
+        self.tokens = float(burst)
+        self.updated = now
+        self.latency: Optional[float] = None
+    def reserve(self, burst: int, now: float) -> float:
+        ''' Returns: Monotonic time at which the reserved request may be sent. '''
+        if self.interval <= 0:
+            return now
+        self.tokens = min(burst, self.tokens + (now - self.updated) / self.interval)
+        self.updated = now
+        self.tokens -= 1
+        return now if self.tokens >= 0 else now - self.tokens * self.interval
+
+class RateLimiter:
+    ''' Purpose: Shares adaptive per-domain politeness limits across all scraper workers.
+        Each domain starts at one request per RATE_LIMIT_DELAY seconds. Healthy responses
+        shorten the interval towards RATE_LIMIT_MIN_DELAY, whilst failures or responses much
+        slower than usual double it up to RATE_LIMIT_MAX_DELAY. '''
+    SLOW_FACTOR = 2.0
+    SPEEDUP = 0.9
+    BACKOFF = 2.0
+    LATENCY_WEIGHT = 0.2
+    def __init__(self, settings: Settings):
+        self.delay = settings.RATE_LIMIT_DELAY
+        self.min_delay = settings.RATE_LIMIT_MIN_DELAY
+        self.max_delay = settings.RATE_LIMIT_MAX_DELAY
+        self.burst = settings.RATE_LIMIT_BURST
+        self.lock = Lock()
+        self.buckets: Dict[str, HostBucket] = {}
+    @staticmethod
+    def get_domain(url: str) -> str:
+        ''' Returns: Network location of given URL, used as the rate limit key. '''
+        return urlparse(url).netloc
+    def get_bucket(self, domain: str, now: float) -> HostBucket:
+        ''' Returns: Token bucket of domain, created on first use. Caller must hold the lock. '''
+        if domain not in self.buckets:
+            self.buckets[domain] = HostBucket(self.delay, self.burst, now)
+        return self.buckets[domain]
+    def wait(self, url: str) -> None:
+        ''' Purpose: Blocks until the domain of url may be requested again. Tokens are
+            reserved under lock so concurrent workers queue up behind each other rather
+            than all firing once the interval has elapsed. '''
+        domain = self.get_domain(url)
+        with self.lock:
+            now = time.monotonic()
+            slot = self.get_bucket(domain, now).reserve(self.burst, now)
+        if slot > now:
+            time.sleep(slot - now)
+    def record(self, url: str, seconds: float, failed: bool = False) -> None:
+        ''' Purpose: Adapts the domain interval given how long a request to url took. '''
+        domain = self.get_domain(url)
+        with self.lock:
+            bucket = self.get_bucket(domain, time.monotonic())
+            slow = bucket.latency is not None and seconds > bucket.latency * self.SLOW_FACTOR
+            if failed or slow:
+                bucket.interval = min(self.max_delay, bucket.interval * self.BACKOFF)
+            else:
+                bucket.interval = max(self.min_delay, bucket.interval * self.SPEEDUP)
+            if not failed:
+                bucket.latency = seconds if bucket.latency is None else \
+                    bucket.latency + (seconds - bucket.latency) * self.LATENCY_WEIGHT
+    @contextmanager
+    def track(self, url: str):
+        ''' Purpose: Times the wrapped request to url and records it, as failed if it raises. '''
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.record(url, time.monotonic() - start, failed=True)
+            raise
+        self.record(url, time.monotonic() - start)
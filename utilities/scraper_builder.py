@@ -2,35 +2,47 @@
 
 # External Dependencies
 import importlib
-from scrapers.BaseScraper import BaseValidators, BaseParsers, BaseNavigators
+from scrapers import discover_scrapers
+from scrapers.BaseScraper import BaseValidators, BaseParsers, BaseNavigators, BaseFetchers
+from typing import Optional
 
 # Internal Dependencies
 from utilities.custom_exceptions import ScraperExceptions as SE
 
 class Scraper:
     ''' Purpose: Resulting expected class returned by ScraperBuilder.build(module_name) for use. '''
-    def __init__(self, validators: BaseValidators, parsers: BaseParsers, navigators: BaseNavigators):
+    def __init__(self, validators: BaseValidators, parsers: BaseParsers, navigators: BaseNavigators, fetchers: Optional[BaseFetchers] = None, name: Optional[str] = None):
         self.validators = validators
         self.parsers = parsers
         self.navigators = navigators
+        self.fetchers = fetchers
+        self.name = name
 
 class ScraperBuilder:
     @staticmethod
     def build(module_name: str) -> Scraper:
         ''' Returns: Constructed instance of Scraper with the module_name Validators, Parsers, and Navigators.
-            Builds selected scraper, which inherits additional logic from BaseScraper. '''
+            Builds selected scraper, which inherits additional logic from BaseScraper. Only the
+            selected scraper module is imported, found through the lazy scrapers registry. '''
+        package, _, scraper_name = module_name.rpartition('.')
+        if package == 'scrapers' and scraper_name not in discover_scrapers():
+            raise SE.InvalidConfigFile(f'Config "scraper":{module_name} is not a valid scraper...')
         try:
             module = importlib.import_module(module_name)
         except ImportError:
             raise SE.InvalidConfigFile(f'Config "scraper":{module_name} is not a valid scraper...')
         required_classes = ['Validators', 'Parsers', 'Navigators']
+        optional_classes = ['Fetchers']
         instances = {}
         try:
-            for attr_name in required_classes:
+            for attr_name in required_classes + optional_classes:
                 if not hasattr(module, attr_name):
+                    if attr_name in optional_classes:
+                        instances[attr_name] = None
+                        continue
                     raise SE.BadScraper(f'Module {module_name} does not contain required scraper class {attr_name}.')
                 class_ref = getattr(module, attr_name)
                 instances[attr_name] = class_ref()
         except TypeError as e:
             raise SE.BadScraper(e)
-        return Scraper(instances['Validators'], instances['Parsers'], instances['Navigators'])
+        return Scraper(instances['Validators'], instances['Parsers'], instances['Navigators'], instances['Fetchers'], module_name.rsplit('.', 1)[-1])
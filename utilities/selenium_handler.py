@@ -1,24 +1,191 @@
 ''' Created: 12/09/2023 '''
 
 # External Dependencies
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import TimeoutException
-from requests.exceptions import ChunkedEncodingError
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from threading import Condition, Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+import asyncio
+import json
+import os
+import time
 
 # Internal Dependencies
 from utilities.logger_formats import Log
+from utilities.metrics import Metrics
+from utilities.rate_limiter import RateLimiter
 from utilities.settings import Settings
 
+# Chrome switches turning off features a scraping session never uses.
+LEAN_ARGUMENTS = ['--blink-settings=imagesEnabled=false', '--disable-extensions', '--disable-background-networking',
+                  '--disable-component-update', '--disable-default-apps', '--disable-sync', '--mute-audio', '--no-first-run']
+# Chrome profile preferences blocking images, notifications, and popups outright.
+LEAN_PREFS = {'profile.managed_default_content_settings.images': 2,
+              'profile.default_content_setting_values.notifications': 2,
+              'profile.default_content_setting_values.popups': 2}
+# Request URL wildcards blocked over CDP in lean sessions, alongside BLOCKED_URL_PATTERNS.
+LEAN_BLOCKED_URLS = ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*',
+                     '*.woff*', '*.ttf*', '*.otf*', '*.eot*', '*.mp4*', '*.webm*', '*.mp3*']
+
+# Chrome switches keeping background tabs at full speed, for sessions driving TABS_PER_BROWSER tabs.
+TAB_ARGUMENTS = ['--disable-background-timer-throttling', '--disable-backgrounding-occluded-windows',
+                 '--disable-renderer-backgrounding']
+
+# Browser script returning true once the document marked by BrowserTab.get has been replaced
+# by a fully loaded one.
+TAB_LOADED_SCRIPT = '''
+return window.__tabLoading === undefined && document.readyState === 'complete';
+'''
+
+# Browser script returning bytes transferred since it last ran, for the document and its
+# resources, and the URLs of referenced images, media, scripts, and icons the page has not
+# loaded, each reported once per document.
+PAGE_BYTES_SCRIPT = '''
+let transferred = 0;
+if (!window.__pageBytesCounted) {
+    window.__pageBytesCounted = true;
+    window.__pageBytesLoaded = new Set();
+    window.__pageBytesSkipped = new Set();
+    performance.setResourceTimingBufferSize(2000);
+    for (const entry of performance.getEntriesByType('navigation')) transferred += entry.transferSize;
+}
+for (const entry of performance.getEntriesByType('resource')) {
+    transferred += entry.transferSize || entry.encodedBodySize;
+    window.__pageBytesLoaded.add(entry.name);
+}
+performance.clearResourceTimings();
+const skipped = [];
+for (const element of document.querySelectorAll('img, video, audio, source, script[src], link[rel~="icon"]')) {
+    const url = element.currentSrc || element.src || element.href;
+    if (!url || !url.startsWith('http') || window.__pageBytesLoaded.has(url) || window.__pageBytesSkipped.has(url)) continue;
+    window.__pageBytesSkipped.add(url);
+    skipped.push(url);
+}
+return {transferred: transferred, skipped: skipped};
+'''
+
+def read_page_bytes(driver: 'WebDriver') -> Tuple[int, List[str]]:
+    ''' Returns: Bytes the browser transferred loading the current page since last measured,
+        and URLs of resources the page references but did not load. Cross-origin resources
+        without a Timing-Allow-Origin header count as zero. '''
+    result = driver.execute_script(PAGE_BYTES_SCRIPT) or {}
+    return int(result.get('transferred') or 0), list(result.get('skipped') or [])
+
+class SkippedBytesEstimator:
+    ''' Purpose: Estimates the bytes lean browsing sessions saved by not loading skipped
+        resources, from the Content-Length of one HEAD request per URL. Requests run in the
+        background on HTTP_HOST_CONCURRENCY threads, so never more to one host, each waiting
+        its turn on the run RateLimiter. Sizes of the last CACHE_SIZE URLs are cached so
+        each is requested once, and every estimate is added to the page_bytes_saved counter
+        of its entry. Requests still queued when the run closes are dropped. '''
+    CACHE_SIZE = 4096
+    HEAD_TIMEOUT = 5
+    def __init__(self, limiter: RateLimiter, metrics: Metrics, settings: Settings):
+        self.limiter = limiter
+        self.metrics = metrics
+        self.executor = ThreadPoolExecutor(max_workers=settings.HTTP_HOST_CONCURRENCY)
+        self.lock = Lock()
+        self.sizes: OrderedDict[str, int] = OrderedDict()
+        self.queued: Set[str] = set()
+        self.submitted = 0
+        self.estimated = 0
+        self.saved_bytes = 0
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def submit(self, entry_name: str, urls: List[str]) -> None:
+        ''' Purpose: Queues an estimate of each of urls skipped by a page of entry_name. '''
+        for url in urls:
+            with self.lock:
+                if url in self.sizes:
+                    self.sizes.move_to_end(url)
+                    size = self.sizes[url]
+                elif url in self.queued:
+                    continue
+                else:
+                    self.queued.add(url)
+                    self.submitted += 1
+                    self.executor.submit(self.estimate, entry_name, url)
+                    continue
+            self.add(entry_name, size)
+    def estimate(self, entry_name: str, url: str) -> None:
+        ''' Purpose: Requests the Content-Length of url, caching it and counting it for
+            entry_name. URLs that fail or give no length count as zero. '''
+        # Only imported when skipped bytes are estimated
+        from urllib.request import Request, urlopen
+        self.limiter.wait(url)
+        try:
+            with self.limiter.track(url), urlopen(Request(url, method='HEAD'), timeout=self.HEAD_TIMEOUT) as response:
+                size = int(response.headers.get('Content-Length') or 0)
+        except (OSError, ValueError):
+            size = 0
+        with self.lock:
+            self.queued.discard(url)
+            self.sizes[url] = size
+            if len(self.sizes) > self.CACHE_SIZE:
+                self.sizes.popitem(last=False)
+            self.estimated += 1
+        self.add(entry_name, size)
+    def add(self, entry_name: str, size: int) -> None:
+        ''' Purpose: Counts size bytes as saved by a page of entry_name. '''
+        with self.lock:
+            self.saved_bytes += size
+        self.metrics.count('page_bytes_saved', entry_name, size)
+    def close(self) -> None:
+        ''' Purpose: Drops queued requests, waits for those in flight, and logs the estimate. '''
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.submitted:
+            Log.info(f'Lean browsing skipped resources of about {self.saved_bytes / 1024:.0f} KiB, '
+                     f'estimated from {self.estimated} of {self.submitted} skipped URLs')
+
 class BrowserManager:
+    # Parallel workers share one driver install, so resolve it one at a time.
+    install_lock = Lock()
+    # Driver path resolved this process, and the file caching it per Chrome version.
+    driver_path: Optional[str] = None
+    driver_cache_path = 'driver_cache.json'
     def __init__(self, language: str, settings: Settings):
         self.header = settings.SELENIUM_HEADER
         self.logging = settings.SELENIUM_LOGGING
         self.language = language
-    def create_browser(self) -> WebDriver:
-        ''' Returns: Created Selenium Chrome browser session. '''
+        self.lean = settings.LEAN_BROWSING
+        self.blocked_urls = settings.BLOCKED_URL_PATTERNS
+        self.tabs = settings.TABS_PER_BROWSER
+    @classmethod
+    def resolve_driver_path(cls) -> str:
+        ''' Returns: Path of a chromedriver matching installed Chrome. The path installed for
+            the local Chrome version is cached to file, so ChromeDriverManager and its network
+            version lookup only run when Chrome updates or the driver is missing. '''
+        from webdriver_manager.chrome import ChromeDriverManager
+        with cls.install_lock:
+            if cls.driver_path is not None and os.path.exists(cls.driver_path):
+                return cls.driver_path
+            manager = ChromeDriverManager()
+            browser_version = manager.driver.get_browser_version_from_os()
+            cache = {}
+            if os.path.exists(cls.driver_cache_path):
+                with open(cls.driver_cache_path, 'r', encoding='utf-8') as file:
+                    cache = json.load(file)
+            cached_path = cache.get(str(browser_version))
+            if cached_path is not None and os.path.exists(cached_path):
+                cls.driver_path = cached_path
+                return cached_path
+            Log.info(f'Resolving chromedriver for Chrome {browser_version}...')
+            cls.driver_path = manager.install()
+            cache[str(browser_version)] = cls.driver_path
+            with open(cls.driver_cache_path, 'w', encoding='utf-8') as file:
+                json.dump(cache, file, indent=2)
+            return cls.driver_path
+    def create_browser(self) -> 'WebDriver':
+        ''' Returns: Created Selenium Chrome browser session. Selenium is imported here, so
+            runs that never start a browser never pay for importing it. '''
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from requests.exceptions import ChunkedEncodingError
         options = webdriver.ChromeOptions()
         options.add_argument(f'--lang={self.language}')
         if not self.header:
@@ -27,10 +194,25 @@ class BrowserManager:
         if not self.logging:
             Log.info('Disabled Selenium driver logging...')
             options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        if self.lean:
+            Log.info('Running Selenium driver with lean browsing...')
+            for argument in LEAN_ARGUMENTS:
+                options.add_argument(argument)
+            options.add_experimental_option('prefs', LEAN_PREFS)
+        if self.tabs > 1:
+            Log.info(f'Running Selenium driver with {self.tabs} tabs...')
+            for argument in TAB_ARGUMENTS:
+                options.add_argument(argument)
+            # Tabs await page loads themselves, so a loading tab never blocks the others
+            options.page_load_strategy = 'none'
         try:
             driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()), 
+                service=Service(self.resolve_driver_path()), 
                 options=options)
+            blocked_urls = (LEAN_BLOCKED_URLS if self.lean else []) + self.blocked_urls
+            if blocked_urls:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
             return driver
         except (ChunkedEncodingError, TimeoutException) as e:
             raise ConnectionError(f'Failed due to {type(e).__name__}: check internet and try again.')
@@ -43,3 +225,235 @@ class BrowserManager:
         else:
             Log.alert('Error occurred, ending Selenium driver session...')
         self.driver.quit()
+
+class BrowserSession:
+    ''' Purpose: Live browser driver with a count of pages loaded since it started. '''
+    __slots__ = ('driver', 'language', 'pages')
+    def __init__(self, driver: 'WebDriver', language: str):
+        self.driver = driver
+        self.language = language
+        self.pages = 0
+    def is_healthy(self) -> bool:
+        ''' Returns: Boolean True if the browser still responds to commands. '''
+        try:
+            return self.driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+    def quit(self) -> None:
+        ''' Purpose: Ends the browser, ignoring one that has already crashed. '''
+        try:
+            self.driver.quit()
+        except Exception as e:
+            Log.warn(f'Selenium driver failed to quit cleanly: {type(e).__name__}')
+
+class BrowserPool:
+    ''' Purpose: Long lived pool of up to BROWSER_POOL_SIZE idle browser sessions per language,
+        shared by workers and by consecutive scrape runs so each avoids a cold Chrome start.
+        Sessions are launched ahead of use by prewarm, health checked on checkout, and quit
+        rather than returned once they have loaded BROWSER_RECYCLE_PAGES pages. '''
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.size = settings.BROWSER_POOL_SIZE
+        self.recycle_pages = settings.BROWSER_RECYCLE_PAGES
+        self.condition = Condition()
+        self.idle: Dict[str, List[BrowserSession]] = {}
+        self.warming: Dict[str, int] = {}
+        self.launcher = ThreadPoolExecutor(max_workers=max(self.size, 1))
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close()
+    def prewarm(self, language: str) -> None:
+        ''' Purpose: Launches sessions for language in the background to fill the pool. '''
+        with self.condition:
+            missing = self.size - len(self.idle.get(language, [])) - self.warming.get(language, 0)
+            self.warming[language] = self.warming.get(language, 0) + max(missing, 0)
+        for _ in range(missing):
+            self.launcher.submit(self.launch, language)
+    def launch(self, language: str) -> None:
+        ''' Purpose: Starts one warm session for language and adds it to the idle pool. '''
+        session = None
+        try:
+            session = BrowserSession(BrowserManager(language, self.settings).create_browser(), language)
+        except Exception as e:
+            Log.warn(f'Failed to prewarm browser session: {type(e).__name__}')
+        with self.condition:
+            self.warming[language] -= 1
+            if session is not None:
+                self.idle.setdefault(language, []).append(session)
+            self.condition.notify_all()
+    def checkout(self, manager: BrowserManager) -> BrowserSession:
+        ''' Returns: Healthy session for the manager language, waiting on one still warming
+            before starting a new one. '''
+        while True:
+            with self.condition:
+                while not self.idle.get(manager.language) and self.warming.get(manager.language, 0):
+                    self.condition.wait()
+                session = self.idle[manager.language].pop() if self.idle.get(manager.language) else None
+            if session is None:
+                return BrowserSession(manager.create_browser(), manager.language)
+            if session.is_healthy():
+                return session
+            Log.warn('Discarding unresponsive pooled browser session...')
+            session.quit()
+    def checkin(self, session: BrowserSession, failed: bool = False) -> None:
+        ''' Purpose: Returns a session to the pool cleared of page state, or quits it if it
+            failed, is due for recycling, or the pool is full. '''
+        recycle = self.recycle_pages and session.pages >= self.recycle_pages
+        if not failed and not recycle:
+            try:
+                session.driver.delete_all_cookies()
+                session.driver.get('about:blank')
+            except Exception:
+                failed = True
+        with self.condition:
+            idle = self.idle.setdefault(session.language, [])
+            if not failed and not recycle and len(idle) < self.size:
+                idle.append(session)
+                self.condition.notify_all()
+                return
+        session.quit()
+    def close(self) -> None:
+        ''' Purpose: Waits for warming sessions, then quits every idle session. '''
+        self.launcher.shutdown(wait=True)
+        with self.condition:
+            sessions = [session for idle in self.idle.values() for session in idle]
+            self.idle = {}
+        if sessions:
+            Log.info(f'Ending {len(sessions)} pooled Selenium driver sessions...')
+        for session in sessions:
+            session.quit()
+
+class LazyBrowser:
+    ''' Purpose: Defers starting a browser session until a driver is first needed, so runs
+        where every entry is fetched over HTTP never start Chrome. Sessions come from the
+        given BrowserPool if any, and are recycled after BROWSER_RECYCLE_PAGES pages. '''
+    def __init__(self, language: str, settings: Settings, pool: Optional[BrowserPool] = None):
+        self.manager = BrowserManager(language=language, settings=settings)
+        self.recycle_pages = settings.BROWSER_RECYCLE_PAGES
+        self.pool = pool
+        self.session: Optional[BrowserSession] = None
+    def get(self) -> 'WebDriver':
+        ''' Returns: Selenium Chrome browser session, started on first call. '''
+        if self.session is None:
+            if self.pool is not None:
+                self.session = self.pool.checkout(self.manager)
+            else:
+                self.session = BrowserSession(self.manager.create_browser(), self.manager.language)
+        return self.session.driver
+    def add_pages(self, pages: int) -> None:
+        ''' Purpose: Counts pages loaded by the current session, ending it once it reaches
+            BROWSER_RECYCLE_PAGES so Chrome memory growth stays bounded. The next call to
+            get starts a fresh session. '''
+        if self.session is None:
+            return
+        self.session.pages += pages
+        if self.recycle_pages and self.session.pages >= self.recycle_pages:
+            Log.info(f'Recycling Selenium driver session after {self.session.pages} pages...')
+            self.release()
+    def release(self, failed: bool = False) -> None:
+        ''' Purpose: Returns the current session to the pool, or quits it without a pool. '''
+        if self.pool is not None:
+            self.pool.checkin(self.session, failed)
+        else:
+            self.session.quit()
+        self.session = None
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, *_):
+        if self.session is None:
+            return
+        failed = exc_type is not None and exc_type is not KeyboardInterrupt
+        if failed:
+            Log.alert('Error occurred, ending Selenium driver session...')
+        elif self.pool is None:
+            Log.info('Ending Selenium driver session...')
+        self.release(failed)
+
+class BrowserTab:
+    ''' Purpose: One tab of a TabbedBrowser. Each driver command of the tab runs in a worker
+        thread whilst holding the browser lock, so the tabs of one browser take turns per
+        command rather than per page, and waits poll between commands instead of blocking. '''
+    POLL_SECONDS = 0.1
+    __slots__ = ('browser', 'handle')
+    def __init__(self, browser: 'TabbedBrowser', handle: str):
+        self.browser = browser
+        self.handle = handle
+    async def run(self, func: Callable, *args) -> Any:
+        ''' Returns: Result of func(driver, *args), run with the driver switched to this tab. '''
+        async with self.browser.lock:
+            return await asyncio.to_thread(self.browser.call, self.handle, func, *args)
+    async def execute(self, script: str, *args) -> Any:
+        ''' Returns: Result of a browser script run in this tab. '''
+        return await self.run(lambda driver: driver.execute_script(script, *args))
+    async def poll(self, script: str, timeout: float, message: str, *args) -> None:
+        ''' Purpose: Runs a browser script every POLL_SECONDS until it returns true, raising
+            TimeoutException with message after timeout seconds. Scripts failing whilst a
+            new document replaces the old one count as false. '''
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if await self.execute(script, *args):
+                    return
+            except JavascriptException:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
+            await asyncio.sleep(self.POLL_SECONDS)
+    async def get(self, url: str, timeout: float = 40) -> None:
+        ''' Purpose: Navigates this tab to url and waits for the new document to load. '''
+        await self.execute('window.__tabLoading = true;')
+        await self.run(lambda driver: driver.get(url))
+        await self.poll(TAB_LOADED_SCRIPT, timeout, f'{url} did not load within {timeout} seconds.')
+
+class TabbedBrowser:
+    ''' Purpose: Shares the session of a LazyBrowser between tabs driven from asyncio. The
+        session starts when the first tab opens, the driver is switched to a tab's window
+        before each of its commands, and on exit every tab but the first is closed so the
+        session can be returned to a BrowserPool. '''
+    def __init__(self, browser: LazyBrowser):
+        self.browser = browser
+        self.lock = asyncio.Lock()
+        self.handles: List[str] = []
+        self.current: Optional[str] = None
+    def __enter__(self):
+        return self
+    def __exit__(self, *_):
+        self.close_tabs()
+    def call(self, handle: str, func: Callable, *args) -> Any:
+        ''' Returns: Result of func(driver, *args) after switching the driver to handle. '''
+        driver = self.browser.get()
+        if handle != self.current:
+            driver.switch_to.window(handle)
+            self.current = handle
+        return func(driver, *args)
+    def open_handle(self) -> str:
+        ''' Returns: Window handle of a new tab, being the session's own window first. '''
+        driver = self.browser.get()
+        if self.handles:
+            driver.switch_to.new_window('tab')
+        self.current = driver.current_window_handle
+        self.handles.append(self.current)
+        return self.current
+    async def open_tab(self) -> BrowserTab:
+        ''' Returns: New BrowserTab, starting the browser session if needed. '''
+        async with self.lock:
+            return BrowserTab(self, await asyncio.to_thread(self.open_handle))
+    def add_pages(self, pages: int) -> None:
+        ''' Purpose: Counts pages loaded by the session. Tabbed sessions are not recycled part
+            way through a run, so are recycled by the BrowserPool once it ends. '''
+        if self.browser.session is not None:
+            self.browser.session.pages += pages
+    def close_tabs(self) -> None:
+        ''' Purpose: Closes every tab but the first, leaving the driver on the first tab. '''
+        if self.browser.session is None or len(self.handles) < 2:
+            return
+        driver = self.browser.session.driver
+        try:
+            for handle in self.handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(self.handles[0])
+        except Exception as e:
+            Log.warn(f'Failed to close browser tabs: {type(e).__name__}')
+        self.handles, self.current = self.handles[:1], self.handles[0]
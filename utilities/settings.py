@@ -5,6 +5,7 @@
 # External Dependencies
 import os
 import yaml
+import importlib.util
 
 # Internal Dependencies
 from utilities.logger_formats import Log
@@ -22,14 +23,78 @@ class Settings:
         self.GENERATED_OUTPUT_NAME_BASE = 'result'  # Type: str, Default: "result"
         # How many seconds to sleep to minimize website strain.
         self.RATE_LIMIT_DELAY = 2  # Type: int, Default: 2
+        # Fewest seconds between requests to a healthy website, the delay adapts down to this.
+        self.RATE_LIMIT_MIN_DELAY = 1.0  # Type: float, Default: 1.0
+        # Most seconds between requests to a slow or failing website, the delay backs off up to this.
+        self.RATE_LIMIT_MAX_DELAY = 30  # Type: int, Default: 30
+        # How many requests to one website may be sent back to back before delays apply.
+        self.RATE_LIMIT_BURST = 1  # Type: int, Default: 1
+        # How many browser sessions scrape config entries in parallel.
+        self.MAX_WORKERS = 1  # Type: int, Default: 1
+        # How many tabs each browser session scrapes config entries in concurrently.
+        self.TABS_PER_BROWSER = 1  # Type: int, Default: 1
+        # Page fetch backend, "http" fetches pages without a browser where the scraper supports it.
+        self.FETCH_MODE = 'browser'  # Type: str, Default: "browser"
+        # How many HTTP requests may be in flight to one website at a time.
+        self.HTTP_HOST_CONCURRENCY = 2  # Type: int, Default: 2
+        # How many seconds to wait for a HTTP response before failing.
+        self.HTTP_TIMEOUT = 30  # Type: int, Default: 30
+        # How many workers parse pages whilst the browser navigates, 0 parses inline.
+        self.PARSE_WORKERS = 0  # Type: int, Default: 0
+        # If true, parse workers are processes instead of threads.
+        self.PARSE_PROCESSES = False  # Type: bool, Default: False
+        # How many warm browser sessions are kept ready for reuse, 0 starts one per run.
+        self.BROWSER_POOL_SIZE = 0  # Type: int, Default: 0
+        # How many pages a browser session loads before it is restarted, 0 never restarts.
+        self.BROWSER_RECYCLE_PAGES = 500  # Type: int, Default: 500
+        # If true, browser sessions skip images, fonts, media, and unneeded Chrome features.
+        self.LEAN_BROWSING = False  # Type: bool, Default: False
+        # URL wildcards browser sessions never request, such as ads and analytics.
+        self.BLOCKED_URL_PATTERNS = ['*doubleclick.net*', '*google-analytics.com*', '*googletagmanager.com*',
+                                     '*googlesyndication.com*', '*facebook.net*', '*hotjar.com*', '*nr-data.net*']  # Type: list, Default: [...]
+        # If true, logs the bytes each browser session transfers per page, and with LEAN_BROWSING an estimate of the bytes it skipped.
+        self.REPORT_PAGE_BYTES = False  # Type: bool, Default: False
+        # If true, records per stage latencies and counters, saved beside the output.
+        self.COLLECT_METRICS = False  # Type: bool, Default: False
+        # Run metrics file format, one of "jsonl" or "prometheus".
+        self.METRICS_FORMAT = 'jsonl'  # Type: str, Default: "jsonl"
+        # Profiler run over PROFILE_STAGES, one of "off", "cprofile", or "sampling".
+        self.PROFILER = 'off'  # Type: str, Default: "off"
+        # Scrape stages the profiler covers, any of navigation, wait_for_page, page_source, fetch, parse, and write.
+        self.PROFILE_STAGES = ['navigation', 'wait_for_page', 'page_source', 'fetch', 'parse', 'write']  # Type: list, Default: [...]
         # How many seconds to wait before webdriver timeout.
         self.SELENIUM_LOGGING = False  # Type: bool, Default: False
         # If true, sets selenium browser to not be in headless mode.
         self.SELENIUM_HEADER = False  # Type: bool, Default: False
         # If true, dumps all raw data blocks to output textfile.
         self.DUMP_RAW_DATA = True  # Type: bool, Default: True
+        # If true, archives the compressed page source of every fetched page for offline re-parsing.
+        self.ARCHIVE_PAGES = False  # Type: bool, Default: False
+        # Page archive compression, one of "gzip" or "zstd".
+        self.ARCHIVE_COMPRESSION = 'gzip'  # Type: str, Default: "gzip"
+        # If true, entries stop paging at the first review a previous run saved.
+        self.INCREMENTAL_SCRAPE = False  # Type: bool, Default: False
+        # Output row format, one of "csv", "jsonl", or "parquet".
+        self.OUTPUT_FORMAT = 'csv'  # Type: str, Default: "csv"
+        # How many rows are written to output before flushing to disk.
+        self.OUTPUT_FLUSH_ROWS = 100  # Type: int, Default: 100
         # If true, on any suspect bad data issue, code will exit.
         self.DATA_STRICT = True # Type: bool, Default: True
+        # Page HTML parser backend, one of "stream", "lxml", or "soup".
+        self.PAGE_PARSER = 'soup'  # Type: str, Default: "soup"
+        # Where page texts are extracted, one of "off" (page source), "on" (in the browser), or "verify" (both, compared).
+        self.BROWSER_EXTRACTION = 'off'  # Type: str, Default: "off"
+
+        # Job queue backend shared by queue workers, currently only "sqlite".
+        self.JOB_QUEUE_BACKEND = 'sqlite'  # Type: str, Default: "sqlite"
+        # Location of the job queue file, must be on storage shared by every worker node.
+        self.JOB_QUEUE_PATH = 'output_files/job_queue.sqlite'  # Type: str, Default: "output_files/job_queue.sqlite"
+        # How many seconds a queue worker holds an entry without a heartbeat before others retake it.
+        self.JOB_LEASE_SECONDS = 300  # Type: int, Default: 300
+        # How many times a queued entry is attempted before it is marked failed.
+        self.JOB_MAX_ATTEMPTS = 3  # Type: int, Default: 3
+        # How many seconds an idle queue worker waits before checking for entries again.
+        self.JOB_POLL_SECONDS = 30  # Type: int, Default: 30
 
         # Warning, avoid modifying the below options:
         # Location of scraper configuration JSON file directory.
@@ -39,6 +104,7 @@ class Settings:
 
         # Load settings from settings.yml if it exists, or create it with default settings
         self.load_and_override_settings()
+        self.validate_settings()
 
     def get_default_settings(self):
         return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
@@ -52,14 +118,85 @@ class Settings:
                 # Override default settings with any custom settings
                 for key, value in yaml_content.items():
                     if hasattr(self, key):
-                        # Ensure the value type in YAML matches the type of the default setting
-                        default_value = getattr(self, key)
-                        if isinstance(value, type(default_value)):
-                            setattr(self, key, value)
-                        else:
-                            raise SE.BadSettings(f"Type mismatch for setting {key}. Expected {type(default_value)}, but got {type(value)}.")
+                        self.set_setting(key, value)
         else:
             # If settings.yml doesn't exist, create it with default values
             Log.info('Creating new local settings.yml')
             with open(settings_yml_path, 'w') as file:
                 yaml.dump(default_settings, file, default_flow_style=False)
+
+    def set_setting(self, key: str, value):
+        # Ensure the value type matches the type of the default setting
+        default_value = getattr(self, key)
+        if isinstance(default_value, float) and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        if not isinstance(value, type(default_value)):
+            raise SE.BadSettings(f"Type mismatch for setting {key}. Expected {type(default_value)}, but got {type(value)}.")
+        setattr(self, key, value)
+
+    def apply_overrides(self, overrides: list[str]):
+        ''' Purpose: Overrides settings from command line KEY=VALUE strings. Values are parsed
+            as YAML and type checked like settings.yml, then all settings are revalidated. '''
+        for override in overrides:
+            key, separator, raw_value = override.partition('=')
+            key = key.strip()
+            if not separator or not key:
+                raise SE.BadSettings(f"Setting override {override} must be given as KEY=VALUE.")
+            if key.startswith('_') or not hasattr(self, key):
+                raise SE.BadSettings(f"Setting override {key} is not a known setting.")
+            try:
+                value = yaml.safe_load(raw_value)
+            except yaml.YAMLError:
+                raise SE.BadSettings(f"Setting override {key} has an unparsable value {raw_value}.")
+            self.set_setting(key, value)
+        self.validate_settings()
+
+    def validate_settings(self):
+        if not 0 <= self.RATE_LIMIT_MIN_DELAY <= self.RATE_LIMIT_DELAY <= self.RATE_LIMIT_MAX_DELAY:
+            raise SE.BadSettings(f"Settings must satisfy 0 <= RATE_LIMIT_MIN_DELAY <= RATE_LIMIT_DELAY <= RATE_LIMIT_MAX_DELAY, but got {self.RATE_LIMIT_MIN_DELAY}, {self.RATE_LIMIT_DELAY}, {self.RATE_LIMIT_MAX_DELAY}.")
+        if self.RATE_LIMIT_BURST < 1:
+            raise SE.BadSettings(f"Setting RATE_LIMIT_BURST must be at least 1, but got {self.RATE_LIMIT_BURST}.")
+        if self.MAX_WORKERS < 1:
+            raise SE.BadSettings(f"Setting MAX_WORKERS must be at least 1, but got {self.MAX_WORKERS}.")
+        if self.TABS_PER_BROWSER < 1:
+            raise SE.BadSettings(f"Setting TABS_PER_BROWSER must be at least 1, but got {self.TABS_PER_BROWSER}.")
+        if self.OUTPUT_FLUSH_ROWS < 1:
+            raise SE.BadSettings(f"Setting OUTPUT_FLUSH_ROWS must be at least 1, but got {self.OUTPUT_FLUSH_ROWS}.")
+        if self.OUTPUT_FORMAT not in ('csv', 'jsonl', 'parquet'):
+            raise SE.BadSettings(f"Setting OUTPUT_FORMAT must be csv, jsonl, or parquet, but got {self.OUTPUT_FORMAT}.")
+        if self.OUTPUT_FORMAT == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+            raise SE.BadSettings("Setting OUTPUT_FORMAT is parquet, but pyarrow is not installed. Run pip install pyarrow.")
+        if self.METRICS_FORMAT not in ('jsonl', 'prometheus'):
+            raise SE.BadSettings(f"Setting METRICS_FORMAT must be jsonl or prometheus, but got {self.METRICS_FORMAT}.")
+        if self.PROFILER not in ('off', 'cprofile', 'sampling'):
+            raise SE.BadSettings(f"Setting PROFILER must be off, cprofile, or sampling, but got {self.PROFILER}.")
+        if self.PROFILER == 'cprofile' and self.MAX_WORKERS > 1:
+            raise SE.BadSettings(f"Setting PROFILER cprofile traces one thread at a time, so cannot profile {self.MAX_WORKERS} MAX_WORKERS. Use sampling, or set MAX_WORKERS to 1.")
+        if not set(self.PROFILE_STAGES) <= {'navigation', 'wait_for_page', 'page_source', 'fetch', 'parse', 'write'}:
+            raise SE.BadSettings(f"Setting PROFILE_STAGES must only list navigation, wait_for_page, page_source, fetch, parse, or write, but got {self.PROFILE_STAGES}.")
+        if self.ARCHIVE_COMPRESSION not in ('gzip', 'zstd'):
+            raise SE.BadSettings(f"Setting ARCHIVE_COMPRESSION must be gzip or zstd, but got {self.ARCHIVE_COMPRESSION}.")
+        if self.ARCHIVE_COMPRESSION == 'zstd' and importlib.util.find_spec('zstandard') is None:
+            raise SE.BadSettings("Setting ARCHIVE_COMPRESSION is zstd, but zstandard is not installed. Run pip install zstandard.")
+        if self.FETCH_MODE not in ('browser', 'http'):
+            raise SE.BadSettings(f"Setting FETCH_MODE must be browser or http, but got {self.FETCH_MODE}.")
+        if self.HTTP_HOST_CONCURRENCY < 1:
+            raise SE.BadSettings(f"Setting HTTP_HOST_CONCURRENCY must be at least 1, but got {self.HTTP_HOST_CONCURRENCY}.")
+        if self.PAGE_PARSER not in ('stream', 'lxml', 'soup'):
+            raise SE.BadSettings(f"Setting PAGE_PARSER must be stream, lxml, or soup, but got {self.PAGE_PARSER}.")
+        if self.PAGE_PARSER == 'lxml' and importlib.util.find_spec('lxml') is None:
+            raise SE.BadSettings("Setting PAGE_PARSER is lxml, but lxml is not installed. Run pip install lxml.")
+        if self.BROWSER_EXTRACTION not in ('off', 'on', 'verify'):
+            raise SE.BadSettings(f"Setting BROWSER_EXTRACTION must be off, on, or verify, but got {self.BROWSER_EXTRACTION}.")
+        if not all(isinstance(pattern, str) for pattern in self.BLOCKED_URL_PATTERNS):
+            raise SE.BadSettings(f"Setting BLOCKED_URL_PATTERNS must be a list of strings, but got {self.BLOCKED_URL_PATTERNS}.")
+        if self.JOB_QUEUE_BACKEND not in ('sqlite',):
+            raise SE.BadSettings(f"Setting JOB_QUEUE_BACKEND must be sqlite, but got {self.JOB_QUEUE_BACKEND}.")
+        if self.JOB_LEASE_SECONDS < 3 or self.JOB_MAX_ATTEMPTS < 1 or self.JOB_POLL_SECONDS < 1:
+            raise SE.BadSettings("Settings JOB_LEASE_SECONDS must be at least 3, JOB_MAX_ATTEMPTS and JOB_POLL_SECONDS at least 1.")
+        if self.BROWSER_POOL_SIZE < 0:
+            raise SE.BadSettings(f"Setting BROWSER_POOL_SIZE must not be negative, but got {self.BROWSER_POOL_SIZE}.")
+        if self.BROWSER_RECYCLE_PAGES < 0:
+            raise SE.BadSettings(f"Setting BROWSER_RECYCLE_PAGES must not be negative, but got {self.BROWSER_RECYCLE_PAGES}.")
+        if self.PARSE_WORKERS < 0:
+            raise SE.BadSettings(f"Setting PARSE_WORKERS must not be negative, but got {self.PARSE_WORKERS}.")
@@ -0,0 +1,119 @@
+''' Created: 18/10/2026 '''
+
+# Stores fast page text extractors driven by a scraper's declared text_tags.
+
+# External Dependencies
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Internal Dependencies
+from scrapers.BaseScraper import TextTag
+
+# Elements that never have a closing tag, so never hold text.
+VOID_ELEMENTS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                           'link', 'meta', 'param', 'source', 'track', 'wbr'])
+# Elements whose whitespace only texts are kept as is, like BeautifulSoup does.
+PRESERVE_WHITESPACE_ELEMENTS = frozenset(['pre', 'textarea'])
+# ASCII whitespace, as BeautifulSoup strips it when checking for whitespace only texts.
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+def collapse_whitespace(text: str) -> str:
+    ''' Returns: text, or one newline or space if it is only ASCII whitespace, as BeautifulSoup
+        reads texts outside pre and textarea elements. '''
+    if text.strip(ASCII_SPACES):
+        return text
+    return '\n' if '\n' in text else ' '
+
+def match_text_tag(text_tags: Sequence[TextTag], name: str, attrs: Dict[str, str]) -> Optional[TextTag]:
+    ''' Returns: First declared TextTag matching the element name and attrs, else None. '''
+    return next((text_tag for text_tag in text_tags if text_tag.matches(name, attrs)), None)
+
+class TagTextParser(HTMLParser):
+    ''' Purpose: Streaming tokenizer that collects declared text_tags texts in document
+        order without building a tree. Unclosed and misnested tags are resolved the same
+        way the BeautifulSoup html.parser builder does, by popping to the matching tag. '''
+    def __init__(self, text_tags: Sequence[TextTag]):
+        super().__init__(convert_charrefs=True)
+        self.text_tags = text_tags
+        self.tag_names = frozenset(text_tag.name for text_tag in text_tags)
+        self.texts: List[str] = []
+        self.parts: Dict[int, List[str]] = {}
+        self.stack: List[Tuple[str, Optional[int]]] = []
+    def handle_starttag(self, name: str, attrs: List[Tuple[str, Optional[str]]]):
+        collector = None
+        if name in self.tag_names:
+            attr_dict = {key: '' if value is None else value for key, value in attrs}
+            text_tag = match_text_tag(self.text_tags, name, attr_dict)
+            if text_tag is not None:
+                self.texts.append(attr_dict[text_tag.attr] if text_tag.attr else '')
+                if text_tag.attr is None:
+                    collector = len(self.texts) - 1
+                    self.parts[collector] = []
+        if name not in VOID_ELEMENTS:
+            self.stack.append((name, collector))
+    def handle_startendtag(self, name: str, attrs: List[Tuple[str, Optional[str]]]):
+        self.handle_starttag(name, attrs)
+        if name not in VOID_ELEMENTS:
+            self.handle_endtag(name)
+    def handle_endtag(self, name: str):
+        if not any(open_name == name for open_name, _ in self.stack):
+            return
+        while self.stack:
+            open_name, collector = self.stack.pop()
+            if collector is not None:
+                self.texts[collector] = ''.join(self.parts.pop(collector))
+            if open_name == name:
+                break
+    def handle_data(self, data: str):
+        if not self.parts:
+            return
+        if not any(name in PRESERVE_WHITESPACE_ELEMENTS for name, _ in self.stack):
+            data = collapse_whitespace(data)
+        for parts in self.parts.values():
+            parts.append(data)
+    def close(self):
+        ''' Purpose: Flushes buffered data and closes any elements left open. '''
+        super().close()
+        for collector, parts in self.parts.items():
+            self.texts[collector] = ''.join(parts)
+        self.parts = {}
+        self.stack = []
+
+def extract_text_stream(page_html: str, text_tags: Sequence[TextTag]) -> List[str]:
+    ''' Returns: Declared text_tags texts from page_html using the streaming tokenizer. '''
+    parser = TagTextParser(text_tags)
+    parser.feed(page_html)
+    parser.close()
+    return parser.texts
+
+def get_lxml_text(element, preserve: Optional[bool] = None) -> str:
+    ''' Returns: Text of an lxml element and its descendants, skipping comments, with
+        whitespace only texts collapsed outside pre and textarea elements. '''
+    if preserve is None:
+        preserve = any(ancestor.tag in PRESERVE_WHITESPACE_ELEMENTS for ancestor in element.iterancestors())
+    preserve = preserve or element.tag in PRESERVE_WHITESPACE_ELEMENTS
+    parts = [element.text if preserve else collapse_whitespace(element.text)] if element.text else []
+    for child in element:
+        # Comments and processing instructions have a function as their tag
+        if isinstance(child.tag, str):
+            parts.append(get_lxml_text(child, preserve))
+        if child.tail:
+            parts.append(child.tail if preserve else collapse_whitespace(child.tail))
+    return ''.join(parts)
+
+def extract_text_lxml(page_html: str, text_tags: Sequence[TextTag]) -> List[str]:
+    ''' Returns: Declared text_tags texts from page_html using the lxml C parser. '''
+    import lxml.html
+    root = lxml.html.fromstring(page_html)
+    names = list(dict.fromkeys(text_tag.name for text_tag in text_tags))
+    texts = []
+    for element in root.iter(*names):
+        text_tag = match_text_tag(text_tags, element.tag, element.attrib)
+        if text_tag is not None:
+            texts.append(element.get(text_tag.attr) if text_tag.attr else get_lxml_text(element))
+    return texts
+
+TEXT_EXTRACTORS = {
+    'stream': extract_text_stream,
+    'lxml': extract_text_lxml,
+}